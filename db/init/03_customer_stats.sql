@@ -0,0 +1,108 @@
+-- TS Portal - 고객사/담당 배정 통계 카운터
+-- 설명: /customers/stats, /assignments/stats를 테이블 크기와 무관하게 조회하기 위한 증분 카운터
+--       customer-service에서 USE_MATERIALIZED_STATS=true로 설정하면 사용
+-- 기존 DB 적용: psql -U tsportal -d tsportal -f db/init/03_customer_stats.sql
+
+BEGIN;
+
+-- 통계 카운터 테이블
+-- stat_key 예: customers:total, customers:status:Active,
+--             assignments:total, assignments:role:Primary, assignments:member:3
+CREATE TABLE IF NOT EXISTS customer_schema.stats_counters (
+    stat_key VARCHAR(100) PRIMARY KEY,
+    value BIGINT NOT NULL DEFAULT 0
+);
+
+-- 날짜 의존 통계용 인덱스 (만료 예정 고객사, 시작 전/종료된 배정)
+CREATE INDEX IF NOT EXISTS idx_customers_active_contract_end
+    ON customer_schema.customers(contract_end) WHERE status = 'Active';
+CREATE INDEX IF NOT EXISTS idx_assignments_assigned_date ON customer_schema.assignments(assigned_date);
+CREATE INDEX IF NOT EXISTS idx_assignments_end_date ON customer_schema.assignments(end_date);
+
+-- 카운터 증감 함수
+CREATE OR REPLACE FUNCTION customer_schema.bump_stat_counter(p_key TEXT, p_delta BIGINT)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO customer_schema.stats_counters (stat_key, value)
+    VALUES (p_key, p_delta)
+    ON CONFLICT (stat_key) DO UPDATE
+        SET value = customer_schema.stats_counters.value + EXCLUDED.value;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 고객사 변경 시 카운터 갱신
+CREATE OR REPLACE FUNCTION customer_schema.update_customer_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM customer_schema.bump_stat_counter('customers:total', 1);
+        PERFORM customer_schema.bump_stat_counter('customers:status:' || COALESCE(NEW.status, ''), 1);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM customer_schema.bump_stat_counter('customers:total', -1);
+        PERFORM customer_schema.bump_stat_counter('customers:status:' || COALESCE(OLD.status, ''), -1);
+    ELSIF OLD.status IS DISTINCT FROM NEW.status THEN
+        PERFORM customer_schema.bump_stat_counter('customers:status:' || COALESCE(OLD.status, ''), -1);
+        PERFORM customer_schema.bump_stat_counter('customers:status:' || COALESCE(NEW.status, ''), 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 담당 배정 변경 시 카운터 갱신
+CREATE OR REPLACE FUNCTION customer_schema.update_assignment_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF TG_OP = 'DELETE' THEN
+            PERFORM customer_schema.bump_stat_counter('assignments:total', -1);
+        END IF;
+        IF TG_OP = 'DELETE' OR OLD.role IS DISTINCT FROM NEW.role THEN
+            PERFORM customer_schema.bump_stat_counter('assignments:role:' || COALESCE(OLD.role, ''), -1);
+        END IF;
+        IF TG_OP = 'DELETE' OR OLD.member_id IS DISTINCT FROM NEW.member_id THEN
+            PERFORM customer_schema.bump_stat_counter('assignments:member:' || OLD.member_id, -1);
+        END IF;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF TG_OP = 'INSERT' THEN
+            PERFORM customer_schema.bump_stat_counter('assignments:total', 1);
+        END IF;
+        IF TG_OP = 'INSERT' OR OLD.role IS DISTINCT FROM NEW.role THEN
+            PERFORM customer_schema.bump_stat_counter('assignments:role:' || COALESCE(NEW.role, ''), 1);
+        END IF;
+        IF TG_OP = 'INSERT' OR OLD.member_id IS DISTINCT FROM NEW.member_id THEN
+            PERFORM customer_schema.bump_stat_counter('assignments:member:' || NEW.member_id, 1);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 초기 적재 중 쓰기 차단 (카운터와 원본 테이블 불일치 방지)
+LOCK TABLE customer_schema.customers, customer_schema.assignments IN SHARE ROW EXCLUSIVE MODE;
+
+DROP TRIGGER IF EXISTS customers_stats_counter ON customer_schema.customers;
+CREATE TRIGGER customers_stats_counter
+    AFTER INSERT OR DELETE OR UPDATE OF status ON customer_schema.customers
+    FOR EACH ROW EXECUTE FUNCTION customer_schema.update_customer_stats();
+
+DROP TRIGGER IF EXISTS assignments_stats_counter ON customer_schema.assignments;
+CREATE TRIGGER assignments_stats_counter
+    AFTER INSERT OR DELETE OR UPDATE OF role, member_id ON customer_schema.assignments
+    FOR EACH ROW EXECUTE FUNCTION customer_schema.update_assignment_stats();
+
+-- 현재 데이터 기준으로 카운터 재계산
+DELETE FROM customer_schema.stats_counters;
+
+INSERT INTO customer_schema.stats_counters (stat_key, value)
+SELECT 'customers:total', COUNT(*) FROM customer_schema.customers
+UNION ALL
+SELECT 'customers:status:' || COALESCE(status, ''), COUNT(*) FROM customer_schema.customers GROUP BY status
+UNION ALL
+SELECT 'assignments:total', COUNT(*) FROM customer_schema.assignments
+UNION ALL
+SELECT 'assignments:role:' || COALESCE(role, ''), COUNT(*) FROM customer_schema.assignments GROUP BY role
+UNION ALL
+SELECT 'assignments:member:' || member_id, COUNT(*) FROM customer_schema.assignments GROUP BY member_id;
+
+COMMIT;
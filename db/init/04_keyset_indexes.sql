@@ -0,0 +1,21 @@
+-- TS Portal - 목록 cursor 페이지네이션용 인덱스
+-- 설명: 목록 API의 정렬 키 (..., id)와 같은 순서의 복합 인덱스
+--       cursor 조건 (정렬 키) < (cursor 값)을 인덱스 범위 스캔으로 처리 (DESC 정렬은 역방향 스캔)
+-- 기존 DB 적용: psql -U tsportal -d tsportal -f db/init/04_keyset_indexes.sql
+
+-- 고객사 목록: company_name, id
+CREATE INDEX IF NOT EXISTS idx_customers_keyset ON customer_schema.customers(company_name, id);
+
+-- 담당 배정 목록: assigned_date DESC, id DESC
+CREATE INDEX IF NOT EXISTS idx_assignments_keyset ON customer_schema.assignments(assigned_date, id);
+
+-- 이벤트 목록: start_time DESC, id DESC (생성자 필터 포함)
+CREATE INDEX IF NOT EXISTS idx_events_keyset ON calendar_schema.events(start_time, id);
+CREATE INDEX IF NOT EXISTS idx_events_created_by_keyset ON calendar_schema.events(created_by, start_time, id);
+
+-- 공지사항 목록/검색: is_pinned DESC, created_at DESC, id DESC
+CREATE INDEX IF NOT EXISTS idx_notices_keyset ON notice_schema.notices(is_pinned, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_notices_author_keyset ON notice_schema.notices(author_id, created_at, id);
+
+-- 멤버 목록: created_at DESC, id DESC
+CREATE INDEX IF NOT EXISTS idx_members_keyset ON member_schema.members(created_at, id);
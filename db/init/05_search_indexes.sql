@@ -0,0 +1,19 @@
+-- TS Portal - 고객사/이벤트/공지사항 검색 인덱스
+-- 설명: 검색 API의 부분 일치 검색 (컬럼 ILIKE '%검색어%' OR ...)을 pg_trgm GIN 인덱스로 처리
+--       인덱스는 INSERT/UPDATE 시 자동 갱신되며, 검색 결과 순위는 word_similarity()로 계산 (services/shared/search.py)
+--       3글자 미만 검색어는 트라이그램이 없어 인덱스를 사용하지 않음
+-- 기존 DB 적용: psql -U tsportal -d tsportal -f db/init/05_search_indexes.sql
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 고객사 검색: 고객사명, 담당자, 담당자 이메일
+CREATE INDEX IF NOT EXISTS idx_customers_search_trgm ON customer_schema.customers
+    USING gin (company_name gin_trgm_ops, contact_person gin_trgm_ops, contact_email gin_trgm_ops);
+
+-- 이벤트 검색: 제목, 설명, 장소
+CREATE INDEX IF NOT EXISTS idx_events_search_trgm ON calendar_schema.events
+    USING gin (title gin_trgm_ops, description gin_trgm_ops, location gin_trgm_ops);
+
+-- 공지사항 검색: 제목, 내용
+CREATE INDEX IF NOT EXISTS idx_notices_search_trgm ON notice_schema.notices
+    USING gin (title gin_trgm_ops, content gin_trgm_ops);
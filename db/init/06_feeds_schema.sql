@@ -0,0 +1,24 @@
+-- TS Portal - 피드 수집 저장소 (feeds-service)
+-- 설명: feeds-service 수집 워커가 AWS 피드 항목을 주기적으로 저장하고, 조회 API는 이 테이블만 읽음
+--       같은 피드의 같은 항목(guid, 없으면 link)은 한 번만 저장
+--       feeds-service 시작 시에도 스키마/테이블이 없으면 생성함 (services/feeds-service/app/models.py)
+-- 기존 DB 적용: psql -U tsportal -d tsportal -f db/init/06_feeds_schema.sql
+
+CREATE SCHEMA IF NOT EXISTS feeds_schema;
+
+CREATE TABLE IF NOT EXISTS feeds_schema.feed_items (
+    id SERIAL PRIMARY KEY,
+    feed_id VARCHAR(50) NOT NULL,
+    guid TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL DEFAULT '',
+    summary TEXT,
+    published VARCHAR(100),
+    author VARCHAR(200),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_feed_items_feed_guid UNIQUE (feed_id, guid)
+);
+
+-- 피드별/전체 목록: created_at DESC, id DESC
+CREATE INDEX IF NOT EXISTS idx_feed_items_feed_keyset ON feeds_schema.feed_items(feed_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_feed_items_keyset ON feeds_schema.feed_items(created_at, id);
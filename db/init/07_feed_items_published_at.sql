@@ -0,0 +1,16 @@
+-- TS Portal - 피드 항목 게시일시 (feeds-service)
+-- 설명: 피드 목록을 게시일 문자열 대신 수집 시 파싱한 게시일시(published_at, UTC) 순으로 정렬하고
+--       since/until 구간 조회에 사용
+--       feed_items는 업스트림에서 다시 수집할 수 있는 데이터이므로 비운 뒤 수집 워커가 다시 채움
+--       (기존 항목의 게시일시/요약도 새 방식으로 다시 저장됨)
+-- 기존 DB 적용: psql -U tsportal -d tsportal -f db/init/07_feed_items_published_at.sql
+
+TRUNCATE feeds_schema.feed_items RESTART IDENTITY;
+
+ALTER TABLE feeds_schema.feed_items ADD COLUMN IF NOT EXISTS published_at TIMESTAMP WITH TIME ZONE NOT NULL;
+
+-- 피드별/전체 목록 및 게시일 구간 조회: published_at DESC, id DESC
+DROP INDEX IF EXISTS feeds_schema.idx_feed_items_feed_keyset;
+DROP INDEX IF EXISTS feeds_schema.idx_feed_items_keyset;
+CREATE INDEX IF NOT EXISTS idx_feed_items_feed_published ON feeds_schema.feed_items(feed_id, published_at, id);
+CREATE INDEX IF NOT EXISTS idx_feed_items_published ON feeds_schema.feed_items(published_at, id);
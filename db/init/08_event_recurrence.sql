@@ -0,0 +1,19 @@
+-- TS Portal - 반복 일정 개별 수정 (calendar-service)
+-- 설명: 반복 일정의 특정 발생만 수정한 일정(override)을 별도 행으로 저장
+--       recurrence_parent_id = 반복 일정(마스터) ID, recurrence_id = 수정 전 원래 발생 시작 시각
+--       달력 조회 시 마스터의 해당 발생 대신 override 행을 표시 (app/recurrence.py)
+-- 기존 DB 적용: psql -U tsportal -d tsportal -f db/init/08_event_recurrence.sql
+
+ALTER TABLE calendar_schema.events ADD COLUMN IF NOT EXISTS recurrence_parent_id INTEGER
+    REFERENCES calendar_schema.events(id) ON DELETE CASCADE;
+ALTER TABLE calendar_schema.events ADD COLUMN IF NOT EXISTS recurrence_id TIMESTAMP;
+
+-- 마스터별 override 조회, 발생당 override 1개
+CREATE UNIQUE INDEX IF NOT EXISTS uq_events_recurrence_override
+    ON calendar_schema.events(recurrence_parent_id, recurrence_id)
+    WHERE recurrence_parent_id IS NOT NULL;
+
+-- 달력 조회 시 반복 일정 마스터 후보 (시작 시각이 조회 범위 끝 이전인 반복 일정)
+CREATE INDEX IF NOT EXISTS idx_events_recurring_start
+    ON calendar_schema.events(start_time)
+    WHERE is_recurring AND recurrence_rule IS NOT NULL;
@@ -0,0 +1,29 @@
+-- TS Portal - 달력 기간 겹침 조회 인덱스 (calendar-service)
+-- 설명: 달력/목록 날짜 필터는 "이벤트 기간 [start_time, end_time]이 조회 범위 [시작, 끝)과 겹침"을
+--       범위 연산자 tsrange(start_time, end_time, '[]') && tsrange(시작, 끝, '[)')로 조회 (app/service.py)
+--       start_time btree는 start_time < 끝 조건만 좁힐 수 있어 범위 앞쪽 과거 이벤트를 모두 읽지만,
+--       GiST 인덱스는 겹치는 기간만 찾음
+--       생성자 필터 (created_by, start_time)는 04_keyset_indexes.sql의
+--       idx_events_created_by_keyset (created_by, start_time, id)이 앞부분 컬럼으로 처리
+-- 검증: python scripts/check_calendar_query_plans.py
+-- 기존 DB 적용: psql -U tsportal -d tsportal -f db/init/09_event_range_indexes.sql
+
+-- tsrange는 종료 < 시작이면 오류이므로 기간을 보장 (서비스는 생성/수정 시 이미 검사)
+UPDATE calendar_schema.events SET end_time = start_time WHERE end_time < start_time;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'chk_events_time_range') THEN
+        ALTER TABLE calendar_schema.events
+            ADD CONSTRAINT chk_events_time_range CHECK (end_time >= start_time);
+    END IF;
+END $$;
+
+-- 기간 겹침 조회 (식이 app/service.py의 EVENT_TIME_RANGE와 같아야 인덱스 사용)
+CREATE INDEX IF NOT EXISTS idx_events_time_range
+    ON calendar_schema.events USING GIST (tsrange(start_time, end_time, '[]'));
+
+-- 유형별 목록/통계: event_type, start_time
+CREATE INDEX IF NOT EXISTS idx_events_type_start ON calendar_schema.events(event_type, start_time);
+
+ANALYZE calendar_schema.events;
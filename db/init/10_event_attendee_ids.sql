@@ -0,0 +1,27 @@
+-- TS Portal - 일정 참가자 조회 인덱스 (calendar-service)
+-- 설명: attendees(JSONB)의 자유 형식 항목 중 멤버 ID(정수, 숫자 문자열, {"member_id": ...} / {"id": ...})만
+--       attendee_ids 정수 배열로 정규화하고 GIN 인덱스로 "멤버 X가 참가하는 일정"을 조회
+--       (attendee_ids @> ARRAY[X], 여러 멤버는 attendee_ids && ARRAY[...])
+--       서비스는 생성/수정 시 attendee_ids를 함께 저장 (app/models.py attendee_member_ids)
+-- 기존 DB 적용: psql -U tsportal -d tsportal -f db/init/10_event_attendee_ids.sql
+
+ALTER TABLE calendar_schema.events ADD COLUMN IF NOT EXISTS attendee_ids INTEGER[];
+
+-- 기존 일정 채우기 (이름 등 멤버 ID가 아닌 항목은 제외, 멤버가 없으면 NULL)
+UPDATE calendar_schema.events e
+SET attendee_ids = (
+    SELECT array_agg(DISTINCT value::INTEGER ORDER BY value::INTEGER)
+    FROM (
+        SELECT trim(CASE
+                   WHEN jsonb_typeof(item) = 'object' THEN COALESCE(item->>'member_id', item->>'id')
+                   WHEN jsonb_typeof(item) IN ('number', 'string') THEN item #>> '{}'
+               END) AS value
+        FROM jsonb_array_elements(e.attendees) AS item
+    ) items
+    WHERE value ~ '^[0-9]{1,9}$'
+)
+WHERE jsonb_typeof(e.attendees) = 'array' AND e.attendee_ids IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_events_attendee_ids ON calendar_schema.events USING GIN (attendee_ids);
+
+ANALYZE calendar_schema.events;
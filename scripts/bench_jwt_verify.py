@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+TS Portal JWT 검증 방식 벤치마크
+
+각 서비스가 shared/auth.py로 토큰을 로컬 검증할 때와
+auth-service /api/auth/verify를 원격 호출할 때의 지연 시간을 비교합니다.
+
+사용법:
+    JWT_SECRET_KEY=... python scripts/bench_jwt_verify.py \\
+        --auth-url http://localhost:8081 --username haminnyong --password test123
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import httpx
+
+# shared 모듈 import를 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'services'))
+
+from shared.auth import decode_access_token
+
+
+def summarize(name: str, samples: list):
+    """지연 시간 통계 출력 (밀리초)"""
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    total = sum(samples) / 1000
+    print(
+        f"  {name:<14} p50 {statistics.median(samples):8.3f}ms  "
+        f"p99 {p99:8.3f}ms  {len(samples) / total:10.1f} req/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬/원격 JWT 검증 지연 시간 비교")
+    parser.add_argument("--auth-url", default="http://localhost:8081", help="auth-service 주소")
+    parser.add_argument("--username", default="haminnyong", help="로그인 아이디")
+    parser.add_argument("--password", default="test123", help="로그인 비밀번호")
+    parser.add_argument("--iterations", type=int, default=1000, help="측정 횟수")
+    args = parser.parse_args()
+    
+    with httpx.Client(base_url=args.auth_url, timeout=10.0) as client:
+        login = client.post("/api/auth/login", json={"username": args.username, "password": args.password})
+        login.raise_for_status()
+        token = login.json()["access_token"]
+        
+        # 로컬 검증 (서명/만료 확인만, 네트워크 없음)
+        local = []
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            decode_access_token(token)
+            local.append((time.perf_counter() - started) * 1000)
+        
+        # 원격 검증 (keep-alive 연결 재사용, 요청마다 HTTP 왕복)
+        remote = []
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            response = client.post("/api/auth/verify", json={"token": token})
+            response.raise_for_status()
+            remote.append((time.perf_counter() - started) * 1000)
+    
+    print(f"📊 JWT 검증 {args.iterations}회")
+    summarize("local HS256", local)
+    summarize("remote verify", remote)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+TS Portal 비밀번호 해싱(shared/passwords.py) 벤치마크
+
+scrypt 비용(N)별로 로그인 한 번에 해당하는 비밀번호 검증(verify_and_update)의
+코어당 처리량과, 동시 로그인 중 이벤트 루프 지연을 측정합니다.
+
+- 코어당 처리량: 워커 1개로 검증을 반복한 초당 횟수 (로그인 CPU 비용의 상한)
+- 동시 로그인: --concurrency개 로그인을 동시에 처리할 때
+  inline(async 함수 안에서 바로 계산, 기존 방식)과 pool(해싱 풀에서 실행)의
+  처리량과 이벤트 루프 지연(10ms 타이머가 늦게 깨어난 시간의 최댓값)을 비교
+- 기존 SHA-256 해시 검증(재해싱 포함)도 함께 측정
+
+사용법:
+    python scripts/bench_password_hash.py --costs 13 14 15 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import time
+
+# shared 모듈 import를 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'services'))
+
+from shared import passwords
+
+PASSWORD = "test123!@#"
+
+
+async def loop_lag(stop: asyncio.Event) -> float:
+    """10ms 타이머가 예정보다 늦게 깨어난 최대 시간 (ms)"""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        worst = max(worst, (time.perf_counter() - started - 0.01) * 1000)
+    return worst
+
+
+async def concurrent_logins(password_hash: str, concurrency: int, rounds: int, offload: bool):
+    """동시 로그인 처리 (초당 로그인 수, 최대 루프 지연 ms)"""
+    async def login():
+        if offload:
+            verified, _ = await passwords.verify_and_update(PASSWORD, password_hash)
+        else:
+            verified, _ = passwords._verify_and_update(PASSWORD, password_hash)
+        assert verified
+    
+    stop = asyncio.Event()
+    lag = asyncio.create_task(loop_lag(stop))
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(login() for _ in range(concurrency)))
+    seconds = time.perf_counter() - started
+    stop.set()
+    return concurrency * rounds / seconds, await lag
+
+
+def per_core(password_hash: str, seconds: float) -> float:
+    """워커 1개의 초당 검증 횟수"""
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        passwords._verify_and_update(PASSWORD, password_hash)
+        count += 1
+    return count / (time.perf_counter() - started)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="비밀번호 해싱 비용별 로그인 처리량 측정")
+    parser.add_argument("--costs", type=int, nargs="+", default=[13, 14, 15], help="scrypt N의 log2 값")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 로그인 수")
+    parser.add_argument("--rounds", type=int, default=2, help="동시 로그인 반복 횟수")
+    parser.add_argument("--seconds", type=float, default=3.0, help="코어당 처리량 측정 시간 (초)")
+    args = parser.parse_args()
+    
+    print(
+        f"📊 CPU {os.cpu_count()}개, 해싱 풀 {passwords.PASSWORD_HASH_POOL} x {passwords.PASSWORD_HASH_WORKERS}, "
+        f"r={passwords.PASSWORD_SCRYPT_R}, p={passwords.PASSWORD_SCRYPT_P}, 동시 로그인 {args.concurrency}"
+    )
+    print(
+        f"  {'해시':<16} {'코어당':>10} {'inline':>10} {'루프 지연':>10} {'pool':>10} {'루프 지연':>10}"
+    )
+    
+    cases = [("sha256→scrypt", hashlib.sha256(PASSWORD.encode()).hexdigest(), passwords.PASSWORD_SCRYPT_N)]
+    cases += [(f"scrypt N=2^{cost}", None, 2 ** cost) for cost in args.costs]
+    for name, password_hash, n in cases:
+        # 현재 비용 설정 (기존 SHA-256 해시는 기본 비용으로 재해싱)
+        passwords.PASSWORD_SCRYPT_N = n
+        if password_hash is None:
+            password_hash = passwords.hash_password(PASSWORD)
+        
+        rate = per_core(password_hash, args.seconds)
+        inline_rate, inline_lag = await concurrent_logins(password_hash, args.concurrency, args.rounds, offload=False)
+        pool_rate, pool_lag = await concurrent_logins(password_hash, args.concurrency, args.rounds, offload=True)
+        print(
+            f"  {name:<16} {rate:>8.1f}/s {inline_rate:>8.1f}/s {inline_lag:>8.1f}ms "
+            f"{pool_rate:>8.1f}/s {pool_lag:>8.1f}ms"
+        )
+    
+    passwords.shutdown_password_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+TS Portal 반복 일정 전개 벤치마크
+
+매일/매주 반복 일정 수천 개(DB 없이 조회 행과 같은 형태로 생성)를
+calendar-service의 전개 엔진(app/recurrence.py)으로 조회 범위 안의 발생으로 전개하고
+FullCalendar 응답으로 변환하는 시간을 측정합니다.
+
+- 1년 범위 / 월 단위 달력 이동(12개월을 차례로 조회)
+- 전개: 발생 시각 계산만 (캐시 없음 cold / 같은 범위 다시 조회 warm)
+- 전체: 전개 + 개별 수정 제외 + FullCalendar 응답 변환 (캐시 없음)
+
+사용법:
+    python scripts/bench_recurrence.py --daily 2000 --weekly 2000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+# calendar-service app 패키지 import를 위한 경로 추가 (DB 연결은 하지 않음)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'services'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'services', 'calendar-service'))
+
+from app.recurrence import clear_recurrence_cache, occurrences_in_window
+from app.service import CALENDAR_EVENT_COLUMNS, calendar_window, expand_recurring_rows, to_calendar_events
+
+YEAR = 2027
+
+# 달력 조회 결과 행과 같은 형태
+CalendarRow = namedtuple("CalendarRow", [column.key for column in CALENDAR_EVENT_COLUMNS])
+
+
+def build_rows(daily: int, weekly: int, seed: int = 42):
+    """반복 일정 마스터 행 (CALENDAR_EVENT_COLUMNS 순서), 시작일은 조회 연도 이전 1년 안에서 무작위"""
+    random.seed(seed)
+    rules = ["FREQ=DAILY"] * daily + ["FREQ=WEEKLY;BYDAY=MO,WE,FR"] * (weekly // 2) + ["FREQ=WEEKLY"] * (weekly - weekly // 2)
+    rows = []
+    for event_id, rule in enumerate(rules, start=1):
+        start = datetime(YEAR - 1, 1, 1, 9) + timedelta(days=random.randrange(365), minutes=30 * random.randrange(16))
+        if random.random() < 0.2:
+            # 일부는 제외 일시(EXDATE) 포함
+            rule = f"RRULE:{rule}\nEXDATE:{start + timedelta(days=7):%Y%m%dT%H%M%S}"
+        rows.append(CalendarRow(
+            event_id, f"반복 일정 {event_id}", "meeting", start, start + timedelta(minutes=30), False,
+            None, None, ["a", "b"], event_id % 40 + 1, None, None, True, rule
+        ))
+    return rows
+
+
+def occurrences(rows, start_date: date, end_date: date) -> int:
+    """발생 시각 계산만, 발생 수 반환"""
+    window_start, window_end = calendar_window(start_date, end_date)
+    return sum(
+        len(occurrences_in_window(row.recurrence_rule, row.start_time, row.end_time - row.start_time, window_start, window_end))
+        for row in rows
+    )
+
+
+def calendar(rows, start_date: date, end_date: date) -> int:
+    """한 번의 달력 조회 (전개 + 응답 변환), 응답 항목 수 반환"""
+    window_start, window_end = calendar_window(start_date, end_date)
+    return len(to_calendar_events(expand_recurring_rows(rows, set(), window_start, window_end), datetime.now()))
+
+
+def timed(func, rows, windows) -> float:
+    """windows 각각을 조회한 총 시간 (밀리초)"""
+    started = time.perf_counter()
+    for start_date, end_date in windows:
+        func(rows, start_date, end_date)
+    return (time.perf_counter() - started) * 1000
+
+
+def months():
+    """조회 연도의 월별 (첫날, 마지막날)"""
+    for month in range(1, 13):
+        first = date(YEAR, month, 1)
+        last = (date(YEAR + (month == 12), month % 12 + 1, 1) - timedelta(days=1))
+        yield first, last
+
+
+def main():
+    parser = argparse.ArgumentParser(description="반복 일정 전개 시간 측정")
+    parser.add_argument("--daily", type=int, default=2000, help="매일 반복 일정 수")
+    parser.add_argument("--weekly", type=int, default=2000, help="매주 반복 일정 수")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수")
+    args = parser.parse_args()
+    
+    rows = build_rows(args.daily, args.weekly)
+    print(f"📅 반복 일정 {len(rows)}개 (매일 {args.daily}, 매주 {args.weekly}), 조회 연도 {YEAR}")
+    
+    year = [(date(YEAR, 1, 1), date(YEAR, 12, 31))]
+    for name, windows in (("1년 범위", year), ("월별 12회", list(months()))):
+        cold, warm, full = [], [], []
+        for _ in range(args.repeat):
+            clear_recurrence_cache()
+            cold.append(timed(occurrences, rows, windows))
+            warm.append(timed(occurrences, rows, windows))
+            clear_recurrence_cache()
+            full.append(timed(calendar, rows, windows))
+        
+        per = len(windows)
+        count = sum(occurrences(rows, *window) for window in windows) // per
+        print(
+            f"  {name:<8} 조회당 발생 {count:>8}개  "
+            f"전개 cold p50 {statistics.median(cold) / per:9.1f}ms  warm p50 {statistics.median(warm) / per:8.1f}ms  "
+            f"전체 p50 {statistics.median(full) / per:9.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
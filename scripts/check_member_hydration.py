@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+TS Portal 멤버 정보 일괄 조회(shared/members.py) 검증
+
+로컬 스텁 member-service(GET /api/members/batch와 같은 응답)에 MemberClient를 연결하고
+공지사항 목록 응답(NoticeResponse)의 작성자 정보를 채우면서 다음을 확인합니다.
+
+- 한 페이지의 작성자는 중복 없이 요청 한 번으로 조회 (N+1 요청 없음)
+- 다음 페이지는 캐시에 없는 작성자만 조회, 없는 ID도 캐시
+- 요청당 ID 수(batch_size)를 넘으면 나눠 조회
+- 서비스 토큰으로 인증 (스텁도 get_current_user로 검증)
+- member-service 오류 시 요청은 실패하지 않고 작성자만 비어 있음, 대기 시간 동안 재호출 안 함
+- 문제가 있으면 종료 코드 1
+
+DB 없이 실행됩니다. 실제 member-service에 연결하려면 MEMBER_SERVICE_URL과 --live를 지정하세요.
+
+사용법:
+    python scripts/check_member_hydration.py
+    MEMBER_SERVICE_URL=http://localhost:8082 python scripts/check_member_hydration.py --live 1 2 3
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime
+from typing import List
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException, Query
+
+# shared 모듈 / notice-service app 패키지 import를 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'services'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'services', 'notice-service'))
+
+from shared.auth import AuthenticatedUser, get_current_user
+from shared.members import MemberClient, attach_members
+from app.schemas import AuthorInfo, NoticeResponse
+
+# 스텁 멤버 (ID 1~20, 13번은 없음)
+STUB_MEMBERS = {
+    member_id: {
+        "id": member_id, "name": f"팀원{member_id}", "email": f"member{member_id}@example.com",
+        "position": "선임", "team": "TS팀", "is_active": True
+    }
+    for member_id in range(1, 21) if member_id != 13
+}
+
+
+def create_stub_app(requests: List[List[int]], failing: dict) -> FastAPI:
+    """member-service 일괄 조회 스텁 (요청된 ID 목록을 requests에 기록)"""
+    app = FastAPI()
+    
+    @app.get("/api/members/batch")
+    async def get_members_batch(
+        ids: List[str] = Query(...),
+        _: AuthenticatedUser = Depends(get_current_user)
+    ):
+        if failing["enabled"]:
+            raise HTTPException(status_code=503, detail="stub unavailable")
+        member_ids = sorted({int(value) for item in ids for value in item.split(",") if value})
+        requests.append(member_ids)
+        return [STUB_MEMBERS[member_id] for member_id in member_ids if member_id in STUB_MEMBERS]
+    
+    return app
+
+
+def notice_page(author_ids: List[int]) -> List[NoticeResponse]:
+    """작성자 ID 목록으로 만든 공지사항 응답 목록"""
+    now = datetime.now()
+    return [
+        NoticeResponse(
+            id=i, title=f"공지 {i}", content="내용", priority="normal", author_id=author_id,
+            is_active=True, is_pinned=False, created_at=now, updated_at=now,
+            priority_display="일반", priority_color="gray", priority_icon="📢"
+        )
+        for i, author_id in enumerate(author_ids, 1)
+    ]
+
+
+async def run_stub_checks() -> List[str]:
+    """스텁 member-service로 검증 (실패 항목 목록)"""
+    requests: List[List[int]] = []
+    failing = {"enabled": False}
+    client = MemberClient(
+        base_url="http://member-service.stub", batch_size=5,
+        transport=httpx.ASGITransport(app=create_stub_app(requests, failing))
+    )
+    issues = []
+    
+    def check(name: str, ok: bool, detail: str = ""):
+        print(f"   {'✅' if ok else '❌'} {name}" + (f" ({detail})" if detail else ""))
+        if not ok:
+            issues.append(name)
+    
+    try:
+        # 1페이지: 20건, 작성자 4명
+        page = notice_page([1, 2, 3, 4] * 5)
+        await attach_members(page, "author_id", "author", AuthorInfo, client=client)
+        check("한 페이지 요청 1회", requests == [[1, 2, 3, 4]], f"요청: {requests}")
+        check("작성자 채움", all(n.author and n.author.id == n.author_id for n in page))
+        check("응답 직렬화", page[0].model_dump()["author"]["name"] == "팀원1")
+        
+        # 2페이지: 일부 작성자는 캐시, 13번은 없는 멤버
+        requests.clear()
+        page = notice_page([3, 4, 5, 13, 5])
+        await attach_members(page, "author_id", "author", AuthorInfo, client=client)
+        check("캐시에 없는 작성자만 조회", requests == [[5, 13]], f"요청: {requests}")
+        check("없는 작성자는 None", [n.author is None for n in page] == [False, False, False, True, False])
+        
+        requests.clear()
+        await attach_members(notice_page([13, 1]), "author_id", "author", AuthorInfo, client=client)
+        check("없는 ID도 캐시", requests == [], f"요청: {requests}")
+        
+        # batch_size(5) 초과 시 나눠 조회
+        requests.clear()
+        page = notice_page(list(range(6, 13)) + list(range(14, 18)))
+        await attach_members(page, "author_id", "author", AuthorInfo, client=client)
+        check("batch_size로 나눠 조회", [len(ids) for ids in requests] == [5, 5, 1], f"요청: {requests}")
+        
+        # member-service 오류: 요청은 성공, 작성자만 None, 대기 시간 동안 재호출 안 함
+        requests.clear()
+        failing["enabled"] = True
+        page = notice_page([18, 19, 1])
+        await attach_members(page, "author_id", "author", AuthorInfo, client=client)
+        check("오류 시 캐시된 작성자만 채움", [n.author is None for n in page] == [True, True, False])
+        errors = client.stats["errors"]
+        await attach_members(notice_page([19]), "author_id", "author", AuthorInfo, client=client)
+        check("오류 후 대기 시간 동안 호출 안 함", errors == 1 and client.stats["errors"] == 1, str(client.stats))
+        
+        print(f"   📊 {client.stats}")
+    finally:
+        await client.close()
+    return issues
+
+
+async def run_live(member_ids: List[int]) -> List[str]:
+    """실제 member-service(MEMBER_SERVICE_URL)로 조회 (실패 항목 목록)"""
+    client = MemberClient()
+    try:
+        page = notice_page(member_ids)
+        await attach_members(page, "author_id", "author", AuthorInfo, client=client)
+        for notice in page:
+            print(f"   {notice.author_id}: {notice.author.model_dump() if notice.author else None}")
+        print(f"   📊 {client.stats}")
+        return ["member-service 조회 실패"] if client.stats["errors"] else []
+    finally:
+        await client.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="멤버 정보 일괄 조회 검증")
+    parser.add_argument("--live", type=int, nargs="+", metavar="MEMBER_ID", help="실제 member-service로 조회할 멤버 ID")
+    args = parser.parse_args()
+    
+    if args.live:
+        print(f"🔍 member-service 일괄 조회 ({os.getenv('MEMBER_SERVICE_URL', 'http://member-service:8000')})")
+        issues = await run_live(args.live)
+    else:
+        print("🔍 스텁 member-service로 멤버 정보 일괄 조회 검증")
+        issues = await run_stub_checks()
+    
+    if issues:
+        print(f"\n❌ {len(issues)}개 항목 실패")
+        return 1
+    print("\n✅ 모든 항목 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -11,7 +11,7 @@ import os
 # shared 모듈 import를 위한 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from shared.database import create_database_config, Base
+from shared.database import create_database_config, Base, add_statement_count_middleware, MEMBER_CHANGES_CHANNEL
 
 # Auth Service용 데이터베이스 설정 생성
 db_config = create_database_config("auth-service")
@@ -19,8 +19,11 @@ db_config = create_database_config("auth-service")
 # 기존 인터페이스 호환성을 위한 export
 engine = db_config.engine
 SessionLocal = db_config.SessionLocal
-get_db = db_config.get_db
+AsyncSessionLocal = db_config.AsyncSessionLocal
+get_db = db_config.get_async_db  # 비동기 세션 의존성 (이벤트 루프 블로킹 방지)
 check_database_connection = db_config.check_connection
+close_database = db_config.dispose
+async_database_url = db_config.async_database_url
 
 # Auth Service는 별도 테이블 생성 없이 기존 member 테이블 사용
 def init_database():
@@ -0,0 +1,144 @@
+"""
+Auth Service - 마지막 로그인 시간 일괄 기록
+
+로그인마다 UPDATE member_schema.members SET last_login = NOW() 를 따로 실행하고 커밋하던 것을
+메모리에 모아 두었다가 주기적으로 UPDATE 한 번에 기록합니다. (로그인 요청은 사용자 조회 쿼리 1회)
+
+- 같은 사용자가 여러 번 로그인하면 마지막 시각만 기록
+- 로그인 시 재해싱한 비밀번호 해시(shared/passwords.py)도 함께 기록
+  (검증에 사용한 해시가 아직 저장되어 있을 때만 교체 - 그사이 비밀번호가 바뀌었으면 재해싱은 버림)
+- 종료 시 남은 항목 기록, 기록 실패 시 다음 주기에 다시 시도
+- 프로세스가 비정상 종료되면 최대 LAST_LOGIN_FLUSH_INTERVAL 동안의 기록이 유실될 수 있음
+  (재해싱한 해시는 다음 로그인 때 다시 계산됨)
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import text
+
+from .database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 기록 주기 (초) / 0이면 로그인마다 바로 기록
+LAST_LOGIN_FLUSH_INTERVAL = float(os.getenv("LAST_LOGIN_FLUSH_INTERVAL", "5"))
+
+# 모인 항목이 이 수를 넘으면 주기를 기다리지 않고 기록
+LAST_LOGIN_FLUSH_MAX_PENDING = int(os.getenv("LAST_LOGIN_FLUSH_MAX_PENDING", "1000"))
+
+
+class LastLoginRecorder:
+    """마지막 로그인 시간 / 재해싱한 비밀번호 해시 일괄 기록"""
+    
+    def __init__(
+        self,
+        session_factory,
+        interval: float = LAST_LOGIN_FLUSH_INTERVAL,
+        max_pending: int = LAST_LOGIN_FLUSH_MAX_PENDING
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.max_pending = max_pending
+        # 사용자 ID -> (로그인 시각, 검증에 사용한 해시, 새 비밀번호 해시) - 재해싱이 없으면 해시는 None
+        self._pending: Dict[int, Tuple[datetime, Optional[str], Optional[str]]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self.flushed = 0
+        self.errors = 0
+    
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+    
+    async def start(self):
+        """주기적 기록 시작"""
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """주기적 기록 종료 (남은 항목 기록)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+    
+    async def record(self, user_id: int, new_hash: Optional[str] = None, verified_hash: Optional[str] = None):
+        """
+        로그인 기록 (주기적 기록이 꺼져 있으면 바로 기록)
+        
+        Args:
+            user_id: 사용자 ID
+            new_hash: 재해싱한 비밀번호 해시 (없으면 None)
+            verified_hash: 로그인 검증에 사용한 (DB에 저장되어 있던) 해시 - 기록 시 이 값일 때만 new_hash로 교체
+        """
+        self._pending[user_id] = self._merge(self._pending.get(user_id), (datetime.utcnow(), verified_hash, new_hash))
+        if self._task is None:
+            await self.flush()
+        elif len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+    
+    @staticmethod
+    def _merge(previous, entry):
+        """같은 사용자의 두 기록 합치기 (시각은 나중 것, 재해싱은 새 해시가 있는 나중 것)"""
+        if previous is None:
+            return entry
+        older, newer = sorted((previous, entry), key=lambda item: item[0])
+        return newer if newer[2] else (newer[0], older[1], older[2])
+    
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+    
+    async def flush(self):
+        """모인 항목을 UPDATE 한 번으로 기록"""
+        async with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            user_ids = list(pending)
+            try:
+                async with self.session_factory() as db:
+                    await db.execute(text('''
+                        UPDATE member_schema.members AS m
+                        SET last_login = v.last_login,
+                            password_hash = CASE
+                                WHEN v.new_hash IS NOT NULL AND m.password_hash = v.verified_hash THEN v.new_hash
+                                ELSE m.password_hash
+                            END
+                        FROM unnest(
+                            CAST(:user_ids AS INTEGER[]), CAST(:last_logins AS TIMESTAMP[]),
+                            CAST(:verified_hashes AS VARCHAR[]), CAST(:new_hashes AS VARCHAR[])
+                        ) AS v(id, last_login, verified_hash, new_hash)
+                        WHERE m.id = v.id
+                    '''), {
+                        "user_ids": user_ids,
+                        "last_logins": [pending[user_id][0] for user_id in user_ids],
+                        "verified_hashes": [pending[user_id][1] for user_id in user_ids],
+                        "new_hashes": [pending[user_id][2] for user_id in user_ids]
+                    })
+                    await db.commit()
+                self.flushed += len(user_ids)
+            except Exception as e:
+                # 기록하지 못한 항목을 되돌림 (그사이 다시 로그인한 사용자는 새 시각 유지)
+                self.errors += 1
+                for user_id, entry in pending.items():
+                    self._pending[user_id] = self._merge(self._pending.get(user_id), entry)
+                logger.warning(f"⚠️ 마지막 로그인 시간 기록 실패 ({len(user_ids)}명, 다음 주기에 재시도): {e}")
+
+
+# 서비스 전역 기록기 (main.py lifespan에서 시작/종료)
+last_login_recorder = LastLoginRecorder(AsyncSessionLocal)
@@ -13,8 +13,15 @@ import logging
 import os
 from typing import Optional
 
-from .database import engine, Base, get_db, check_database_connection
+from .database import (
+    engine, Base, get_db, check_database_connection, close_database, add_statement_count_middleware,
+    async_database_url, MEMBER_CHANGES_CHANNEL
+)
 from .routers import auth_router
+from .token_cache import token_cache, MemberChangeListener
+from .last_login import last_login_recorder
+
+from shared.passwords import shutdown_password_pool
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,6 +30,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 멤버 변경(권한 변경/비활성화) 알림 수신 -> 토큰 캐시 무효화
+member_change_listener = MemberChangeListener(async_database_url, MEMBER_CHANGES_CHANNEL)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
@@ -43,12 +53,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ 데이터베이스 초기화 실패: {e}")
     
+    # 토큰 캐시 무효화 채널 구독
+    await member_change_listener.start()
+    
+    # 마지막 로그인 시간 일괄 기록 시작
+    await last_login_recorder.start()
+    
     logger.info("🎉 Auth Service 시작 완료!")
     
     yield
     
     # 종료 시
     logger.info("👋 Auth Service 종료 중...")
+    await member_change_listener.stop()
+    await last_login_recorder.stop()
+    shutdown_password_pool()
+    await close_database()
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -67,6 +87,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 SQL 실행 횟수 계측 (X-DB-Statements 헤더)
+add_statement_count_middleware(app)
+
 # Bearer 토큰 스키마
 security = HTTPBearer()
 
@@ -102,7 +125,17 @@ async def health_check():
                 "status": "healthy",
                 "service": "auth-service",
                 "database": "connected",
-                "jwt_secret": "configured" if os.getenv("JWT_SECRET_KEY") else "missing"
+                "jwt_secret": "configured" if os.getenv("JWT_SECRET_KEY") else "missing",
+                "token_cache": {
+                    **token_cache.stats(),
+                    "invalidation_listener": "listening" if member_change_listener.is_listening else "disconnected",
+                    "invalidation_listener_reconnects": member_change_listener.reconnects
+                },
+                "last_login_recorder": {
+                    "pending": last_login_recorder.pending,
+                    "flushed": last_login_recorder.flushed,
+                    "errors": last_login_recorder.errors
+                }
             }
         else:
             raise HTTPException(
@@ -8,7 +8,7 @@ import logging
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
 from .database import get_db
@@ -27,7 +27,7 @@ auth_router = APIRouter()
 security = HTTPBearer()
 
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
     """AuthService 의존성 주입"""
     return AuthService(db)
 
@@ -45,7 +45,7 @@ async def login(
     - 마지막 로그인 시간 업데이트
     """
     try:
-        return auth_service.login(login_data)
+        return await auth_service.login(login_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -69,7 +69,7 @@ async def logout(
     """
     try:
         token = credentials.credentials
-        success = auth_service.logout(token)
+        success = await auth_service.logout(token)
         
         if not success:
             raise HTTPException(
@@ -101,7 +101,7 @@ async def verify_token(
     - 토큰 유효성과 사용자 정보 반환
     """
     try:
-        token_data = auth_service.verify_token(token_request.token)
+        token_data = await auth_service.verify_token(token_request.token)
         
         if not token_data:
             return TokenVerifyResponse(
@@ -144,7 +144,7 @@ async def get_current_user(
     """
     try:
         token = credentials.credentials
-        user = auth_service.get_current_user_from_token(token)
+        user = await auth_service.get_current_user_from_token(token)
         
         if not user:
             raise HTTPException(
@@ -187,7 +187,7 @@ async def refresh_token(
     """
     try:
         token = credentials.credentials
-        user = auth_service.get_current_user_from_token(token)
+        user = await auth_service.get_current_user_from_token(token)
         
         if not user:
             raise HTTPException(
@@ -238,7 +238,7 @@ async def validate_token_for_gateway(
             )
         
         # 토큰 검증
-        token_data = auth_service.verify_token(token)
+        token_data = await auth_service.verify_token(token)
         if not token_data or not token_data.get("valid"):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
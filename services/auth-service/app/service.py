@@ -5,11 +5,10 @@ JWT 토큰 관리, 인증/인가 핵심 비즈니스 로직 구현
 """
 
 import logging
-import hashlib
 import os
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 import jwt
 from jwt.exceptions import InvalidTokenError, ExpiredSignatureError
@@ -17,6 +16,14 @@ from sqlalchemy import text
 
 from .models import Member, UserRole
 from .schemas import LoginRequest, TokenResponse, JWTPayload
+from .token_cache import token_cache
+from .last_login import last_login_recorder
+
+# shared 모듈 import를 위한 경로 추가
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.passwords import hash_password_async, verify_password_async, verify_and_update
 
 logger = logging.getLogger(__name__)
 
@@ -29,16 +36,16 @@ JWT_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "1440"))  # 24시간
 class AuthService:
     """인증/인가 서비스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def hash_password(self, password: str) -> str:
-        """비밀번호 해싱"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    async def hash_password(self, password: str) -> str:
+        """비밀번호 해싱 (scrypt, shared/passwords.py 해싱 풀에서 실행)"""
+        return await hash_password_async(password)
     
-    def verify_password(self, password: str, password_hash: str) -> bool:
-        """비밀번호 검증"""
-        return hashlib.sha256(password.encode()).hexdigest() == password_hash
+    async def verify_password(self, password: str, password_hash: str) -> bool:
+        """비밀번호 검증 (기존 SHA-256 해시 포함, 해싱 풀에서 실행)"""
+        return await verify_password_async(password, password_hash)
     
     def create_access_token(self, user: Member) -> Dict[str, Any]:
         """
@@ -81,7 +88,7 @@ class AuthService:
                 detail="토큰 생성 중 오류가 발생했습니다."
             )
     
-    def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+    async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """
         JWT 토큰 검증
         
@@ -92,15 +99,20 @@ class AuthService:
             Dict: 토큰 페이로드 또는 None
         """
         try:
-            # JWT 토큰 디코딩
+            # JWT 토큰 디코딩 (서명/만료 검증은 캐시 여부와 무관하게 항상 수행)
             payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
             
+            # 캐시 적중 시 사용자 조회(DB) 생략
+            cached = token_cache.get(token)
+            if cached is not None:
+                return cached
+            
             # 사용자 존재 확인
-            user = self.get_user_by_id(payload.get("user_id"))
+            user = await self.get_user_by_id(payload.get("user_id"))
             if not user or not user.is_active:
                 return None
             
-            return {
+            token_data = {
                 "valid": True,
                 "user_id": payload.get("user_id"),
                 "email": payload.get("email"),
@@ -108,6 +120,8 @@ class AuthService:
                 "expires_at": datetime.fromtimestamp(payload.get("exp")),
                 "user": user
             }
+            token_cache.set(token, user.id, token_data, payload.get("exp"))
+            return token_data
             
         except ExpiredSignatureError:
             logger.warning("만료된 토큰")
@@ -119,7 +133,7 @@ class AuthService:
             logger.error(f"토큰 검증 실패: {e}")
             return {"valid": False, "message": "토큰 검증 중 오류가 발생했습니다."}
     
-    def authenticate_user(self, login_data: LoginRequest) -> Optional[Member]:
+    async def authenticate_user(self, login_data: LoginRequest) -> Optional[Member]:
         """
         사용자 인증 (Username + Password 방식)
         
@@ -130,32 +144,23 @@ class AuthService:
             Member: 인증된 사용자 객체 또는 None
         """
         try:
-            logger.info(f"🔍 로그인 시도: {login_data.username}")
-            
-            # Raw SQL로 사용자 조회 (username으로 검색)
-            result = self.db.execute(text('''
+            # Raw SQL로 사용자 조회 (username으로 검색) - 로그인 요청의 유일한 쿼리
+            result = (await self.db.execute(text('''
                 SELECT id, name, username, email, phone, password_hash, role, last_login, 
                        position, team, skills, join_date, is_active, profile_image_url,
                        created_at, updated_at
                 FROM member_schema.members 
                 WHERE username = :username AND is_active = true
-            '''), {"username": login_data.username}).fetchone()
+            '''), {"username": login_data.username})).fetchone()
             
             if not result:
-                logger.warning(f"❌ 존재하지 않는 사용자: {login_data.username}")
+                logger.warning("❌ 로그인 실패: 존재하지 않는 사용자")
                 return None
             
-            logger.info(f"✅ 사용자 찾음: {result[1]} ({result[2]}), 저장된 해시: {result[5]}")
-            
-            # 입력된 비밀번호의 해시 생성
-            input_hash = self.hash_password(login_data.password)
-            logger.info(f"🔑 입력 비밀번호 '{login_data.password}' 해시: {input_hash}")
-            
-            # 비밀번호 검증
-            if not self.verify_password(login_data.password, result[5]):
-                logger.warning(f"❌ 비밀번호 불일치: {login_data.username}")
-                logger.warning(f"   저장된 해시: {result[5]}")
-                logger.warning(f"   입력 해시:   {input_hash}")
+            # 비밀번호 검증 (해싱 풀에서 실행, 기존 SHA-256 해시/이전 비용이면 새 해시도 계산)
+            verified, new_hash = await verify_and_update(login_data.password, result[5])
+            if not verified:
+                logger.warning("❌ 로그인 실패: 비밀번호 불일치")
                 return None
             
             # Member 객체 생성 (ORM 없이 직접 생성)
@@ -165,7 +170,7 @@ class AuthService:
             user.username = result[2]
             user.email = result[3]
             user.phone = result[4]
-            user.password_hash = result[5]
+            user.password_hash = new_hash or result[5]
             user.role = UserRole(result[6])  # enum 값으로 변환
             user.last_login = result[7]
             user.position = result[8]
@@ -177,32 +182,27 @@ class AuthService:
             user.created_at = result[14]
             user.updated_at = result[15]
             
-            # 마지막 로그인 시간 업데이트
-            self.db.execute(text('''
-                UPDATE member_schema.members 
-                SET last_login = NOW() 
-                WHERE id = :user_id
-            '''), {"user_id": user.id})
-            self.db.commit()
+            # 마지막 로그인 시간 (재해싱한 경우 새 해시도) - last_login_recorder가 모아서 UPDATE 한 번으로 기록
+            await last_login_recorder.record(user.id, new_hash, verified_hash=result[5])
             
-            logger.info(f"🎉 사용자 인증 성공: {user.username} ({user.name})")
+            logger.info("🎉 사용자 인증 성공")
             return user
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"💥 사용자 인증 실패: {e}")
             return None
     
-    def get_user_by_id(self, user_id: int) -> Optional[Member]:
+    async def get_user_by_id(self, user_id: int) -> Optional[Member]:
         """ID로 사용자 조회"""
         try:
-            result = self.db.execute(text('''
+            result = (await self.db.execute(text('''
                 SELECT id, name, username, email, phone, password_hash, role, last_login, 
                        position, team, skills, join_date, is_active, profile_image_url,
                        created_at, updated_at
                 FROM member_schema.members 
                 WHERE id = :user_id AND is_active = true
-            '''), {"user_id": user_id}).fetchone()
+            '''), {"user_id": user_id})).fetchone()
             
             if not result:
                 return None
@@ -231,16 +231,16 @@ class AuthService:
             logger.error(f"사용자 조회 실패: {e}")
             return None
     
-    def get_user_by_username(self, username: str) -> Optional[Member]:
+    async def get_user_by_username(self, username: str) -> Optional[Member]:
         """Username으로 사용자 조회"""
         try:
-            result = self.db.execute(text('''
+            result = (await self.db.execute(text('''
                 SELECT id, name, username, email, phone, password_hash, role, last_login, 
                        position, team, skills, join_date, is_active, profile_image_url,
                        created_at, updated_at
                 FROM member_schema.members 
                 WHERE username = :username AND is_active = true
-            '''), {"username": username}).fetchone()
+            '''), {"username": username})).fetchone()
             
             if not result:
                 return None
@@ -269,16 +269,16 @@ class AuthService:
             logger.error(f"사용자 조회 실패: {e}")
             return None
     
-    def get_user_by_email(self, email: str) -> Optional[Member]:
+    async def get_user_by_email(self, email: str) -> Optional[Member]:
         """이메일로 사용자 조회 (기존 호환성 유지)"""
         try:
-            result = self.db.execute(text('''
+            result = (await self.db.execute(text('''
                 SELECT id, name, username, email, phone, password_hash, role, last_login, 
                        position, team, skills, join_date, is_active, profile_image_url,
                        created_at, updated_at
                 FROM member_schema.members 
                 WHERE email = :email AND is_active = true
-            '''), {"email": email}).fetchone()
+            '''), {"email": email})).fetchone()
             
             if not result:
                 return None
@@ -307,7 +307,7 @@ class AuthService:
             logger.error(f"사용자 조회 실패: {e}")
             return None
     
-    def login(self, login_data: LoginRequest) -> TokenResponse:
+    async def login(self, login_data: LoginRequest) -> TokenResponse:
         """
         로그인 처리
         
@@ -321,7 +321,7 @@ class AuthService:
             HTTPException: 인증 실패 시
         """
         # 사용자 인증
-        user = self.authenticate_user(login_data)
+        user = await self.authenticate_user(login_data)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -334,7 +334,7 @@ class AuthService:
         
         return TokenResponse(**token_data)
     
-    def logout(self, token: str) -> bool:
+    async def logout(self, token: str) -> bool:
         """
         로그아웃 처리
         
@@ -348,7 +348,7 @@ class AuthService:
             bool: 성공 여부
         """
         try:
-            token_data = self.verify_token(token)
+            token_data = await self.verify_token(token)
             if token_data and token_data.get("valid"):
                 logger.info(f"사용자 로그아웃: {token_data.get('email')}")
                 return True
@@ -357,7 +357,7 @@ class AuthService:
             logger.error(f"로그아웃 처리 실패: {e}")
             return False
     
-    def get_current_user_from_token(self, token: str) -> Optional[Member]:
+    async def get_current_user_from_token(self, token: str) -> Optional[Member]:
         """
         토큰에서 현재 사용자 정보 추출
         
@@ -367,7 +367,7 @@ class AuthService:
         Returns:
             Member: 사용자 객체 또는 None
         """
-        token_data = self.verify_token(token)
+        token_data = await self.verify_token(token)
         if token_data and token_data.get("valid"):
             return token_data.get("user")
         return None
@@ -0,0 +1,228 @@
+"""
+Auth Service - 토큰 검증 캐시
+
+verify_token 결과를 토큰 해시 기준으로 짧게 캐싱하여
+/api/auth/verify, /api/auth/me 호출마다 발생하던 DB 조회를 줄입니다.
+
+- 항목 만료 시점: min(현재 + TTL, 토큰 exp)
+- 최대 항목 수 초과 시 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- member-service의 권한 변경/비활성화는 PostgreSQL NOTIFY로 전달받아 즉시 무효화
+  (LISTEN 연결이 끊기면 캐시를 비우고 백오프로 재연결)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+# 캐시 설정
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+
+# 무효화 채널(LISTEN) 재연결 대기 시간 (초) - 실패할 때마다 두 배, 최대 _MAX
+TOKEN_CACHE_LISTENER_RETRY_MIN = float(os.getenv("TOKEN_CACHE_LISTENER_RETRY_MIN", "1"))
+TOKEN_CACHE_LISTENER_RETRY_MAX = float(os.getenv("TOKEN_CACHE_LISTENER_RETRY_MAX", "60"))
+
+
+class TokenCache:
+    """TTL + LRU 기반 토큰 검증 결과 캐시"""
+    
+    def __init__(self, ttl_seconds: int = TOKEN_CACHE_TTL_SECONDS, max_size: int = TOKEN_CACHE_MAX_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        # 토큰 해시 -> (만료 시각(epoch), 사용자 ID, 검증 결과)
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        # 사용자 ID -> 토큰 해시 집합 (사용자 단위 무효화용)
+        self._keys_by_user: Dict[int, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    @staticmethod
+    def _key(token: str) -> str:
+        """토큰 원문 대신 해시를 키로 사용"""
+        return hashlib.sha256(token.encode()).hexdigest()
+    
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """캐시된 검증 결과 조회 (없거나 만료 시 None)"""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, user_id, value = entry
+        if expires_at <= time.time():
+            self._remove(key, user_id)
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, token: str, user_id: int, value: Dict[str, Any], token_exp: float):
+        """검증 결과 저장 (토큰 exp 이후로는 유지하지 않음)"""
+        expires_at = min(time.time() + self.ttl_seconds, token_exp)
+        if expires_at <= time.time():
+            return
+        
+        key = self._key(token)
+        self._entries[key] = (expires_at, user_id, value)
+        self._entries.move_to_end(key)
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+        
+        while len(self._entries) > self.max_size:
+            old_key, (_, old_user_id, _) = self._entries.popitem(last=False)
+            self._discard_user_key(old_user_id, old_key)
+    
+    def invalidate_user(self, user_id: int):
+        """특정 사용자의 캐시 항목 전체 무효화"""
+        keys = self._keys_by_user.pop(user_id, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        if keys:
+            self.invalidations += 1
+            logger.info(f"🧹 토큰 캐시 무효화: user_id={user_id} ({len(keys)}건)")
+    
+    def clear(self):
+        """캐시 전체 비우기"""
+        self._entries.clear()
+        self._keys_by_user.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds
+        }
+    
+    def _remove(self, key: str, user_id: int):
+        self._entries.pop(key, None)
+        self._discard_user_key(user_id, key)
+    
+    def _discard_user_key(self, user_id: int, key: str):
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+# 프로세스 전역 캐시 인스턴스
+token_cache = TokenCache()
+
+
+class MemberChangeListener:
+    """
+    member-service가 보내는 NOTIFY(멤버 변경)를 수신하여 캐시 무효화
+    
+    연결이 끊기거나 처음 연결에 실패하면 백오프(TOKEN_CACHE_LISTENER_RETRY_MIN ~ _MAX초)로
+    다시 연결합니다. 끊긴 동안 놓친 알림이 있을 수 있으므로 연결이 끊길 때와
+    다시 구독할 때 캐시를 비웁니다. (재연결 전까지는 TTL만으로 만료)
+    """
+    
+    def __init__(
+        self,
+        database_url: str,
+        channel: str,
+        cache: TokenCache = token_cache,
+        retry_min: float = TOKEN_CACHE_LISTENER_RETRY_MIN,
+        retry_max: float = TOKEN_CACHE_LISTENER_RETRY_MAX
+    ):
+        # asyncpg는 SQLAlchemy 드라이버 접미사(+asyncpg 등)가 없는 DSN을 사용
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.channel = channel
+        self.cache = cache
+        self.retry_min = retry_min
+        self.retry_max = retry_max
+        self._conn: Optional[asyncpg.Connection] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopped = False
+        self.reconnects = 0
+    
+    @property
+    def is_listening(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+    
+    async def start(self):
+        """LISTEN 시작 (실패하면 백그라운드에서 재시도, 그동안 서비스는 TTL 캐시로 계속 동작)"""
+        self._stopped = False
+        try:
+            await self._connect()
+            logger.info(f"✅ 토큰 캐시 무효화 채널 구독: {self.channel}")
+        except Exception as e:
+            logger.warning(f"⚠️ 토큰 캐시 무효화 채널 구독 실패 (재시도 전까지 TTL 만료만 사용): {e}")
+            self._schedule_reconnect()
+    
+    async def stop(self):
+        """LISTEN 종료 (재연결 시도 중이면 중단)"""
+        self._stopped = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+            self._reconnect_task = None
+        if self._conn is not None and not self._conn.is_closed():
+            self._conn.remove_termination_listener(self._on_terminate)
+            await self._conn.close()
+        self._conn = None
+    
+    async def _connect(self):
+        conn = await asyncpg.connect(self.dsn)
+        try:
+            await conn.add_listener(self.channel, self._on_notify)
+        except Exception:
+            await conn.close()
+            raise
+        conn.add_termination_listener(self._on_terminate)
+        self._conn = conn
+    
+    def _schedule_reconnect(self):
+        if not self._stopped and (self._reconnect_task is None or self._reconnect_task.done()):
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+    
+    async def _reconnect(self):
+        """구독될 때까지 백오프로 재연결 (성공하면 끊긴 동안 놓친 알림 대신 캐시를 비움)"""
+        delay = self.retry_min
+        while not self._stopped:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect()
+            except Exception as e:
+                delay = min(delay * 2, self.retry_max)
+                logger.warning(f"⚠️ 토큰 캐시 무효화 채널 재연결 실패 ({delay:g}초 후 재시도): {e}")
+                continue
+            self.reconnects += 1
+            self.cache.clear()
+            logger.info(f"✅ 토큰 캐시 무효화 채널 재구독: {self.channel} - 캐시를 비웠습니다.")
+            return
+    
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            self.cache.invalidate_user(int(payload))
+        except ValueError:
+            logger.warning(f"잘못된 멤버 변경 알림 payload: {payload}")
+    
+    def _on_terminate(self, connection):
+        logger.warning("⚠️ 토큰 캐시 무효화 채널 연결 종료 - 캐시를 비우고 재연결합니다.")
+        self.cache.clear()
+        if connection is self._conn:
+            self._conn = None
+        self._schedule_reconnect()
@@ -0,0 +1,79 @@
+"""
+Calendar Service 팀 가용 시간 계산
+================================
+
+멤버별 일정 구간을 조회 범위로 자른 뒤 시작 시각 순으로 한 번 훑어(sweep line)
+겹치거나 맞닿은 구간을 바쁜 구간으로 병합하고, 그 사이를 빈 시간으로 계산합니다.
+
+- 멤버 전체가 비어 있는 시간은 모든 멤버의 바쁜 구간을 합쳐 같은 방식으로 계산
+- 구간은 [시작, 종료) (종료 시각이 다음 일정 시작 시각과 같으면 빈 시간 없음)
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+Interval = Tuple[datetime, datetime]
+
+
+def clip(intervals: Iterable[Interval], window_start: datetime, window_end: datetime) -> List[Interval]:
+    """조회 범위 [window_start, window_end) 안으로 자른 구간 (길이 0인 구간 제외)"""
+    clipped = []
+    for start, end in intervals:
+        start, end = max(start, window_start), min(end, window_end)
+        if start < end:
+            clipped.append((start, end))
+    return clipped
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """겹치거나 맞닿은 구간을 병합 (시작 시각 순 정렬 후 한 번 훑기)"""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_slots(
+    busy: List[Interval],
+    window_start: datetime,
+    window_end: datetime,
+    min_duration: timedelta = timedelta(0)
+) -> List[Interval]:
+    """병합된 바쁜 구간(시작 시각 순) 사이의 빈 시간 중 min_duration 이상인 구간"""
+    slots = []
+    cursor = window_start
+    for start, end in busy:
+        if start > cursor and start - cursor >= min_duration:
+            slots.append((cursor, start))
+        cursor = max(cursor, end)
+    if window_end > cursor and window_end - cursor >= min_duration:
+        slots.append((cursor, window_end))
+    return slots
+
+
+def team_availability(
+    intervals: Dict[int, List[Interval]],
+    window_start: datetime,
+    window_end: datetime,
+    min_duration: timedelta = timedelta(0)
+):
+    """
+    멤버별 바쁜 구간/빈 시간과 모든 멤버가 비어 있는 시간
+    
+    Args:
+        intervals: 멤버 ID별 일정 구간 (정렬/병합 전, 조회 범위 밖 포함 가능)
+    
+    Returns:
+        ({멤버 ID: (바쁜 구간, 빈 시간)}, 공통 빈 시간)
+    """
+    members = {}
+    for member_id, member_intervals in intervals.items():
+        busy = merge_intervals(clip(member_intervals, window_start, window_end))
+        members[member_id] = (busy, free_slots(busy, window_start, window_end, min_duration))
+    
+    team_busy = merge_intervals(interval for busy, _ in members.values() for interval in busy)
+    return members, free_slots(team_busy, window_start, window_end, min_duration)
@@ -2,12 +2,73 @@
 Calendar Service 모델 정의
 """
 
+import re
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
-from sqlalchemy.dialects.postgresql import JSONB
+from typing import Any, List, Optional
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.sql import func
 from .database import Base
 
+# 이벤트 타입 한글 표시
+EVENT_TYPE_DISPLAY = {
+    'vacation': '휴가',
+    'remote': '재택근무',
+    'business_trip': '출장',
+    'project': '프로젝트',
+    'education': '교육/세미나',
+    'meeting': '회의',
+    'other': '기타'
+}
+
+# 이벤트 타입 아이콘
+EVENT_TYPE_ICONS = {
+    'vacation': '🌴',
+    'remote': '🏠',
+    'business_trip': '✈️',
+    'project': '💼',
+    'education': '📚',
+    'meeting': '🤝',
+    'other': '📝'
+}
+
+def event_status(start_time: datetime, end_time: datetime, now: datetime) -> str:
+    """일정 상태 (now 기준 completed / ongoing / upcoming)"""
+    if end_time and end_time < now:
+        return "completed"
+    elif end_time and start_time <= now <= end_time:
+        return "ongoing"
+    else:
+        return "upcoming"
+
+# 참가자 항목 중 멤버 ID로 인식하는 값 (db/init/10_event_attendee_ids.sql과 동일)
+MEMBER_ID_PATTERN = re.compile(r"[0-9]{1,9}")
+
+def attendee_label(attendee: Any) -> str:
+    """참가자 항목 표시 문자열 ({"member_id": ..., "name": ...}이면 이름)"""
+    if isinstance(attendee, dict):
+        return str(attendee.get("name") or attendee.get("member_id", attendee.get("id", "")))
+    return str(attendee)
+
+def attendee_member_ids(attendees: Any) -> Optional[List[int]]:
+    """
+    참가자 정보에서 멤버 ID 추출 (정렬, 중복 제거, 없으면 None)
+    
+    멤버 ID(정수 또는 숫자 문자열)나 {"member_id": ...} / {"id": ...} 항목만 멤버로 인식하고,
+    이름 등 자유 입력 문자열은 표시용으로만 남김
+    """
+    if not isinstance(attendees, list):
+        return None
+    member_ids = set()
+    for attendee in attendees:
+        if isinstance(attendee, dict):
+            attendee = attendee.get("member_id", attendee.get("id"))
+        if isinstance(attendee, int) and not isinstance(attendee, bool):
+            attendee = str(attendee)
+        if isinstance(attendee, str) and MEMBER_ID_PATTERN.fullmatch(attendee.strip()):
+            member_ids.add(int(attendee))
+    return sorted(member_ids) or None
+
 class Event(Base):
     """팀 일정/이벤트 테이블 (calendar_schema.events)"""
     __tablename__ = "events"
@@ -33,12 +94,20 @@ class Event(Base):
     
     # 참가자 정보 (데이터베이스 구조에 맞게 JSONB 사용)
     attendees = Column(JSONB, nullable=True, comment="참가자 정보 (JSON 형태)")
+    # 참가자 멤버 ID (attendees에서 추출, GIN 인덱스로 "멤버 X가 참가하는 일정" 조회)
+    attendee_ids = Column(ARRAY(Integer), nullable=True, comment="참가자 멤버 ID")
     
     # 추가 필드
     is_all_day = Column(Boolean, default=False, comment="종일 일정 여부")
     is_recurring = Column(Boolean, default=False, comment="반복 일정 여부")
     recurrence_rule = Column(Text, nullable=True, comment="반복 규칙")
     
+    # 반복 일정 개별 수정 (override): 마스터 일정 ID / 수정 전 원래 발생 시작 시각
+    recurrence_parent_id = Column(
+        Integer, ForeignKey("calendar_schema.events.id", ondelete="CASCADE"), nullable=True, comment="반복 일정(마스터) ID"
+    )
+    recurrence_id = Column(DateTime, nullable=True, comment="원래 발생 시작 시각")
+    
     # 시스템 정보 (timezone 없이 설정)
     created_at = Column(DateTime, server_default=func.now(), comment="생성일시")
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), comment="수정일시")
@@ -75,41 +144,17 @@ class Event(Base):
     @property
     def status(self):
         """일정 상태 반환"""
-        now = datetime.now()
-        if self.end_time and self.end_time < now:
-            return "completed"
-        elif self.end_time and self.start_time <= now <= self.end_time:
-            return "ongoing"
-        else:
-            return "upcoming"
+        return event_status(self.start_time, self.end_time, datetime.now())
     
     @property
     def event_type_display(self):
         """이벤트 타입 한글 표시"""
-        type_map = {
-            'vacation': '휴가',
-            'remote': '재택근무',
-            'business_trip': '출장',
-            'project': '프로젝트',
-            'education': '교육/세미나',
-            'meeting': '회의',
-            'other': '기타'
-        }
-        return type_map.get(self.event_type, self.event_type)
+        return EVENT_TYPE_DISPLAY.get(self.event_type, self.event_type)
     
     @property
     def event_type_icon(self):
         """이벤트 타입 아이콘"""
-        icon_map = {
-            'vacation': '🌴',
-            'remote': '🏠',
-            'business_trip': '✈️',
-            'project': '💼',
-            'education': '📚',
-            'meeting': '🤝',
-            'other': '📝'
-        }
-        return icon_map.get(self.event_type, '📝')
+        return EVENT_TYPE_ICONS.get(self.event_type, '📝')
     
     @property
     def default_color(self):
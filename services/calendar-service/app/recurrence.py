@@ -0,0 +1,166 @@
+"""
+Calendar Service 반복 일정 전개
+===============================
+
+반복 일정(is_recurring + recurrence_rule)은 원본(마스터) 행 하나만 저장하고,
+조회 범위 [window_start, window_end) 안의 발생(occurrence)만 필요할 때 생성합니다.
+
+- recurrence_rule: RFC 5545 RRULE (예: "FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=20261231T000000")
+  또는 프론트엔드 단축값 daily / weekly / monthly / yearly
+  여러 줄 형식으로 제외 일시(EXDATE)와 추가 일시(RDATE)도 지정 가능
+      RRULE:FREQ=DAILY;COUNT=30
+      EXDATE:20261020T090000,20261021T090000
+- 특정 발생만 수정한 일정(override)은 recurrence_parent_id/recurrence_id(원래 발생 시작 시각)를 가진
+  별도 행으로 저장하며, 전개 시 해당 발생은 마스터에서 제외됨 (app/service.py)
+- 시각은 모두 timezone 없는 값(DB와 동일)으로 처리
+- 주기가 일정한 규칙(SECONDLY~WEEKLY, COUNT 없음)은 시작 시각을 조회 범위 직전 주기로 옮겨
+  시작 시각부터 조회 범위까지의 발생을 하나씩 건너뛰지 않음
+- 규칙 파싱 결과와 조회 범위별 발생 목록은 규칙/시작 시각/범위를 키로 캐시
+  (규칙이나 시작 시각이 바뀌면 키가 달라지므로 별도 무효화 불필요)
+"""
+
+import heapq
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import FrozenSet, Iterator, Optional, Tuple
+
+from dateutil.parser import parse as parse_datetime
+from dateutil.rrule import rrule, rrulestr
+
+# 캐시 크기 (파싱된 규칙 수 / 전개된 조회 범위 수)
+RECURRENCE_RULE_CACHE_SIZE = int(os.getenv("RECURRENCE_RULE_CACHE_SIZE", "4096"))
+RECURRENCE_WINDOW_CACHE_SIZE = int(os.getenv("RECURRENCE_WINDOW_CACHE_SIZE", "16384"))
+
+# 일정 하나가 조회 범위 안에서 만들 수 있는 최대 발생 수 (FREQ=MINUTELY 등 과도한 규칙 방지)
+RECURRENCE_MAX_OCCURRENCES = int(os.getenv("RECURRENCE_MAX_OCCURRENCES", "1000"))
+
+# 프론트엔드 반복 규칙 선택값
+RECURRENCE_SHORTCUTS = {
+    "daily": "FREQ=DAILY",
+    "weekly": "FREQ=WEEKLY",
+    "monthly": "FREQ=MONTHLY",
+    "yearly": "FREQ=YEARLY",
+}
+
+# 주기 길이가 일정한 FREQ (시작 시각을 주기 단위로 옮길 수 있음)
+FIXED_PERIODS = {
+    "SECONDLY": timedelta(seconds=1),
+    "MINUTELY": timedelta(minutes=1),
+    "HOURLY": timedelta(hours=1),
+    "DAILY": timedelta(days=1),
+    "WEEKLY": timedelta(weeks=1),
+}
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """파싱된 반복 규칙"""
+    rrules: Tuple[Tuple[rrule, Optional[timedelta]], ...]  # (RRULE, 주기 한 칸 길이 - 옮길 수 없으면 None)
+    rdates: Tuple[datetime, ...]
+    exdates: FrozenSet[datetime]
+
+
+def _parse_dates(value: str) -> Tuple[datetime, ...]:
+    return tuple(parse_datetime(item, ignoretz=True) for item in value.split(",") if item.strip())
+
+
+def _fixed_step(rule_value: str) -> Optional[timedelta]:
+    """COUNT 없는 고정 주기 규칙이면 주기 한 칸(INTERVAL 포함) 길이"""
+    parts = dict(part.split("=", 1) for part in rule_value.upper().split(";") if "=" in part)
+    period = FIXED_PERIODS.get(parts.get("FREQ"))
+    if period is None or "COUNT" in parts:
+        return None
+    return period * int(parts.get("INTERVAL", "1"))
+
+
+@lru_cache(maxsize=RECURRENCE_RULE_CACHE_SIZE)
+def compile_rule(rule: str, dtstart: datetime) -> CompiledRule:
+    """
+    반복 규칙 파싱
+    
+    Raises:
+        ValueError: 해석할 수 없는 규칙
+    """
+    rule = rule.strip()
+    rule = RECURRENCE_SHORTCUTS.get(rule.lower(), rule)
+    rrules, rdates, exdates = [], [], []
+    try:
+        for line in rule.replace("\r", "").split("\n"):
+            if not line.strip():
+                continue
+            name, value = line.split(":", 1) if ":" in line else ("RRULE", line)
+            name = name.split(";")[0].strip().upper()
+            if name == "RRULE":
+                rrules.append((rrulestr(value.strip(), dtstart=dtstart, ignoretz=True), _fixed_step(value)))
+            elif name == "RDATE":
+                rdates.extend(_parse_dates(value))
+            elif name == "EXDATE":
+                exdates.extend(_parse_dates(value))
+            elif name != "DTSTART":  # 시작 시각은 일정의 start_time 사용
+                raise ValueError(f"지원하지 않는 항목 {name}")
+    except (ValueError, TypeError, OverflowError) as e:
+        raise ValueError(f"반복 규칙을 해석할 수 없습니다: {rule} ({e})")
+    if not rrules:
+        raise ValueError(f"반복 규칙을 해석할 수 없습니다: {rule}")
+    return CompiledRule(tuple(rrules), tuple(sorted(rdates)), frozenset(exdates))
+
+
+def validate_rule(rule: Optional[str], dtstart: datetime):
+    """반복 규칙 검증 (생성/수정 시, 해석할 수 없으면 ValueError)"""
+    if rule:
+        compile_rule(rule, dtstart)
+
+
+def is_occurrence(rule: str, dtstart: datetime, moment: datetime) -> bool:
+    """moment가 반복 규칙의 발생 시각인지 확인"""
+    return moment in iter_occurrences(rule, dtstart, moment, moment + timedelta(microseconds=1))
+
+
+def _iter_rrule(rule: rrule, step: Optional[timedelta], dtstart: datetime, after: datetime) -> Iterator[datetime]:
+    """after 이후(포함) 발생 (고정 주기면 after 한 주기 전으로 시작 시각을 옮겨 앞부분 생략)"""
+    if step is not None and after - dtstart > step * 2:
+        # 옮긴 시작 시각 이전 요일(BYDAY 등)의 발생이 빠지지 않도록 한 주기 더 앞에서 시작
+        rule = rule.replace(dtstart=dtstart + step * ((after - dtstart) // step - 1))
+    return rule.xafter(after, inc=True)
+
+
+def iter_occurrences(rule: str, dtstart: datetime, after: datetime, before: datetime) -> Iterator[datetime]:
+    """after 이후(포함) ~ before 이전에 시작하는 발생 시각을 순서대로 생성 (EXDATE 제외, 중복 제거)"""
+    compiled = compile_rule(rule, dtstart)
+    streams = [_iter_rrule(rrule_, step, dtstart, after) for rrule_, step in compiled.rrules]
+    if compiled.rdates:
+        streams.append(iter(compiled.rdates))
+    
+    count, previous = 0, None
+    for occurrence in heapq.merge(*streams):
+        if occurrence >= before or count >= RECURRENCE_MAX_OCCURRENCES:
+            break
+        if occurrence < after or occurrence == previous or occurrence in compiled.exdates:
+            continue
+        previous = occurrence
+        count += 1
+        yield occurrence
+
+
+@lru_cache(maxsize=RECURRENCE_WINDOW_CACHE_SIZE)
+def occurrences_in_window(
+    rule: str,
+    dtstart: datetime,
+    duration: timedelta,
+    window_start: datetime,
+    window_end: datetime
+) -> Tuple[datetime, ...]:
+    """
+    조회 범위와 겹치는 발생 시작 시각 목록
+    
+    이벤트 조회와 같은 기준: 발생 시작 < window_end 이고 발생 종료(시작 + duration) >= window_start
+    """
+    return tuple(iter_occurrences(rule, dtstart, window_start - duration, window_end))
+
+
+def clear_recurrence_cache():
+    """규칙/조회 범위 캐시 비우기 (벤치마크용)"""
+    compile_rule.cache_clear()
+    occurrences_in_window.cache_clear()
@@ -2,29 +2,64 @@
 Calendar Service API 라우터
 """
 
-from typing import List, Optional
-from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, Query, Header, status
-from sqlalchemy.orm import Session
+from typing import Annotated, List, Optional, Literal
+from datetime import date, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from .database import get_db
+from .database import AsyncSessionLocal, get_db
 from .service import CalendarService
 from .schemas import (
     EventCreateInternal, EventUpdate, EventResponse, EventListResponse,
     EventStats, CalendarEventResponse, SearchParams, PaginationParams,
-    EventTypeEnum, EVENT_TYPES, EventCreate
+    EventTypeEnum, EVENT_TYPES, EventCreate, AvailabilityResponse,
+    EventBulkCreate, EventBulkResponse, NaiveDateTime
 )
 
+# shared 모듈 import를 위한 경로 추가
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.auth import AuthenticatedUser, get_current_user
+from shared.cache import cached
+from shared.export import ExportFormat, export_response
+
 router = APIRouter(prefix="/events", tags=["events"])
 
-def get_calendar_service(db: Session = Depends(get_db)) -> CalendarService:
+def get_calendar_service(db: AsyncSession = Depends(get_db)) -> CalendarService:
     return CalendarService(db)
 
-def get_current_user_id(x_user_id: int = Header(..., alias="X-User-ID")) -> int:
-    return x_user_id
+def get_current_user_id(user: AuthenticatedUser = Depends(get_current_user)) -> int:
+    return user.user_id
+
+def get_current_user_role(user: AuthenticatedUser = Depends(get_current_user)) -> str:
+    return user.role
 
-def get_current_user_role(x_user_role: str = Header(..., alias="X-User-Role")) -> str:
-    return x_user_role
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    strip_weak = lambda tag: tag.strip().removeprefix("W/")
+    return strip_weak(etag) in {strip_weak(tag) for tag in if_none_match.split(",")}
+
+async def check_calendar_etag(
+    request: Request,
+    response: Response,
+    start: date = Query(...),
+    end: date = Query(...),
+    member_id: Optional[int] = Query(None),
+    attendee_id: Optional[int] = Query(None),
+    service: CalendarService = Depends(get_calendar_service)
+):
+    """달력 조회 범위가 변경되지 않았으면 304 (If-None-Match), 아니면 응답에 ETag 설정"""
+    etag = await service.get_calendar_etag(start, end, member_id, attendee_id)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
 
 @router.post("/", response_model=EventResponse, summary="이벤트 생성")
 async def create_event(
@@ -34,7 +69,20 @@ async def create_event(
 ):
     create_data = EventCreate(**event_data.model_dump(), created_by=current_user_id)
     try:
-        return service.create_event(create_data)
+        return await service.create_event(create_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/bulk", response_model=EventBulkResponse, summary="이벤트 일괄 생성")
+async def create_events(
+    bulk_data: EventBulkCreate,
+    service: CalendarService = Depends(get_calendar_service),
+    current_user_id: int = Depends(get_current_user_id)
+):
+    """검사에 실패한 항목만 제외하고 나머지는 한 번에 저장 (항목별 결과 반환)"""
+    items = [EventCreate(**item.model_dump(), created_by=current_user_id) for item in bulk_data.items]
+    try:
+        return await service.create_events(items)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -45,49 +93,102 @@ async def get_events(
     q: str = Query(None),
     event_type: EventTypeEnum = Query(None),
     member_id: Optional[int] = Query(None),
+    attendee_id: Optional[int] = Query(None, description="참가자(멤버 ID)로 필터"),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    count: Literal["exact", "estimate", "none"] = Query("exact", description="전체 개수 계산 방식"),
     service: CalendarService = Depends(get_calendar_service)
 ):
-    pagination = PaginationParams(skip=skip, limit=limit)
+    pagination = PaginationParams(skip=skip, limit=limit, cursor=cursor, count=count)
     search_params = None
-    if any([q, event_type, member_id, start_date, end_date]):
+    if any([q, event_type, member_id, attendee_id, start_date, end_date]):
         search_params = SearchParams(
-            q=q, event_type=event_type, member_id=member_id,
+            q=q, event_type=event_type, member_id=member_id, attendee_id=attendee_id,
             start_date=start_date, end_date=end_date
         )
-    return service.get_events(pagination, search_params)
+    try:
+        return await service.get_events(pagination, search_params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/calendar", response_model=List[CalendarEventResponse], summary="달력용 이벤트 조회")
+@router.get(
+    "/calendar", response_model=List[CalendarEventResponse], summary="달력용 이벤트 조회",
+    dependencies=[Depends(check_calendar_etag)]
+)
+@cached("events")
 async def get_calendar_events(
     start: date = Query(...),
     end: date = Query(...),
     member_id: Optional[int] = Query(None),
+    attendee_id: Optional[int] = Query(None, description="참가자(멤버 ID)로 필터"),
+    service: CalendarService = Depends(get_calendar_service)
+):
+    return await service.get_events_for_calendar(start, end, member_id, attendee_id)
+
+@router.get("/availability", response_model=AvailabilityResponse, summary="팀 가용 시간 (빈 시간) 조회")
+@cached("events")
+async def get_availability(
+    # 시각은 Annotated로 지정해야 NaiveDateTime 변환(AfterValidator)이 쿼리 파라미터에도 적용됨
+    member_ids: Annotated[List[int], Query(description="멤버 ID (여러 번 지정)")],
+    start: Annotated[NaiveDateTime, Query(description="조회 시작 시각 (시간대가 있으면 UTC 기준으로 변환)")],
+    end: Annotated[NaiveDateTime, Query(description="조회 종료 시각 (시간대가 있으면 UTC 기준으로 변환)")],
+    event_types: Optional[List[EventTypeEnum]] = Query(None, description="바쁜 시간으로 볼 일정 타입 (기본: 휴가/출장/회의/교육)"),
+    min_minutes: int = Query(0, ge=0, le=1440, description="이 길이(분) 이상인 빈 시간만"),
     service: CalendarService = Depends(get_calendar_service)
 ):
-    return service.get_events_for_calendar(start, end, member_id)
+    try:
+        return await service.get_availability(
+            member_ids, start, end,
+            event_types=[event_type.value for event_type in event_types] if event_types else None,
+            min_duration=timedelta(minutes=min_minutes)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/export", summary="이벤트 내보내기 (NDJSON/CSV 스트리밍)")
+async def export_events(
+    format: ExportFormat = Query("ndjson", description="ndjson / csv"),
+    q: str = Query(None),
+    event_type: EventTypeEnum = Query(None),
+    member_id: Optional[int] = Query(None),
+    attendee_id: Optional[int] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    service: CalendarService = Depends(get_calendar_service),
+    current_user_id: int = Depends(get_current_user_id)
+):
+    search_params = SearchParams(
+        q=q, event_type=event_type, member_id=member_id, attendee_id=attendee_id,
+        start_date=start_date, end_date=end_date
+    )
+    return export_response(AsyncSessionLocal, service.export_query(search_params), "events", format)
 
 @router.get("/today", response_model=List[EventResponse], summary="오늘 일정")
 async def get_today_events(service: CalendarService = Depends(get_calendar_service)):
-    return service.get_today_events()
+    return await service.get_today_events()
 
 @router.get("/upcoming", response_model=List[EventResponse], summary="다가오는 일정")
 async def get_upcoming_events(
     days: int = Query(7, ge=1, le=30),
     service: CalendarService = Depends(get_calendar_service)
 ):
-    return service.get_upcoming_events(days)
+    return await service.get_upcoming_events(days)
 
 @router.get("/search", response_model=List[EventResponse], summary="이벤트 검색")
 async def search_events(
     q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
     service: CalendarService = Depends(get_calendar_service)
 ):
-    return service.search_events(q)
+    try:
+        return await service.search_events(q, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/stats", response_model=EventStats, summary="이벤트 통계")
 async def get_event_stats(service: CalendarService = Depends(get_calendar_service)):
-    return service.get_event_stats()
+    return await service.get_event_stats()
 
 @router.get("/types", summary="이벤트 타입 목록")
 async def get_event_types():
@@ -95,7 +196,7 @@ async def get_event_types():
 
 @router.get("/{event_id}", response_model=EventResponse, summary="이벤트 조회")
 async def get_event(event_id: int, service: CalendarService = Depends(get_calendar_service)):
-    event = service.get_event(event_id)
+    event = await service.get_event(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
     return event
@@ -108,15 +209,15 @@ async def update_event(
     current_user_id: int = Depends(get_current_user_id),
     current_user_role: str = Depends(get_current_user_role)
 ):
-    existing_event = service.get_event(event_id)
+    existing_event = await service.get_event(event_id)
     if not existing_event:
         raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
     
-    if existing_event.created_by != current_user_id and current_user_role != "admin":
+    if existing_event.created_by != current_user_id and current_user_role.lower() != "admin":
         raise HTTPException(status_code=403, detail="권한이 없습니다.")
     
     try:
-        return service.update_event(event_id, event_data)
+        return await service.update_event(event_id, event_data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -127,14 +228,14 @@ async def delete_event(
     current_user_id: int = Depends(get_current_user_id),
     current_user_role: str = Depends(get_current_user_role)
 ):
-    existing_event = service.get_event(event_id)
+    existing_event = await service.get_event(event_id)
     if not existing_event:
         raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
     
-    if existing_event.created_by != current_user_id and current_user_role != "admin":
+    if existing_event.created_by != current_user_id and current_user_role.lower() != "admin":
         raise HTTPException(status_code=403, detail="권한이 없습니다.")
     
-    success = service.delete_event(event_id)
+    success = await service.delete_event(event_id)
     if not success:
         raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다.")
     return {"message": "이벤트가 삭제되었습니다."}
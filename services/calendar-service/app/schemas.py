@@ -2,11 +2,25 @@
 Calendar Service Pydantic 스키마 정의
 """
 
-from datetime import datetime, date
-from typing import Optional, List, Union, Any
-from pydantic import BaseModel, Field
+from datetime import datetime, date, timezone
+from typing import Annotated, Optional, List, Union, Any, Literal
+from pydantic import AfterValidator, BaseModel, Field
 from enum import Enum
 
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    시간대가 있는 시각(...Z, +09:00)을 UTC 기준 timezone 없는 값으로 변환 (시간대가 없으면 그대로)
+    
+    events 테이블은 TIMESTAMP(timezone 없음)이고 asyncpg는 시간대가 있는 값을 바인딩하지 못함
+    (psycopg2 때는 PostgreSQL이 세션 시간대(UTC)로 변환하던 것과 같은 결과)
+    """
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+# 요청으로 받는 시각 (DB 기준 timezone 없는 값으로 정규화)
+NaiveDateTime = Annotated[datetime, AfterValidator(to_naive_utc)]
+
 class EventTypeEnum(str, Enum):
     """이벤트 타입 열거형"""
     vacation = "vacation"
@@ -22,13 +36,15 @@ class EventBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=200, description="일정 제목")
     description: Optional[str] = Field(None, description="일정 설명")
     event_type: EventTypeEnum = Field(default=EventTypeEnum.other, description="일정 타입")
-    start_time: datetime = Field(..., description="시작 시간")
-    end_time: datetime = Field(..., description="종료 시간")
+    start_time: NaiveDateTime = Field(..., description="시작 시간")
+    end_time: NaiveDateTime = Field(..., description="종료 시간")
     is_all_day: bool = Field(default=False, description="종일 일정 여부")
     location: Optional[str] = Field(None, max_length=200, description="장소")
-    attendees: Optional[Union[List[str], List[dict]]] = Field(None, description="참가자 정보 (JSON 형태)")
+    attendees: Optional[List[Union[int, str, dict]]] = Field(None, description="참가자 정보 (이름/멤버 ID/{member_id, name} 목록)")
     is_recurring: bool = Field(default=False, description="반복 일정 여부")
-    recurrence_rule: Optional[str] = Field(None, description="반복 규칙")
+    recurrence_rule: Optional[str] = Field(None, description="반복 규칙 (RRULE 또는 daily/weekly/monthly/yearly)")
+    recurrence_parent_id: Optional[int] = Field(None, description="반복 일정의 특정 발생을 수정한 일정이면 반복 일정 ID")
+    recurrence_id: Optional[NaiveDateTime] = Field(None, description="수정한 발생의 원래 시작 시간")
 
 class EventCreate(EventBase):
     """이벤트 생성 스키마"""
@@ -43,13 +59,13 @@ class EventUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200, description="일정 제목")
     description: Optional[str] = Field(None, description="일정 설명")
     event_type: Optional[EventTypeEnum] = Field(None, description="일정 타입")
-    start_time: Optional[datetime] = Field(None, description="시작 시간")
-    end_time: Optional[datetime] = Field(None, description="종료 시간")
+    start_time: Optional[NaiveDateTime] = Field(None, description="시작 시간")
+    end_time: Optional[NaiveDateTime] = Field(None, description="종료 시간")
     is_all_day: Optional[bool] = Field(None, description="종일 일정 여부")
     location: Optional[str] = Field(None, max_length=200, description="장소")
-    attendees: Optional[Union[List[str], List[dict]]] = Field(None, description="참가자 정보 (JSON 형태)")
+    attendees: Optional[List[Union[int, str, dict]]] = Field(None, description="참가자 정보 (이름/멤버 ID/{member_id, name} 목록)")
     is_recurring: Optional[bool] = Field(None, description="반복 일정 여부")
-    recurrence_rule: Optional[str] = Field(None, description="반복 규칙")
+    recurrence_rule: Optional[str] = Field(None, description="반복 규칙 (RRULE 또는 daily/weekly/monthly/yearly)")
 
 class CreatorInfo(BaseModel):
     """생성자 정보 (다른 서비스에서 가져온 정보)"""
@@ -70,9 +86,12 @@ class EventResponse(BaseModel):
     end_time: datetime
     is_all_day: bool
     location: Optional[str] = None
-    attendees: Optional[Union[List[str], List[dict]]] = None
+    attendees: Optional[List[Union[int, str, dict]]] = None
+    attendee_ids: Optional[List[int]] = Field(None, description="참가자 멤버 ID (attendees에서 추출)")
     is_recurring: bool
     recurrence_rule: Optional[str] = None
+    recurrence_parent_id: Optional[int] = None
+    recurrence_id: Optional[datetime] = None
     created_by: int
     created_at: datetime
     updated_at: datetime
@@ -97,9 +116,27 @@ class EventResponse(BaseModel):
 
 class EventListResponse(BaseModel):
     """이벤트 목록 응답 스키마"""
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (count=none이면 생략)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 없음)")
     events: List[EventResponse]
 
+class EventBulkCreate(BaseModel):
+    """이벤트 일괄 생성 요청 스키마 (created_by는 헤더에서 추출)"""
+    items: List[EventCreateInternal] = Field(..., min_length=1, max_length=500, description="생성할 일정 목록 (최대 500개)")
+
+class EventBulkResult(BaseModel):
+    """이벤트 일괄 생성 항목별 결과"""
+    index: int = Field(description="요청 items에서의 위치")
+    success: bool
+    error: Optional[str] = Field(None, description="실패 사유")
+    event: Optional[EventResponse] = None
+
+class EventBulkResponse(BaseModel):
+    """이벤트 일괄 생성 응답 스키마"""
+    created: int
+    failed: int
+    results: List[EventBulkResult]
+
 class EventStats(BaseModel):
     """이벤트 통계 스키마"""
     total_events: int
@@ -128,11 +165,31 @@ class CalendarEventResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TimeSlot(BaseModel):
+    """시간 구간 [start, end)"""
+    start: datetime
+    end: datetime
+
+class MemberAvailability(BaseModel):
+    """멤버 가용 시간"""
+    member_id: int
+    busy: List[TimeSlot] = Field(default_factory=list, description="병합된 바쁜 구간")
+    free: List[TimeSlot] = Field(default_factory=list, description="빈 시간")
+
+class AvailabilityResponse(BaseModel):
+    """팀 가용 시간 응답 스키마"""
+    start: datetime
+    end: datetime
+    event_types: List[str] = Field(..., description="바쁜 시간으로 계산한 일정 타입")
+    members: List[MemberAvailability]
+    common_free: List[TimeSlot] = Field(default_factory=list, description="요청한 멤버 모두 비어 있는 시간")
+
 class SearchParams(BaseModel):
     """검색 파라미터"""
     q: Optional[str] = Field(None, description="검색 키워드")
     event_type: Optional[EventTypeEnum] = Field(None, description="이벤트 타입 필터")
     member_id: Optional[int] = Field(None, description="생성자 필터")
+    attendee_id: Optional[int] = Field(None, description="참가자 필터 (멤버 ID)")
     start_date: Optional[date] = Field(None, description="시작 날짜 필터")
     end_date: Optional[date] = Field(None, description="종료 날짜 필터")
 
@@ -140,6 +197,8 @@ class PaginationParams(BaseModel):
     """페이지네이션 파라미터"""
     skip: int = Field(default=0, ge=0, description="건너뛸 개수")
     limit: int = Field(default=100, ge=1, le=1000, description="가져올 개수")
+    cursor: Optional[str] = Field(default=None, description="이전 응답의 next_cursor (지정 시 skip 대신 사용)")
+    count: Literal["exact", "estimate", "none"] = Field(default="exact", description="전체 개수 계산 방식")
 
 # 이벤트 타입 상수
 EVENT_TYPES = [
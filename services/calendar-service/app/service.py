@@ -2,14 +2,27 @@
 Calendar Service 비즈니스 로직
 """
 
+import os
+import time
+import hashlib
+import logging
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import DateTime, select, insert, desc, and_, or_, func, update, literal, literal_column, null
 import colorsys
 
-from .models import Event
+from .models import Event, EVENT_TYPE_DISPLAY, EVENT_TYPE_ICONS, attendee_label, attendee_member_ids, event_status
+from .availability import team_availability
+from .recurrence import is_occurrence, occurrences_in_window, validate_rule
 from .schemas import (
+    AvailabilityResponse,
+    MemberAvailability,
+    TimeSlot,
+    EventBulkResponse,
+    EventBulkResult,
     EventCreate, 
     EventUpdate, 
     EventResponse,
@@ -21,67 +34,339 @@ from .schemas import (
     CreatorInfo
 )
 
+# shared 모듈 import를 위한 경로 추가
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.cache import response_cache
+from shared.members import attach_members
+from shared.pagination import paginate
+from shared.search import ilike_any, search
+
+logger = logging.getLogger(__name__)
+
+# 목록 정렬 키: 최신 순 (마지막은 고유 키, cursor 페이지네이션 기준)
+EVENT_ORDER = ((Event.start_time, True), (Event.id, True))
+
+# 검색 컬럼과 순위 가중치 (db/init/05_search_indexes.sql의 트라이그램 인덱스 대상)
+EVENT_SEARCH_COLUMNS = (
+    (Event.title, 1.0),
+    (Event.location, 0.6),
+    (Event.description, 0.5),
+)
+
+# 이벤트 통계 캐시 (대시보드 폴링 시 매번 DB를 조회하지 않도록)
+EVENT_STATS_CACHE_TTL_SECONDS = float(os.getenv("EVENT_STATS_CACHE_TTL_SECONDS", "10"))
+_event_stats_cache: List[Any] = [0.0, None]  # [캐시 시각(monotonic), EventStats]
+
+def invalidate_event_stats_cache():
+    """이벤트 변경 시 통계 캐시 무효화"""
+    _event_stats_cache[:] = [0.0, None]
+
+# 달력 조회에 필요한 컬럼만 조회 (ORM 객체 생성 생략)
+CALENDAR_EVENT_COLUMNS = (
+    Event.id, Event.title, Event.event_type, Event.start_time, Event.end_time, Event.is_all_day,
+    Event.description, Event.location, Event.attendees, Event.created_by,
+    Event.recurrence_parent_id, Event.recurrence_id, Event.is_recurring, Event.recurrence_rule
+)
+
+# 가용 시간 계산: 기본으로 바쁜 시간으로 보는 일정 타입 (재택근무/프로젝트/기타는 참석 가능으로 간주)
+AVAILABILITY_BUSY_TYPES = ("vacation", "business_trip", "meeting", "education")
+AVAILABILITY_COLUMNS = (
+    Event.id, Event.start_time, Event.end_time, Event.created_by, Event.attendee_ids,
+    Event.is_recurring, Event.recurrence_rule
+)
+# 한 번에 조회할 수 있는 최대 멤버 수 / 최대 기간 (일)
+AVAILABILITY_MAX_MEMBERS = int(os.getenv("AVAILABILITY_MAX_MEMBERS", "50"))
+AVAILABILITY_MAX_DAYS = int(os.getenv("AVAILABILITY_MAX_DAYS", "31"))
+
+@lru_cache(maxsize=4096)
+def member_color(member_id: int) -> str:
+    """팀원 ID 기반 동적 색상 생성 (멤버별로 한 번만 계산)"""
+    # HSL 색상 생성 (프론트엔드와 동일한 로직)
+    hue = (member_id * 137.508) % 360
+    saturation = 45 + (member_id % 15)  # 45-60% 채도로 부드러운 색상
+    lightness = 60 + (member_id % 15)   # 60-75% 명도로 옅은 색상
+    
+    # HSL을 HEX로 변환
+    h, s, l = hue / 360, saturation / 100, lightness / 100
+    r, g, b = colorsys.hls_to_rgb(h, l, s)
+    return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+
+def to_calendar_events(items, now: datetime) -> List[CalendarEventResponse]:
+    """
+    (조회 행, 발생 시작 시각) 목록(expand_recurring_rows 결과)을 FullCalendar 응답으로 일괄 변환
+    
+    발생 시작 시각이 None이면 일반 일정(또는 개별 수정 일정), 있으면 반복 일정의 발생입니다.
+    제목/색상/참가자 등 발생마다 같은 값은 원본 행마다 한 번만 계산하고, 상태 기준 시각은 호출 시 한 번만 정합니다.
+    """
+    calendar_events = []
+    common_by_row = {}
+    for row, occurrence in items:
+        (event_id, title, event_type, start_time, end_time, is_all_day, description, location, attendees,
+         created_by, recurrence_parent_id, recurrence_id, is_recurring, recurrence_rule) = row
+        common = common_by_row.get(event_id)
+        if common is None:
+            common = common_by_row[event_id] = (
+                f"{EVENT_TYPE_ICONS.get(event_type, '📝')} {title}",
+                member_color(created_by),
+                EVENT_TYPE_DISPLAY.get(event_type, event_type),
+                ', '.join(attendee_label(attendee) for attendee in attendees if attendee) if isinstance(attendees, list) else '',
+                end_time - start_time
+            )
+        display_title, color, event_type_display, participants, duration = common
+        
+        if occurrence is None:
+            start = start_time.isoformat()
+            calendar_id, series_id = str(event_id), recurrence_parent_id
+            recurrence_iso = recurrence_id.isoformat() if recurrence_id else None
+        else:
+            # 반복 일정의 발생: id는 "반복 일정 ID@원래 시작 시각", series_id는 반복 일정 ID
+            start_time, end_time = occurrence, occurrence + duration
+            start = recurrence_iso = start_time.isoformat()
+            calendar_id, series_id = f"{event_id}@{start}", event_id
+        
+        calendar_events.append(CalendarEventResponse(
+            id=calendar_id,
+            title=display_title,
+            start=start,
+            end=end_time.isoformat() if end_time else None,
+            allDay=is_all_day,
+            backgroundColor=color,
+            borderColor=color,
+            textColor='white',
+            extendedProps={
+                'event_type': event_type,
+                'event_type_display': event_type_display,
+                'description': description,
+                'location': location,
+                'participants': participants,
+                'attendees': attendees,
+                'creator_id': created_by,
+                'duration_minutes': int(duration.total_seconds() / 60),
+                'status': event_status(start_time, end_time, now),
+                'is_recurring': is_recurring,
+                'recurrence_rule': recurrence_rule,
+                'series_id': series_id,
+                'recurrence_id': recurrence_iso
+            }
+        ))
+    return calendar_events
+
+def expand_recurring_rows(rows, overridden, window_start: datetime, window_end: datetime):
+    """
+    조회 행을 (행, 발생 시작 시각) 목록으로 전개 (시작 시각 순)
+    
+    반복 일정(마스터) 행은 조회 범위 안의 발생마다 한 항목이 되고, 일반 일정/개별 수정 일정 행은 (행, None)입니다.
+    overridden((반복 일정 ID, 원래 시작 시각))에 있는 발생은 개별 수정 일정 행이 대신하므로 제외합니다.
+    """
+    expanded = []
+    for row in rows:
+        event_id, start_time, end_time = row.id, row.start_time, row.end_time
+        if not (row.is_recurring and row.recurrence_rule):
+            expanded.append((start_time, row, None))
+            continue
+        
+        try:
+            occurrences = occurrences_in_window(
+                row.recurrence_rule, start_time, end_time - start_time, window_start, window_end
+            )
+        except ValueError as e:
+            # 해석할 수 없는 기존 규칙은 원본 일정만 표시
+            logger.warning(f"⚠️ 반복 규칙 전개 실패 (이벤트 {event_id}): {e}")
+            if start_time < window_end and end_time >= window_start:
+                expanded.append((start_time, row, None))
+            continue
+        
+        expanded.extend(
+            (occurrence, row, occurrence) for occurrence in occurrences
+            if (event_id, occurrence) not in overridden
+        )
+    
+    expanded.sort(key=itemgetter(0))
+    return [(row, occurrence) for _, row, occurrence in expanded]
+
+def calendar_window(start_date: date, end_date: date):
+    """달력 조회 범위 [start_date 00:00, end_date 다음날 00:00)"""
+    return (
+        datetime.combine(start_date, datetime.min.time()),
+        datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+    )
+
+# 이벤트 기간 [start_time, end_time] (db/init/09_event_range_indexes.sql의 GiST 인덱스와 같은 식)
+# 범위 경계 '[]'는 바인드 파라미터가 아닌 상수로 넣어야 prepared statement에서도 인덱스 식과 일치
+EVENT_TIME_RANGE = func.tsrange(Event.start_time, Event.end_time, literal_column("'[]'"))
+
+def overlaps_window(window_start: Optional[datetime], window_end: Optional[datetime]):
+    """
+    이벤트 기간이 [window_start, window_end)와 겹치는 조건 (None이면 해당 쪽 제한 없음)
+    
+    start_time < window_end AND end_time >= window_start 와 같은 결과를
+    범위 연산자(&&)로 표현해 GiST 인덱스(idx_events_time_range)로 처리
+    """
+    if window_start is not None and window_end is not None and window_end < window_start:
+        window_end = window_start  # 시작 > 끝이면 빈 범위 (tsrange는 경계가 뒤집히면 오류)
+    window = func.tsrange(literal(window_start, DateTime), literal(window_end, DateTime), literal_column("'[)'"))
+    return EVENT_TIME_RANGE.op("&&")(window)
+
+def attended_by(member_id: int):
+    """멤버가 참가자인 이벤트 조건 (attendee_ids @> ARRAY[member_id], GIN 인덱스 idx_events_attendee_ids)"""
+    return Event.attendee_ids.contains([member_id])
+
 class CalendarService:
     """캘린더 서비스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def create_event(self, event_data: EventCreate) -> EventResponse:
-        """이벤트 생성"""
+    def _validate_create(self, event_data: EventCreate, parent: Optional[Event] = None):
+        """
+        생성 요청 검사 (시간, 반복 규칙, 개별 수정 대상 발생)
+        
+        Args:
+            parent: 개별 수정 일정이면 recurrence_parent_id의 반복 일정 (호출하는 쪽에서 미리 조회, 없으면 None)
+        """
         # 시간 유효성 검사
         if event_data.end_time and event_data.start_time >= event_data.end_time:
             raise ValueError("종료 시간은 시작 시간보다 늦어야 합니다.")
         
-        # 이벤트 생성
-        event = Event(
-            title=event_data.title,
-            description=event_data.description,
-            event_type=event_data.event_type.value,
-            start_time=event_data.start_time,
-            end_time=event_data.end_time,
-            is_all_day=event_data.is_all_day,
-            location=event_data.location,
-            is_recurring=event_data.is_recurring,
-            recurrence_rule=event_data.recurrence_rule,
-            created_by=event_data.created_by
-        )
+        # 반복 규칙 / 개별 수정 대상 발생 검사
+        if event_data.is_recurring:
+            validate_rule(event_data.recurrence_rule, event_data.start_time)
+        if event_data.recurrence_parent_id is not None:
+            self._validate_override(parent, event_data.recurrence_id)
+            if event_data.is_recurring:
+                raise ValueError("반복 일정의 개별 수정 일정은 반복 일정일 수 없습니다.")
+    
+    def _event_values(self, event_data: EventCreate) -> Dict[str, Any]:
+        """생성 요청의 컬럼 값 (일괄 INSERT가 한 문장이 되도록 항목마다 같은 컬럼)"""
+        return {
+            "title": event_data.title,
+            "description": event_data.description,
+            "event_type": event_data.event_type.value,
+            "start_time": event_data.start_time,
+            "end_time": event_data.end_time,
+            "is_all_day": event_data.is_all_day,
+            "location": event_data.location,
+            "is_recurring": event_data.is_recurring,
+            "recurrence_rule": event_data.recurrence_rule,
+            "recurrence_parent_id": event_data.recurrence_parent_id,
+            "recurrence_id": event_data.recurrence_id if event_data.recurrence_parent_id is not None else None,
+            "created_by": event_data.created_by,
+            # attendees 처리 (리스트나 딕셔너리 형태, 없으면 JSON null이 아닌 NULL)
+            "attendees": event_data.attendees or null(),
+            "attendee_ids": attendee_member_ids(event_data.attendees) if event_data.attendees else None,
+        }
+    
+    async def create_event(self, event_data: EventCreate) -> EventResponse:
+        """이벤트 생성"""
+        parent = None
+        if event_data.recurrence_parent_id is not None:
+            parent = await self.db.get(Event, event_data.recurrence_parent_id)
+        self._validate_create(event_data, parent)
         
-        # attendees 처리 (리스트나 딕셔너리 형태)
-        if event_data.attendees:
-            event.attendees = event_data.attendees
+        # 이벤트 생성
+        event = Event(**self._event_values(event_data))
         
         self.db.add(event)
-        self.db.commit()
-        self.db.refresh(event)
+        await self._touch_series(event.recurrence_parent_id)
+        await self.db.commit()
+        invalidate_event_stats_cache()
+        await response_cache.invalidate("events")
+        await self.db.refresh(event)
         
-        return self._to_response(event)
+        return (await self._with_creators([self._to_response(event)]))[0]
     
-    def get_event(self, event_id: int) -> Optional[EventResponse]:
+    async def create_events(self, items: List[EventCreate]) -> EventBulkResponse:
+        """
+        이벤트 일괄 생성 (항목별 결과)
+        
+        - 항목마다 create_event와 같은 검사, 실패한 항목만 제외하고 나머지는
+          다중 행 INSERT ... RETURNING 한 번으로 저장 (한 트랜잭션)
+        - 개별 수정 대상 반복 일정과 이미 수정된 발생은 쿼리 한 번씩으로 미리 읽어
+          항목 검사에 사용 (항목마다 조회하지 않음)
+        - 수정 시각 갱신(_touch_series)과 캐시 무효화는 일괄 한 번
+        """
+        parent_ids = {item.recurrence_parent_id for item in items if item.recurrence_parent_id is not None}
+        parents_by_id: Dict[int, Event] = {}
+        taken = set()
+        if parent_ids:
+            parents_by_id = {
+                parent.id: parent
+                for parent in (await self.db.scalars(select(Event).filter(Event.id.in_(parent_ids)))).all()
+            }
+            taken = set((await self.db.execute(
+                select(Event.recurrence_parent_id, Event.recurrence_id).filter(Event.recurrence_parent_id.in_(parent_ids))
+            )).all())
+        
+        results: Dict[int, EventBulkResult] = {}
+        rows = []  # (요청 위치, INSERT 값)
+        for index, item in enumerate(items):
+            try:
+                self._validate_create(item, parents_by_id.get(item.recurrence_parent_id))
+                override = (item.recurrence_parent_id, item.recurrence_id)
+                if item.recurrence_parent_id is not None:
+                    if override in taken:
+                        raise ValueError("이미 개별 수정된 발생입니다.")
+                    taken.add(override)
+            except ValueError as e:
+                results[index] = EventBulkResult(index=index, success=False, error=str(e))
+                continue
+            rows.append((index, self._event_values(item)))
+        
+        if rows:
+            events = (await self.db.scalars(
+                insert(Event).returning(Event, sort_by_parameter_order=True),
+                [values for _, values in rows]
+            )).all()
+            await self._touch_series(*{values["recurrence_parent_id"] for _, values in rows})
+            await self.db.commit()
+            invalidate_event_stats_cache()
+            await response_cache.invalidate("events")
+            
+            responses = await self._with_creators([self._to_response(event) for event in events])
+            for (index, _), response in zip(rows, responses):
+                results[index] = EventBulkResult(index=index, success=True, event=response)
+            logger.info(f"📥 일정 일괄 생성: {len(rows)}개 저장, {len(items) - len(rows)}개 실패")
+        
+        return EventBulkResponse(
+            created=len(rows),
+            failed=len(items) - len(rows),
+            results=[results[index] for index in range(len(items))]
+        )
+    
+    async def get_event(self, event_id: int) -> Optional[EventResponse]:
         """이벤트 단일 조회"""
-        event = self.db.query(Event).filter(Event.id == event_id).first()
+        event = await self.db.get(Event, event_id)
         
         if not event:
             return None
             
-        return self._to_response(event)
+        return (await self._with_creators([self._to_response(event)]))[0]
     
-    def get_events(self, params: PaginationParams, search_params: Optional[SearchParams] = None) -> EventListResponse:
+    async def get_events(self, params: PaginationParams, search_params: Optional[SearchParams] = None) -> EventListResponse:
         """이벤트 목록 조회"""
-        query = self.db.query(Event)
+        query = self._apply_filters(select(Event), search_params)
         
+        # 정렬(최신 순) + 페이지네이션 적용
+        page = await paginate(
+            self.db, query, EVENT_ORDER, params.limit,
+            skip=params.skip, cursor=params.cursor, count=params.count
+        )
+        
+        return EventListResponse(
+            total=page.total,
+            next_cursor=page.next_cursor,
+            events=await self._with_creators([self._to_response(event) for event in page.items])
+        )
+    
+    def _apply_filters(self, query, search_params: Optional[SearchParams]):
+        """목록/내보내기 공통 검색 조건"""
         # 검색 조건 적용
         if search_params:
             # 키워드 검색
             if search_params.q:
-                search_term = f"%{search_params.q}%"
-                query = query.filter(
-                    or_(
-                        Event.title.ilike(search_term),
-                        Event.description.ilike(search_term),
-                        Event.location.ilike(search_term)
-                    )
-                )
+                query = query.filter(ilike_any(search_params.q, [column for column, _ in EVENT_SEARCH_COLUMNS]))
             
             # 이벤트 타입 필터
             if search_params.event_type:
@@ -91,71 +376,169 @@ class CalendarService:
             if search_params.member_id:
                 query = query.filter(Event.created_by == search_params.member_id)
             
+            # 참가자 필터 (GIN 인덱스)
+            if search_params.attendee_id:
+                query = query.filter(attended_by(search_params.attendee_id))
+            
             # 날짜 필터링 (복잡한 로직)
             if search_params.start_date or search_params.end_date:
                 query = self._apply_date_filter(query, search_params.start_date, search_params.end_date)
         
-        # 정렬: 최신 순
-        query = query.order_by(desc(Event.start_time))
-        
-        # 전체 개수
-        total = query.count()
-        
-        # 페이지네이션 적용
-        events = query.offset(params.skip).limit(params.limit).all()
+        return query
+    
+    def export_query(self, search_params: Optional[SearchParams] = None):
+        """내보내기 쿼리 (테이블 컬럼 그대로, ID 순)"""
+        return self._apply_filters(select(*Event.__table__.columns), search_params).order_by(Event.id)
+    
+    async def get_events_for_calendar(self, start_date: date, end_date: date, 
+                                     member_id: Optional[int] = None,
+                                     attendee_id: Optional[int] = None) -> List[CalendarEventResponse]:
+        """달력용 이벤트 목록 조회 (FullCalendar 형식, 반복 일정은 조회 범위 안의 발생으로 전개)"""
+        query = self._calendar_query(select(*CALENDAR_EVENT_COLUMNS), start_date, end_date, member_id, attendee_id)
+        window_start, window_end = calendar_window(start_date, end_date)
+        return to_calendar_events(await self._expand_window(query, window_start, window_end), datetime.now())
+    
+    async def _expand_window(self, query, window_start: datetime, window_end: datetime):
+        """조회 범위 쿼리를 실행해 반복 일정을 발생으로 전개한 (행, 발생 시작 시각) 목록"""
+        rows = (await self.db.execute(query.order_by(Event.start_time))).all()
+        
+        # 반복 일정의 개별 수정(override)된 발생은 마스터 전개에서 제외
+        master_ids = [row.id for row in rows if row.is_recurring and row.recurrence_rule]
+        overridden = set()
+        if master_ids:
+            overridden = set((await self.db.execute(
+                select(Event.recurrence_parent_id, Event.recurrence_id)
+                .filter(Event.recurrence_parent_id.in_(master_ids))
+            )).tuples().all())
+        
+        return expand_recurring_rows(rows, overridden, window_start, window_end)
+    
+    async def get_availability(
+        self,
+        member_ids: List[int],
+        window_start: datetime,
+        window_end: datetime,
+        event_types: Optional[List[str]] = None,
+        min_duration: timedelta = timedelta(0)
+    ) -> AvailabilityResponse:
+        """
+        멤버별 바쁜 구간/빈 시간과 모든 멤버가 비어 있는 시간 (반복 일정 포함)
+        
+        Raises:
+            ValueError: 조회 범위/멤버 수가 잘못되었거나 제한을 넘는 경우
+        """
+        member_ids = list(dict.fromkeys(member_ids))
+        if not member_ids:
+            raise ValueError("멤버를 한 명 이상 지정해야 합니다.")
+        if len(member_ids) > AVAILABILITY_MAX_MEMBERS:
+            raise ValueError(f"멤버는 최대 {AVAILABILITY_MAX_MEMBERS}명까지 조회할 수 있습니다.")
+        if window_start >= window_end:
+            raise ValueError("종료 시간은 시작 시간보다 늦어야 합니다.")
+        if window_end - window_start > timedelta(days=AVAILABILITY_MAX_DAYS):
+            raise ValueError(f"조회 범위는 최대 {AVAILABILITY_MAX_DAYS}일입니다.")
+        event_types = list(dict.fromkeys(event_types or AVAILABILITY_BUSY_TYPES))
+        
+        query = self._window_query(select(*AVAILABILITY_COLUMNS), window_start, window_end)
+        query = query.filter(
+            or_(Event.created_by.in_(member_ids), Event.attendee_ids.overlap(member_ids)),
+            Event.event_type.in_(event_types)
+        )
         
-        return EventListResponse(
-            total=total,
-            events=[self._to_response(event) for event in events]
+        # 생성자와 참가자 모두 해당 시간에 바쁨
+        intervals: Dict[int, list] = {member_id: [] for member_id in member_ids}
+        for row, occurrence in await self._expand_window(query, window_start, window_end):
+            start_time = occurrence or row.start_time
+            interval = (start_time, start_time + (row.end_time - row.start_time))
+            for member_id in {row.created_by, *(row.attendee_ids or ())}:
+                if member_id in intervals:
+                    intervals[member_id].append(interval)
+        
+        members, common_free = team_availability(intervals, window_start, window_end, min_duration)
+        to_slots = lambda intervals: [TimeSlot(start=start, end=end) for start, end in intervals]
+        return AvailabilityResponse(
+            start=window_start,
+            end=window_end,
+            event_types=event_types,
+            members=[
+                MemberAvailability(member_id=member_id, busy=to_slots(busy), free=to_slots(free))
+                for member_id, (busy, free) in members.items()
+            ],
+            common_free=to_slots(common_free)
         )
     
-    def get_events_for_calendar(self, start_date: date, end_date: date, 
-                               member_id: Optional[int] = None) -> List[CalendarEventResponse]:
-        """달력용 이벤트 목록 조회 (FullCalendar 형식)"""
-        query = self.db.query(Event)
+    async def get_calendar_etag(self, start_date: date, end_date: date,
+                                member_id: Optional[int] = None, attendee_id: Optional[int] = None) -> str:
+        """
+        달력 조회 범위의 ETag (범위 내 이벤트 수 + 최종 수정 시각 + 상태, 변경이 없으면 같은 값)
+        
+        응답의 extendedProps.status(upcoming/ongoing/completed)는 행이 바뀌지 않아도 시간이 지나면 바뀌므로
+        - 일반 일정: 현재 시각까지 지난 시작/종료 시각 수를 포함 (상태가 바뀔 때만 ETag 변경)
+        - 반복 일정: 발생을 전개하지 않으므로 발생이 진행될 수 있는 동안(첫 시작 ~ 범위 끝 + 일정 길이)
+          분 단위 시각을 포함
+        """
+        now = datetime.now()
+        _, window_end = calendar_window(start_date, end_date)
+        recurring = and_(Event.is_recurring == True, Event.recurrence_rule.isnot(None))
+        single = or_(Event.is_recurring.isnot(True), Event.recurrence_rule.is_(None))
+        query = self._calendar_query(
+            select(
+                func.count(),
+                func.max(Event.updated_at),
+                func.count().filter(and_(single, Event.start_time <= now)),
+                func.count().filter(and_(single, Event.end_time < now)),
+                func.min(Event.start_time).filter(recurring),
+                func.max(Event.end_time - Event.start_time).filter(recurring)
+            ).select_from(Event),
+            start_date, end_date, member_id, attendee_id
+        )
+        count, last_updated, started, ended, series_start, series_duration = (await self.db.execute(query)).one()
         
-        # 날짜 범위 필터링
-        query = self._apply_date_filter(query, start_date, end_date)
+        series_bucket = ""
+        if series_start is not None and series_start <= now <= window_end + (series_duration or timedelta(0)):
+            series_bucket = now.strftime("%Y%m%d%H%M")
         
-        # 특정 멤버 필터
+        digest = hashlib.sha1(
+            f"{count}:{last_updated.isoformat() if last_updated else ''}:{started}:{ended}:{series_bucket}".encode()
+        ).hexdigest()
+        return f'W/"{digest[:20]}"'
+    
+    @staticmethod
+    def _validate_override(parent: Optional[Event], recurrence_id: Optional[datetime]):
+        """개별 수정 대상 검사 (반복 일정이 있고, recurrence_id가 그 반복 일정의 발생 시각이어야 함)"""
+        if not parent or not (parent.is_recurring and parent.recurrence_rule):
+            raise ValueError("반복 일정을 찾을 수 없습니다.")
+        if recurrence_id is None:
+            raise ValueError("수정할 발생의 원래 시작 시간(recurrence_id)이 필요합니다.")
+        if not is_occurrence(parent.recurrence_rule, parent.start_time, recurrence_id):
+            raise ValueError("반복 일정의 발생 시각이 아닙니다.")
+    
+    async def _touch_series(self, *parent_ids: Optional[int]):
+        """개별 수정 일정이 바뀌면 반복 일정의 수정 시각도 갱신 (달력 ETag 갱신, 여러 반복 일정은 UPDATE 한 번)"""
+        parent_ids = [parent_id for parent_id in parent_ids if parent_id is not None]
+        if parent_ids:
+            await self.db.execute(update(Event).filter(Event.id.in_(parent_ids)).values(updated_at=func.now()))
+    
+    def _calendar_query(self, query, start_date: date, end_date: date, member_id: Optional[int],
+                        attendee_id: Optional[int] = None):
+        """달력 조회 조건 (날짜 범위와 겹치는 일정 + 범위 끝 이전에 시작한 반복 일정, 특정 생성자/참가자)"""
+        window_start, window_end = calendar_window(start_date, end_date)
+        query = self._window_query(query, window_start, window_end)
         if member_id:
             query = query.filter(Event.created_by == member_id)
-        
-        events = query.order_by(Event.start_time).all()
-        
-        calendar_events = []
-        for event in events:
-            # 팀원별 동적 색상 생성
-            member_color = self._generate_member_color(event.created_by)
-            
-            calendar_event = CalendarEventResponse(
-                id=str(event.id),
-                title=f"{event.event_type_icon} {event.title}",
-                start=event.start_time.isoformat(),
-                end=event.end_time.isoformat() if event.end_time else None,
-                allDay=event.is_all_day,
-                backgroundColor=member_color,
-                borderColor=member_color,
-                textColor='white',
-                extendedProps={
-                    'event_type': event.event_type,
-                    'event_type_display': event.event_type_display,
-                    'description': event.description,
-                    'location': event.location,
-                    'participants': ', '.join(str(attendee) for attendee in event.attendees if attendee) if event.attendees and isinstance(event.attendees, list) else '',
-                    'attendees': event.attendees,
-                    'creator_id': event.created_by,
-                    'duration_minutes': event.duration_minutes,
-                    'status': event.status
-                }
-            )
-            calendar_events.append(calendar_event)
-        
-        return calendar_events
+        if attendee_id:
+            query = query.filter(attended_by(attendee_id))
+        return query
+    
+    def _window_query(self, query, window_start: datetime, window_end: datetime):
+        """조회 범위와 겹치는 일정 + 범위 끝 이전에 시작한 반복 일정 (전개 전 후보)"""
+        return query.filter(or_(
+            overlaps_window(window_start, window_end),
+            and_(Event.is_recurring == True, Event.recurrence_rule.isnot(None), Event.start_time < window_end)
+        ))
     
-    def update_event(self, event_id: int, event_data: EventUpdate) -> Optional[EventResponse]:
+    async def update_event(self, event_id: int, event_data: EventUpdate) -> Optional[EventResponse]:
         """이벤트 수정"""
-        event = self.db.query(Event).filter(Event.id == event_id).first()
+        event = await self.db.get(Event, event_id)
         
         if not event:
             return None
@@ -170,6 +553,11 @@ class CalendarService:
         if end_time and start_time >= end_time:
             raise ValueError("종료 시간은 시작 시간보다 늦어야 합니다.")
         
+        if update_data.get('is_recurring', event.is_recurring):
+            if event.recurrence_parent_id is not None:
+                raise ValueError("반복 일정의 개별 수정 일정은 반복 일정일 수 없습니다.")
+            validate_rule(update_data.get('recurrence_rule', event.recurrence_rule), start_time)
+        
         for field, value in update_data.items():
             if field == "event_type" and value:
                 setattr(event, field, value.value)
@@ -178,187 +566,163 @@ class CalendarService:
                 setattr(event, field, value)
             else:
                 setattr(event, field, value)
+        if "attendees" in update_data:
+            event.attendee_ids = attendee_member_ids(event.attendees)
         
         event.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(event)
+        await self._touch_series(event.recurrence_parent_id)
+        await self.db.commit()
+        invalidate_event_stats_cache()
+        await response_cache.invalidate("events")
+        await self.db.refresh(event)
         
-        return self._to_response(event)
+        return (await self._with_creators([self._to_response(event)]))[0]
     
-    def delete_event(self, event_id: int) -> bool:
+    async def delete_event(self, event_id: int) -> bool:
         """이벤트 삭제"""
-        event = self.db.query(Event).filter(Event.id == event_id).first()
+        event = await self.db.get(Event, event_id)
         
         if not event:
             return False
         
-        self.db.delete(event)
-        self.db.commit()
+        # 반복 일정을 삭제하면 개별 수정 일정도 함께 삭제됨 (ON DELETE CASCADE)
+        # 개별 수정 일정을 삭제하면 해당 발생은 원래 반복 일정대로 표시됨
+        await self.db.delete(event)
+        await self._touch_series(event.recurrence_parent_id)
+        await self.db.commit()
+        invalidate_event_stats_cache()
+        await response_cache.invalidate("events")
         
         return True
     
-    def get_today_events(self) -> List[EventResponse]:
+    async def get_today_events(self) -> List[EventResponse]:
         """오늘 일정 조회"""
         today = datetime.now().date()
         
-        query = self.db.query(Event)
+        query = select(Event)
         query = self._apply_date_filter(query, today, today)
         
-        events = query.order_by(Event.start_time).all()
-        return [self._to_response(event) for event in events]
+        events = (await self.db.scalars(query.order_by(Event.start_time))).all()
+        return await self._with_creators([self._to_response(event) for event in events])
     
-    def get_upcoming_events(self, days: int = 7) -> List[EventResponse]:
+    async def get_upcoming_events(self, days: int = 7) -> List[EventResponse]:
         """다가오는 일정 조회"""
         start_date = datetime.now().date()
         end_date = start_date + timedelta(days=days)
         
-        events = self.db.query(Event).filter(
-            and_(
-                Event.start_time >= datetime.now(),
-                func.date(Event.start_time).between(start_date, end_date)
-            )
-        ).order_by(Event.start_time).all()
+        events = (await self.db.scalars(
+            select(Event).filter(
+                and_(
+                    Event.start_time >= datetime.now(),
+                    func.date(Event.start_time).between(start_date, end_date)
+                )
+            ).order_by(Event.start_time)
+        )).all()
         
-        return [self._to_response(event) for event in events]
+        return await self._with_creators([self._to_response(event) for event in events])
     
-    def search_events(self, query_string: str) -> List[EventResponse]:
-        """이벤트 검색"""
-        events = self.db.query(Event).filter(
-            or_(
-                Event.title.ilike(f"%{query_string}%"),
-                Event.description.ilike(f"%{query_string}%"),
-                Event.location.ilike(f"%{query_string}%")
-            )
-        ).order_by(desc(Event.start_time)).all()
+    async def search_events(self, query_string: str, limit: int = 20) -> List[EventResponse]:
+        """이벤트 검색 (관련도 순, 최대 limit개)"""
+        events = await search(
+            self.db, select(Event), query_string, EVENT_SEARCH_COLUMNS,
+            order=EVENT_ORDER, limit=limit
+        )
         
-        return [self._to_response(event) for event in events]
+        return await self._with_creators([self._to_response(event) for event in events])
     
-    def get_events_by_member(self, member_id: int, pagination: PaginationParams) -> EventListResponse:
+    async def get_events_by_member(self, member_id: int, pagination: PaginationParams) -> EventListResponse:
         """특정 멤버의 이벤트 조회"""
-        query = self.db.query(Event).filter(
-            Event.created_by == member_id
-        ).order_by(desc(Event.start_time))
+        query = select(Event).filter(Event.created_by == member_id)
         
-        total = query.count()
-        events = query.offset(pagination.skip).limit(pagination.limit).all()
+        page = await paginate(
+            self.db, query, EVENT_ORDER, pagination.limit,
+            skip=pagination.skip, cursor=pagination.cursor, count=pagination.count
+        )
         
         return EventListResponse(
-            total=total,
-            events=[self._to_response(event) for event in events]
+            total=page.total,
+            next_cursor=page.next_cursor,
+            events=await self._with_creators([self._to_response(event) for event in page.items])
         )
     
-    def get_events_by_type(self, event_type: str, start_date: Optional[date] = None, 
-                          end_date: Optional[date] = None) -> List[EventResponse]:
+    async def get_events_by_type(self, event_type: str, start_date: Optional[date] = None, 
+                                 end_date: Optional[date] = None) -> List[EventResponse]:
         """타입별 이벤트 조회"""
-        query = self.db.query(Event).filter(Event.event_type == event_type)
+        query = select(Event).filter(Event.event_type == event_type)
         
         if start_date or end_date:
             query = self._apply_date_filter(query, start_date, end_date)
         
-        events = query.order_by(desc(Event.start_time)).all()
-        return [self._to_response(event) for event in events]
+        events = (await self.db.scalars(query.order_by(desc(Event.start_time)))).all()
+        return await self._with_creators([self._to_response(event) for event in events])
     
-    def get_event_stats(self) -> EventStats:
-        """이벤트 통계"""
-        now = datetime.now()
-        today = now.date()
-        
-        # 기본 통계
-        total_events = self.db.query(Event).count()
-        today_events = self.db.query(Event).filter(
-            func.date(Event.start_time) == today
-        ).count()
-        
-        upcoming_events = self.db.query(Event).filter(
-            Event.start_time > now
-        ).count()
-        
-        ongoing_events = self.db.query(Event).filter(
-            and_(
-                Event.start_time <= now,
-                Event.end_time >= now
-            )
-        ).count()
-        
-        completed_events = self.db.query(Event).filter(
-            Event.end_time < now
-        ).count()
-        
-        # 타입별 통계
-        type_stats = self.db.query(
-            Event.event_type,
-            func.count(Event.id).label('count')
-        ).group_by(Event.event_type).all()
-        
-        events_by_type = {
-            event_type: count for event_type, count in type_stats
-        }
-        
-        # 멤버별 통계 (ID만 - 이름은 다른 서비스에서 조회)
-        member_stats = self.db.query(
-            Event.created_by,
-            func.count(Event.id).label('count')
-        ).group_by(Event.created_by).all()
-        
-        events_by_member = {
-            f"member_{member_id}": count for member_id, count in member_stats
-        }
+    async def get_event_stats(self) -> EventStats:
+        """이벤트 통계 (짧은 TTL 캐시, 캐시 미스 시 단일 스캔 집계)"""
+        cached_at, cached = _event_stats_cache
+        if cached is not None and time.monotonic() - cached_at < EVENT_STATS_CACHE_TTL_SECONDS:
+            return cached
         
-        return EventStats(
-            total_events=total_events,
-            today_events=today_events,
-            upcoming_events=upcoming_events,
-            ongoing_events=ongoing_events,
-            completed_events=completed_events,
+        now = datetime.now()
+        today_start = datetime.combine(now.date(), datetime.min.time())
+        tomorrow_start = today_start + timedelta(days=1)
+        
+        # 타입 x 생성자 단위로 묶어 한 번의 스캔으로 모든 카운터 계산
+        # (오늘 일정은 func.date() 대신 범위 조건을 사용해 start_time 인덱스 활용 가능)
+        rows = (await self.db.execute(
+            select(
+                Event.event_type,
+                Event.created_by,
+                func.count().label("total"),
+                func.count().filter(
+                    and_(Event.start_time >= today_start, Event.start_time < tomorrow_start)
+                ).label("today"),
+                func.count().filter(Event.start_time > now).label("upcoming"),
+                func.count().filter(
+                    and_(Event.start_time <= now, Event.end_time >= now)
+                ).label("ongoing"),
+                func.count().filter(Event.end_time < now).label("completed")
+            ).group_by(Event.event_type, Event.created_by)
+        )).all()
+        
+        events_by_type: Dict[str, int] = {}
+        events_by_member: Dict[str, int] = {}
+        for row in rows:
+            events_by_type[row.event_type] = events_by_type.get(row.event_type, 0) + row.total
+            # 멤버별 통계 (ID만 - 이름은 다른 서비스에서 조회)
+            member_key = f"member_{row.created_by}"
+            events_by_member[member_key] = events_by_member.get(member_key, 0) + row.total
+        
+        stats = EventStats(
+            total_events=sum(row.total for row in rows),
+            today_events=sum(row.today for row in rows),
+            upcoming_events=sum(row.upcoming for row in rows),
+            ongoing_events=sum(row.ongoing for row in rows),
+            completed_events=sum(row.completed for row in rows),
             events_by_type=events_by_type,
             events_by_member=events_by_member
         )
+        _event_stats_cache[:] = [time.monotonic(), stats]
+        return stats
     
     def _apply_date_filter(self, query, start_date: Optional[date], end_date: Optional[date]):
-        """날짜 필터링 적용 (복잡한 로직)"""
-        if start_date and end_date:
-            # 특정 날짜 범위 내에 겹치는 이벤트를 찾기
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
-            
-            # 이벤트가 조회 범위와 겹치는 조건:
-            # 1. 이벤트 시작일이 조회 종료일 이전이고
-            # 2. 이벤트 종료일이 조회 시작일 이후인 경우
-            query = query.filter(
-                and_(
-                    Event.start_time < end_datetime,
-                    Event.end_time >= start_datetime
-                )
-            )
-        elif start_date:
-            # 시작일만 지정된 경우
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(start_date + timedelta(days=1), datetime.min.time())
-            
-            query = query.filter(
-                and_(
-                    Event.start_time < end_datetime,
-                    Event.end_time >= start_datetime
-                )
-            )
-        elif end_date:
-            # 종료일만 지정된 경우
-            end_datetime = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
-            query = query.filter(Event.start_time < end_datetime)
-        
+        """
+        날짜 필터링 적용 (조회 범위와 기간이 겹치는 이벤트)
+        
+        - 시작일/종료일: [시작일 00:00, 종료일 다음날 00:00)와 겹치는 이벤트
+        - 시작일만: 시작일 하루와 겹치는 이벤트
+        - 종료일만: 종료일 다음날 00:00 이전에 시작한 이벤트
+        """
+        if start_date:
+            window_start, window_end = calendar_window(start_date, end_date or start_date)
+            return query.filter(overlaps_window(window_start, window_end))
+        if end_date:
+            _, window_end = calendar_window(end_date, end_date)
+            return query.filter(overlaps_window(None, window_end))
         return query
     
-    def _generate_member_color(self, member_id: int) -> str:
-        """팀원 ID 기반 동적 색상 생성"""
-        # HSL 색상 생성 (프론트엔드와 동일한 로직)
-        hue = (member_id * 137.508) % 360
-        saturation = 45 + (member_id % 15)  # 45-60% 채도로 부드러운 색상
-        lightness = 60 + (member_id % 15)   # 60-75% 명도로 옅은 색상
-        
-        # HSL을 HEX로 변환
-        h, s, l = hue / 360, saturation / 100, lightness / 100
-        r, g, b = colorsys.hls_to_rgb(h, l, s)
-        return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+    async def _with_creators(self, events: List[EventResponse]) -> List[EventResponse]:
+        """생성자 정보 채우기 (페이지의 생성자를 member-service에서 한 번에 조회)"""
+        return await attach_members(events, "created_by", "creator", CreatorInfo)
     
     def _to_response(self, event: Event) -> EventResponse:
         """Event 모델을 EventResponse로 변환"""
@@ -366,7 +730,7 @@ class CalendarService:
         participants_str = ""
         if event.attendees:
             if isinstance(event.attendees, list):
-                participants_str = ', '.join(str(attendee) for attendee in event.attendees if attendee)
+                participants_str = ', '.join(attendee_label(attendee) for attendee in event.attendees if attendee)
             elif isinstance(event.attendees, dict):
                 participants_str = ', '.join(str(v) for v in event.attendees.values() if v)
         
@@ -380,12 +744,15 @@ class CalendarService:
             is_all_day=event.is_all_day,
             location=event.location,
             attendees=event.attendees,
+            attendee_ids=event.attendee_ids,
             is_recurring=event.is_recurring,
             recurrence_rule=event.recurrence_rule,
+            recurrence_parent_id=event.recurrence_parent_id,
+            recurrence_id=event.recurrence_id,
             created_by=event.created_by,
             created_at=event.created_at,
             updated_at=event.updated_at,
-            creator=None,  # 추후 Member Service에서 조회
+            creator=None,  # _with_creators에서 member-service 일괄 조회로 채움
             # 계산된 속성들
             event_type_display=event.event_type_display,
             event_type_icon=event.event_type_icon,
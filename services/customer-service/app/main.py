@@ -9,8 +9,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from .database import init_db, get_db_info
+from .database import init_db, get_db_info, close_db, add_statement_count_middleware
 from .routers import customers_router, assignments_router
+from shared.members import member_client
 
 # 로깅 설정
 logging.basicConfig(
@@ -37,6 +38,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 SQL 실행 횟수 계측 (X-DB-Statements 헤더)
+add_statement_count_middleware(app)
+
 # 라우터 등록
 app.include_router(customers_router, prefix="/api")
 app.include_router(assignments_router, prefix="/api")
@@ -51,6 +55,8 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
+    await member_client.close()
+    await close_db()
     logger.info("Customer Service 종료")
 
 @app.get("/")
@@ -69,6 +75,7 @@ async def root():
             "/api/assignments": "담당자 배정 CRUD",
             "/api/assignments/member/{member_id}": "팀원별 담당 고객사",
             "/api/assignments/customer/{customer_id}": "고객사별 담당자",
+            "/api/assignments/stats": "담당 배정 통계",
             "/health": "헬스 체크",
             "/docs": "API 문서"
         }
@@ -82,7 +89,8 @@ async def health_check():
         "status": "healthy",
         "service": "customer-service",
         "timestamp": datetime.now().isoformat(),
-        "database": db_info
+        "database": db_info,
+        "member_client": member_client.stats
     }
 
 # 전역 예외 처리
@@ -3,9 +3,9 @@ Customer Service 모델 정의
 """
 
 from datetime import date, datetime
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Date, DateTime, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, table, column
 from .database import Base
 
 class Customer(Base):
@@ -35,8 +35,11 @@ class Customer(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성일시")
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="수정일시")
     
-    # 관계 설정 (Assignment와의 관계)
-    assignments = relationship("Assignment", back_populates="customer", cascade="all, delete-orphan")
+    # 관계 설정 (Assignment와의 관계, 주 담당자 먼저 그 다음 최근 배정 순)
+    assignments = relationship(
+        "Assignment", back_populates="customer", cascade="all, delete-orphan",
+        order_by="[Assignment.is_primary.desc(), Assignment.assigned_date.desc(), Assignment.id.desc()]"
+    )
     
     def __repr__(self):
         return f"<Customer(id={self.id}, company_name='{self.company_name}', status='{self.status}')>"
@@ -103,4 +106,13 @@ class Assignment(Base):
             return (self.end_date - self.assigned_date).days
         else:
             # 종료일이 없으면 현재까지의 기간
-            return (date.today() - self.assigned_date).days 
\ No newline at end of file
+            return (date.today() - self.assigned_date).days 
+
+# 통계 카운터 테이블 (customer_schema.stats_counters)
+# db/init/03_customer_stats.sql의 트리거가 쓰기 시 증분 갱신 - ORM 테이블 생성 대상이 아님
+stats_counters = table(
+    "stats_counters",
+    column("stat_key", String),
+    column("value", BigInteger),
+    schema="customer_schema"
+)
@@ -2,30 +2,40 @@
 Customer Service API 라우터
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Header, status
-from sqlalchemy.orm import Session
+from typing import List, Optional, Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from .database import get_db
+from .database import AsyncSessionLocal, get_db
 from .service import CustomerService, AssignmentService
 from .schemas import (
     CustomerCreate, CustomerUpdate, CustomerResponse, CustomerListResponse,
     AssignmentCreate, AssignmentUpdate, AssignmentResponse, AssignmentListResponse,
     CustomerStats, AssignmentStats, CustomerSearchParams, AssignmentSearchParams,
-    PaginationParams, CustomerStatusEnum, AssignmentRoleEnum
+    PaginationParams, CustomerStatusEnum, AssignmentRoleEnum,
+    AssignmentBulkCreate, AssignmentBulkResponse
 )
 
+# shared 모듈 import를 위한 경로 추가
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.auth import AuthenticatedUser, get_current_user
+from shared.cache import cached
+from shared.export import ExportFormat, export_response
+
 # Customer 라우터
 customers_router = APIRouter(prefix="/customers", tags=["customers"])
 
-def get_customer_service(db: Session = Depends(get_db)) -> CustomerService:
+def get_customer_service(db: AsyncSession = Depends(get_db)) -> CustomerService:
     return CustomerService(db)
 
-def get_current_user_id(x_user_id: int = Header(..., alias="X-User-ID")) -> int:
-    return x_user_id
+def get_current_user_id(user: AuthenticatedUser = Depends(get_current_user)) -> int:
+    return user.user_id
 
-def get_current_user_role(x_user_role: str = Header(..., alias="X-User-Role")) -> str:
-    return x_user_role
+def get_current_user_role(user: AuthenticatedUser = Depends(get_current_user)) -> str:
+    return user.role
 
 @customers_router.post("/", response_model=CustomerResponse, summary="고객사 생성")
 async def create_customer(
@@ -34,7 +44,7 @@ async def create_customer(
 ):
     # 누구나 고객사 생성 가능
     try:
-        return service.create_customer(customer_data)
+        return await service.create_customer(customer_data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -46,9 +56,12 @@ async def get_customers(
     status: CustomerStatusEnum = Query(None),
     active_only: bool = Query(False),
     contract_type: str = Query(None),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    count: Literal["exact", "estimate", "none"] = Query("exact", description="전체 개수 계산 방식"),
+    include: Optional[Literal["assignments"]] = Query(None, description="assignments: 담당 배정 목록 포함"),
     service: CustomerService = Depends(get_customer_service)
 ):
-    pagination = PaginationParams(skip=skip, limit=limit)
+    pagination = PaginationParams(skip=skip, limit=limit, cursor=cursor, count=count)
     search_params = None
     
     if any([q, status, active_only, contract_type]):
@@ -56,33 +69,58 @@ async def get_customers(
             q=q, status=status, active_only=active_only, contract_type=contract_type
         )
     
-    return service.get_customers(pagination, search_params)
+    try:
+        return await service.get_customers(pagination, search_params, include_assignments=include == "assignments")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @customers_router.get("/search", response_model=List[CustomerResponse], summary="고객사 검색")
 async def search_customers(
     q: str = Query(..., min_length=1),
     active_only: bool = Query(False),
+    limit: int = Query(20, ge=1, le=100),
     service: CustomerService = Depends(get_customer_service)
 ):
-    return service.search_customers(q, active_only)
+    try:
+        return await service.search_customers(q, active_only, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @customers_router.get("/expiring", response_model=List[CustomerResponse], summary="계약 만료 예정")
 async def get_expiring_customers(
     days: int = Query(30, ge=1, le=365),
     service: CustomerService = Depends(get_customer_service)
 ):
-    return service.get_expiring_customers(days)
+    return await service.get_expiring_customers(days)
 
 @customers_router.get("/stats", response_model=CustomerStats, summary="고객사 통계")
+@cached("customers")
 async def get_customer_stats(service: CustomerService = Depends(get_customer_service)):
-    return service.get_customer_stats()
+    return await service.get_customer_stats()
+
+@customers_router.get("/export", summary="고객사 내보내기 (NDJSON/CSV 스트리밍)")
+async def export_customers(
+    format: ExportFormat = Query("ndjson", description="ndjson / csv"),
+    q: str = Query(None),
+    # fastapi.status 모듈을 가리지 않도록 파라미터 이름은 customer_status (쿼리 이름은 status)
+    customer_status: CustomerStatusEnum = Query(None, alias="status"),
+    active_only: bool = Query(False),
+    contract_type: str = Query(None),
+    service: CustomerService = Depends(get_customer_service),
+    current_user_id: int = Depends(get_current_user_id)
+):
+    search_params = CustomerSearchParams(
+        q=q, status=customer_status, active_only=active_only, contract_type=contract_type
+    )
+    return export_response(AsyncSessionLocal, service.export_query(search_params), "customers", format)
 
 @customers_router.get("/{customer_id}", response_model=CustomerResponse, summary="고객사 조회")
 async def get_customer(
     customer_id: int,
+    include: Optional[Literal["assignments"]] = Query(None, description="assignments: 담당 배정 목록 포함"),
     service: CustomerService = Depends(get_customer_service)
 ):
-    customer = service.get_customer(customer_id)
+    customer = await service.get_customer(customer_id, include_assignments=include == "assignments")
     if not customer:
         raise HTTPException(status_code=404, detail="고객사를 찾을 수 없습니다.")
     return customer
@@ -95,7 +133,7 @@ async def update_customer(
 ):
     # 누구나 고객사 수정 가능
     try:
-        customer = service.update_customer(customer_id, customer_data)
+        customer = await service.update_customer(customer_id, customer_data)
         if not customer:
             raise HTTPException(status_code=404, detail="고객사를 찾을 수 없습니다.")
         return customer
@@ -112,7 +150,7 @@ async def delete_customer(
     if current_user_role.lower() not in ["admin", "power_user"]:
         raise HTTPException(status_code=403, detail="고객사 삭제 권한이 없습니다.")
     
-    success = service.delete_customer(customer_id)
+    success = await service.delete_customer(customer_id)
     if not success:
         raise HTTPException(status_code=404, detail="고객사를 찾을 수 없습니다.")
     return {"message": "고객사가 비활성화되었습니다."}
@@ -120,7 +158,7 @@ async def delete_customer(
 # Assignment 라우터
 assignments_router = APIRouter(prefix="/assignments", tags=["assignments"])
 
-def get_assignment_service(db: Session = Depends(get_db)) -> AssignmentService:
+def get_assignment_service(db: AsyncSession = Depends(get_db)) -> AssignmentService:
     return AssignmentService(db)
 
 @assignments_router.post("/", response_model=AssignmentResponse, summary="담당자 배정")
@@ -133,7 +171,47 @@ async def create_assignment(
         raise HTTPException(status_code=403, detail="담당자 배정 권한이 없습니다.")
     
     try:
-        return service.create_assignment(assignment_data)
+        return await service.create_assignment(assignment_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@assignments_router.post("/bulk", response_model=AssignmentBulkResponse, summary="담당자 일괄 배정")
+async def create_assignments(
+    bulk_data: AssignmentBulkCreate,
+    service: AssignmentService = Depends(get_assignment_service),
+    current_user_role: str = Depends(get_current_user_role)
+):
+    # 항목별 성공/실패는 results로 반환 (유효한 항목만 한 트랜잭션으로 저장)
+    if current_user_role.lower() not in ["admin", "power_user"]:
+        raise HTTPException(status_code=403, detail="담당자 배정 권한이 없습니다.")
+    
+    try:
+        return await service.create_assignments(bulk_data.items)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@assignments_router.get("/", response_model=AssignmentListResponse, summary="담당 배정 목록 조회")
+async def get_assignments(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    member_id: Optional[int] = Query(None),
+    customer_id: Optional[int] = Query(None),
+    role: AssignmentRoleEnum = Query(None),
+    active_only: bool = Query(False),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    count: Literal["exact", "estimate", "none"] = Query("exact", description="전체 개수 계산 방식"),
+    service: AssignmentService = Depends(get_assignment_service)
+):
+    pagination = PaginationParams(skip=skip, limit=limit, cursor=cursor, count=count)
+    search_params = None
+    
+    if any([member_id, customer_id, role, active_only]):
+        search_params = AssignmentSearchParams(
+            member_id=member_id, customer_id=customer_id, role=role, active_only=active_only
+        )
+    
+    try:
+        return await service.get_assignments(pagination, search_params)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -143,7 +221,7 @@ async def get_assignments_by_member(
     active_only: bool = Query(False),
     service: AssignmentService = Depends(get_assignment_service)
 ):
-    return service.get_assignments_by_member(member_id, active_only)
+    return await service.get_assignments_by_member(member_id, active_only)
 
 @assignments_router.get("/customer/{customer_id}", response_model=List[AssignmentResponse], summary="고객사별 담당자")
 async def get_assignments_by_customer(
@@ -151,14 +229,33 @@ async def get_assignments_by_customer(
     active_only: bool = Query(False),
     service: AssignmentService = Depends(get_assignment_service)
 ):
-    return service.get_assignments_by_customer(customer_id, active_only)
+    return await service.get_assignments_by_customer(customer_id, active_only)
+
+@assignments_router.get("/stats", response_model=AssignmentStats, summary="담당 배정 통계")
+async def get_assignment_stats(service: AssignmentService = Depends(get_assignment_service)):
+    return await service.get_assignment_stats()
+
+@assignments_router.get("/export", summary="담당 배정 내보내기 (NDJSON/CSV 스트리밍)")
+async def export_assignments(
+    format: ExportFormat = Query("ndjson", description="ndjson / csv"),
+    member_id: Optional[int] = Query(None),
+    customer_id: Optional[int] = Query(None),
+    role: AssignmentRoleEnum = Query(None),
+    active_only: bool = Query(False),
+    service: AssignmentService = Depends(get_assignment_service),
+    current_user_id: int = Depends(get_current_user_id)
+):
+    search_params = AssignmentSearchParams(
+        member_id=member_id, customer_id=customer_id, role=role, active_only=active_only
+    )
+    return export_response(AsyncSessionLocal, service.export_query(search_params), "assignments", format)
 
 @assignments_router.get("/{assignment_id}", response_model=AssignmentResponse, summary="담당 배정 조회")
 async def get_assignment(
     assignment_id: int,
     service: AssignmentService = Depends(get_assignment_service)
 ):
-    assignment = service.get_assignment(assignment_id)
+    assignment = await service.get_assignment(assignment_id)
     if not assignment:
         raise HTTPException(status_code=404, detail="담당 배정을 찾을 수 없습니다.")
     return assignment
@@ -173,7 +270,7 @@ async def update_assignment(
     if current_user_role.lower() not in ["admin", "power_user"]:
         raise HTTPException(status_code=403, detail="담당 배정 수정 권한이 없습니다.")
     
-    assignment = service.update_assignment(assignment_id, assignment_data)
+    assignment = await service.update_assignment(assignment_id, assignment_data)
     if not assignment:
         raise HTTPException(status_code=404, detail="담당 배정을 찾을 수 없습니다.")
     return assignment
@@ -187,7 +284,7 @@ async def delete_assignment(
     if current_user_role.lower() not in ["admin", "power_user"]:
         raise HTTPException(status_code=403, detail="담당 배정 삭제 권한이 없습니다.")
     
-    success = service.delete_assignment(assignment_id)
+    success = await service.delete_assignment(assignment_id)
     if not success:
         raise HTTPException(status_code=404, detail="담당 배정을 찾을 수 없습니다.")
     return {"message": "담당 배정이 삭제되었습니다."} 
\ No newline at end of file
@@ -3,7 +3,7 @@ Customer Service Pydantic 스키마 정의
 """
 
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Optional, List, Literal
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -65,7 +65,8 @@ class CustomerResponse(CustomerBase):
 
 class CustomerListResponse(BaseModel):
     """고객사 목록 응답 스키마"""
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (count=none이면 생략)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 없음)")
     customers: List[CustomerResponse]
 
 # Assignment 스키마들
@@ -118,9 +119,28 @@ class AssignmentResponse(AssignmentBase):
 
 class AssignmentListResponse(BaseModel):
     """담당 배정 목록 응답 스키마"""
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (count=none이면 생략)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 없음)")
     assignments: List[AssignmentResponse]
 
+# 일괄 생성 스키마들
+class AssignmentBulkCreate(BaseModel):
+    """담당 배정 일괄 생성 요청 스키마"""
+    items: List[AssignmentCreate] = Field(..., min_length=1, max_length=500, description="생성할 담당 배정 목록 (최대 500개)")
+
+class AssignmentBulkResult(BaseModel):
+    """담당 배정 일괄 생성 항목별 결과"""
+    index: int = Field(description="요청 items에서의 위치")
+    success: bool
+    error: Optional[str] = Field(None, description="실패 사유")
+    assignment: Optional[AssignmentResponse] = None
+
+class AssignmentBulkResponse(BaseModel):
+    """담당 배정 일괄 생성 응답 스키마"""
+    created: int
+    failed: int
+    results: List[AssignmentBulkResult]
+
 # 통계 스키마들
 class CustomerStats(BaseModel):
     """고객사 통계 스키마"""
@@ -159,6 +179,8 @@ class PaginationParams(BaseModel):
     """페이지네이션 파라미터"""
     skip: int = Field(default=0, ge=0, description="건너뛸 개수")
     limit: int = Field(default=100, ge=1, le=1000, description="가져올 개수")
+    cursor: Optional[str] = Field(default=None, description="이전 응답의 next_cursor (지정 시 skip 대신 사용)")
+    count: Literal["exact", "estimate", "none"] = Field(default="exact", description="전체 개수 계산 방식")
 
 # Forward reference 해결
 CustomerResponse.model_rebuild() 
\ No newline at end of file
@@ -2,31 +2,66 @@
 Customer Service 비즈니스 로직
 """
 
+import os
 from typing import List, Optional, Dict, Any
 from datetime import date, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, update, desc, and_, or_, func, literal, union_all, tuple_
+from sqlalchemy.orm import selectinload
 
-from .models import Customer, Assignment
+from .models import Customer, Assignment, stats_counters
 from .schemas import (
     CustomerCreate, CustomerUpdate, CustomerResponse, CustomerListResponse,
     AssignmentCreate, AssignmentUpdate, AssignmentResponse, AssignmentListResponse,
     CustomerStats, AssignmentStats, CustomerSearchParams, AssignmentSearchParams,
-    PaginationParams, MemberInfo
+    PaginationParams, MemberInfo, AssignmentBulkResult, AssignmentBulkResponse
 )
 
+# shared 모듈 import를 위한 경로 추가
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.cache import response_cache
+from shared.members import attach_members
+from shared.pagination import paginate
+from shared.search import ilike_any, search
+
+# 목록 정렬 키 (마지막은 고유 키, cursor 페이지네이션 기준)
+CUSTOMER_ORDER = ((Customer.company_name, False), (Customer.id, False))
+ASSIGNMENT_ORDER = ((Assignment.assigned_date, True), (Assignment.id, True))
+
+# 검색 컬럼과 순위 가중치 (db/init/05_search_indexes.sql의 트라이그램 인덱스 대상)
+CUSTOMER_SEARCH_COLUMNS = (
+    (Customer.company_name, 1.0),
+    (Customer.contact_person, 0.6),
+    (Customer.contact_email, 0.4),
+)
+
+# true: 트리거로 증분 갱신되는 통계 카운터 테이블 사용 (db/init/03_customer_stats.sql 적용 필요)
+USE_MATERIALIZED_STATS = os.getenv("USE_MATERIALIZED_STATS", "false").lower() == "true"
+
+async def get_stat_counters(db: AsyncSession, prefix: str, *extra_counts) -> Dict[str, int]:
+    """통계 카운터 테이블 조회 (날짜 의존 집계는 같은 쿼리에 UNION ALL로 합침)"""
+    query = union_all(
+        select(stats_counters.c.stat_key, stats_counters.c.value)
+        .filter(stats_counters.c.stat_key.startswith(prefix)),
+        *extra_counts
+    )
+    rows = (await db.execute(query)).all()
+    return {key: value for key, value in rows}
+
 class CustomerService:
     """고객사 관리 서비스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     # Customer 관련 메서드들
-    def create_customer(self, customer_data: CustomerCreate) -> CustomerResponse:
+    async def create_customer(self, customer_data: CustomerCreate) -> CustomerResponse:
         """고객사 생성"""
-        existing = self.db.query(Customer).filter(
-            Customer.company_name == customer_data.company_name
-        ).first()
+        existing = await self.db.scalar(
+            select(Customer).filter(Customer.company_name == customer_data.company_name)
+        )
         
         if existing:
             raise ValueError(f"고객사명 '{customer_data.company_name}'은 이미 등록되어 있습니다.")
@@ -37,30 +72,52 @@ class CustomerService:
         
         customer = Customer(**customer_dict)
         self.db.add(customer)
-        self.db.commit()
-        self.db.refresh(customer)
+        await self.db.commit()
+        await response_cache.invalidate("customers")
+        await self.db.refresh(customer)
         
         return self._to_customer_response(customer)
     
-    def get_customer(self, customer_id: int) -> Optional[CustomerResponse]:
-        """고객사 단일 조회"""
-        customer = self.db.query(Customer).filter(Customer.id == customer_id).first()
-        return self._to_customer_response(customer) if customer else None
+    async def get_customer(self, customer_id: int, include_assignments: bool = False) -> Optional[CustomerResponse]:
+        """고객사 단일 조회 (include_assignments: 담당 배정 목록 포함)"""
+        options = [selectinload(Customer.assignments)] if include_assignments else []
+        customer = await self.db.get(Customer, customer_id, options=options)
+        if not customer:
+            return None
+        return (await self._to_customer_responses([customer], include_assignments))[0]
     
-    def get_customers(self, params: PaginationParams, search_params: Optional[CustomerSearchParams] = None) -> CustomerListResponse:
-        """고객사 목록 조회"""
-        query = self.db.query(Customer)
+    async def get_customers(
+        self,
+        params: PaginationParams,
+        search_params: Optional[CustomerSearchParams] = None,
+        include_assignments: bool = False
+    ) -> CustomerListResponse:
+        """
+        고객사 목록 조회
+        
+        include_assignments: 페이지 고객사들의 담당 배정을 selectinload로 추가 쿼리 한 번에 함께 조회
+        (고객사마다 지연 로딩하지 않음)
+        """
+        query = self._apply_filters(select(Customer), search_params)
+        if include_assignments:
+            query = query.options(selectinload(Customer.assignments))
+        
+        page = await paginate(
+            self.db, query, CUSTOMER_ORDER, params.limit,
+            skip=params.skip, cursor=params.cursor, count=params.count
+        )
         
+        return CustomerListResponse(
+            total=page.total,
+            next_cursor=page.next_cursor,
+            customers=await self._to_customer_responses(page.items, include_assignments)
+        )
+    
+    def _apply_filters(self, query, search_params: Optional[CustomerSearchParams]):
+        """목록/내보내기 공통 검색 조건"""
         if search_params:
             if search_params.q:
-                search_term = f"%{search_params.q}%"
-                query = query.filter(
-                    or_(
-                        Customer.company_name.ilike(search_term),
-                        Customer.contact_person.ilike(search_term),
-                        Customer.contact_email.ilike(search_term)
-                    )
-                )
+                query = query.filter(ilike_any(search_params.q, [column for column, _ in CUSTOMER_SEARCH_COLUMNS]))
             
             if search_params.status:
                 query = query.filter(Customer.status == search_params.status.value)
@@ -71,28 +128,27 @@ class CustomerService:
             if search_params.contract_type:
                 query = query.filter(Customer.contract_type == search_params.contract_type)
         
-        query = query.order_by(Customer.company_name)
-        total = query.count()
-        customers = query.offset(params.skip).limit(params.limit).all()
-        
-        return CustomerListResponse(
-            total=total,
-            customers=[self._to_customer_response(customer) for customer in customers]
-        )
+        return query
     
-    def update_customer(self, customer_id: int, customer_data: CustomerUpdate) -> Optional[CustomerResponse]:
+    def export_query(self, search_params: Optional[CustomerSearchParams] = None):
+        """내보내기 쿼리 (테이블 컬럼 그대로, ID 순)"""
+        return self._apply_filters(select(*Customer.__table__.columns), search_params).order_by(Customer.id)
+    
+    async def update_customer(self, customer_id: int, customer_data: CustomerUpdate) -> Optional[CustomerResponse]:
         """고객사 수정"""
-        customer = self.db.query(Customer).filter(Customer.id == customer_id).first()
+        customer = await self.db.get(Customer, customer_id)
         if not customer:
             return None
         
         if customer_data.company_name:
-            existing = self.db.query(Customer).filter(
-                and_(
-                    Customer.company_name == customer_data.company_name,
-                    Customer.id != customer_id
+            existing = await self.db.scalar(
+                select(Customer).filter(
+                    and_(
+                        Customer.company_name == customer_data.company_name,
+                        Customer.id != customer_id
+                    )
                 )
-            ).first()
+            )
             
             if existing:
                 raise ValueError(f"고객사명 '{customer_data.company_name}'은 이미 등록되어 있습니다.")
@@ -104,76 +160,90 @@ class CustomerService:
             else:
                 setattr(customer, field, value)
         
-        self.db.commit()
-        self.db.refresh(customer)
+        await self.db.commit()
+        await response_cache.invalidate("customers")
+        await self.db.refresh(customer)
         return self._to_customer_response(customer)
     
-    def delete_customer(self, customer_id: int) -> bool:
+    async def delete_customer(self, customer_id: int) -> bool:
         """고객사 삭제"""
-        customer = self.db.query(Customer).filter(Customer.id == customer_id).first()
+        customer = await self.db.get(Customer, customer_id)
         if not customer:
             return False
         
         customer.status = "Inactive"
-        self.db.commit()
+        await self.db.commit()
+        await response_cache.invalidate("customers")
         return True
     
-    def search_customers(self, query_string: str, active_only: bool = False) -> List[CustomerResponse]:
-        """고객사 검색"""
-        query = self.db.query(Customer)
+    async def search_customers(self, query_string: str, active_only: bool = False, limit: int = 20) -> List[CustomerResponse]:
+        """고객사 검색 (관련도 순, 최대 limit개)"""
+        query = select(Customer)
         
         if active_only:
             query = query.filter(Customer.status == "Active")
         
-        search_term = f"%{query_string}%"
-        query = query.filter(
-            or_(
-                Customer.company_name.ilike(search_term),
-                Customer.contact_person.ilike(search_term),
-                Customer.contact_email.ilike(search_term)
-            )
+        customers = await search(
+            self.db, query, query_string, CUSTOMER_SEARCH_COLUMNS,
+            order=CUSTOMER_ORDER, limit=limit
         )
-        
-        customers = query.order_by(Customer.company_name).all()
         return [self._to_customer_response(customer) for customer in customers]
     
-    def get_customers_by_status(self, status: str) -> List[CustomerResponse]:
+    async def get_customers_by_status(self, status: str) -> List[CustomerResponse]:
         """상태별 고객사 조회"""
-        customers = self.db.query(Customer).filter(
-            Customer.status == status
-        ).order_by(Customer.company_name).all()
+        customers = (await self.db.scalars(
+            select(Customer).filter(Customer.status == status).order_by(Customer.company_name)
+        )).all()
         
         return [self._to_customer_response(customer) for customer in customers]
     
-    def get_expiring_customers(self, days: int = 30) -> List[CustomerResponse]:
+    async def get_expiring_customers(self, days: int = 30) -> List[CustomerResponse]:
         """계약 만료 예정 고객사 조회"""
         expiry_date = date.today() + timedelta(days=days)
         
-        customers = self.db.query(Customer).filter(
-            and_(
-                Customer.contract_end.isnot(None),
-                Customer.contract_end <= expiry_date,
-                Customer.status == "Active"
-            )
-        ).order_by(Customer.contract_end).all()
+        customers = (await self.db.scalars(
+            select(Customer).filter(
+                and_(
+                    Customer.contract_end.isnot(None),
+                    Customer.contract_end <= expiry_date,
+                    Customer.status == "Active"
+                )
+            ).order_by(Customer.contract_end)
+        )).all()
         
         return [self._to_customer_response(customer) for customer in customers]
     
-    def get_customer_stats(self) -> CustomerStats:
-        """고객사 통계"""
-        total = self.db.query(Customer).count()
-        active = self.db.query(Customer).filter(Customer.status == "Active").count()
-        inactive = self.db.query(Customer).filter(Customer.status == "Inactive").count()
-        expired = self.db.query(Customer).filter(Customer.status == "Expired").count()
-        
+    async def get_customer_stats(self) -> CustomerStats:
+        """고객사 통계 (조건부 집계로 한 번에 계산)"""
         expiry_date = date.today() + timedelta(days=30)
-        expiring_soon = self.db.query(Customer).filter(
-            and_(
-                Customer.contract_end.isnot(None),
-                Customer.contract_end <= expiry_date,
-                Customer.status == "Active"
+        expiring_filter = and_(
+            Customer.contract_end.isnot(None),
+            Customer.contract_end <= expiry_date,
+            Customer.status == "Active"
+        )
+        
+        if USE_MATERIALIZED_STATS:
+            counters = await get_stat_counters(
+                self.db,
+                "customers:",
+                select(literal("customers:expiring_soon"), func.count()).select_from(Customer).filter(expiring_filter)
             )
-        ).count()
+            total = counters.get("customers:total", 0)
+            active = counters.get("customers:status:Active", 0)
+            inactive = counters.get("customers:status:Inactive", 0)
+            expired = counters.get("customers:status:Expired", 0)
+            expiring_soon = counters.get("customers:expiring_soon", 0)
+        else:
+            row = (await self.db.execute(
+                select(
+                    func.count().label("total"),
+                    func.count().filter(Customer.status == "Active").label("active"),
+                    func.count().filter(Customer.status == "Inactive").label("inactive"),
+                    func.count().filter(Customer.status == "Expired").label("expired"),
+                    func.count().filter(expiring_filter).label("expiring_soon")
+                ).select_from(Customer)
+            )).one()
+            total, active, inactive, expired, expiring_soon = row
         
         active_rate = round((active / total * 100) if total > 0 else 0, 2)
         
@@ -186,8 +256,21 @@ class CustomerService:
             active_rate=active_rate
         )
     
-    def _to_customer_response(self, customer: Customer) -> CustomerResponse:
-        """Customer 모델을 CustomerResponse로 변환"""
+    async def _to_customer_responses(self, customers: List[Customer], include_assignments: bool = False) -> List[CustomerResponse]:
+        """Customer 목록을 응답으로 변환 (담당 배정 포함 시 팀원 정보는 전체를 한 번에 조회)"""
+        responses = [self._to_customer_response(customer, include_assignments) for customer in customers]
+        if include_assignments:
+            assignments = [assignment for response in responses for assignment in response.assignments]
+            await attach_members(assignments, "member_id", "member", MemberInfo)
+        return responses
+    
+    def _to_customer_response(self, customer: Customer, include_assignments: bool = False) -> CustomerResponse:
+        """
+        Customer 모델을 CustomerResponse로 변환
+        
+        include_assignments: 미리 읽은(selectinload) customer.assignments 포함
+        (비동기 세션에서는 지연 로딩할 수 없으므로 읽지 않은 경우 빈 목록)
+        """
         return CustomerResponse(
             id=customer.id,
             company_name=customer.company_name,
@@ -203,29 +286,33 @@ class CustomerService:
             contract_days_remaining=customer.contract_days_remaining,
             created_at=customer.created_at,
             updated_at=customer.updated_at,
-            assignments=[]
+            assignments=[
+                AssignmentService._to_assignment_response(assignment) for assignment in customer.assignments
+            ] if include_assignments else []
         )
 
 class AssignmentService:
     """담당자 배정 관리 서비스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def create_assignment(self, assignment_data: AssignmentCreate) -> AssignmentResponse:
+    async def create_assignment(self, assignment_data: AssignmentCreate) -> AssignmentResponse:
         """담당자 배정 생성"""
-        customer = self.db.query(Customer).filter(Customer.id == assignment_data.customer_id).first()
+        customer = await self.db.get(Customer, assignment_data.customer_id)
         if not customer:
             raise ValueError(f"고객사 ID {assignment_data.customer_id}를 찾을 수 없습니다.")
         
         if assignment_data.is_primary:
-            existing_primary = self.db.query(Assignment).filter(
-                and_(
-                    Assignment.customer_id == assignment_data.customer_id,
-                    Assignment.is_primary == True,
-                    Assignment.end_date.is_(None)
+            existing_primary = await self.db.scalar(
+                select(Assignment).filter(
+                    and_(
+                        Assignment.customer_id == assignment_data.customer_id,
+                        Assignment.is_primary == True,
+                        Assignment.end_date.is_(None)
+                    )
                 )
-            ).first()
+            )
             
             if existing_primary:
                 existing_primary.is_primary = False
@@ -237,20 +324,111 @@ class AssignmentService:
         
         assignment = Assignment(**assignment_dict)
         self.db.add(assignment)
-        self.db.commit()
-        self.db.refresh(assignment)
+        await self.db.commit()
+        await self.db.refresh(assignment)
+        
+        return (await self._with_members([self._to_assignment_response(assignment)]))[0]
+    
+    async def create_assignments(self, items: List[AssignmentCreate]) -> AssignmentBulkResponse:
+        """
+        담당자 배정 일괄 생성 (항목별 결과)
+        
+        - 고객사 존재 여부와 이미 배정된 팀원(UNIQUE(member_id, customer_id, is_active))은 쿼리 한 번씩으로 확인,
+          통과한 항목만 다중 행 INSERT ... RETURNING 한 번으로 저장 (한 트랜잭션)
+        - 주 담당자 교체는 create_assignment를 순서대로 호출한 것과 같은 결과를 집합 단위로 처리:
+          주 담당자 항목이 있는 고객사의 기존 주 담당자(종료일 없음)는 UPDATE 한 번으로 부 담당자로 바꾸고,
+          같은 고객사의 주 담당자 항목이 여럿이면 마지막 항목만 주 담당자로 저장
+        """
+        customer_ids = {item.customer_id for item in items}
+        existing_ids = set((await self.db.scalars(
+            select(Customer.id).filter(Customer.id.in_(customer_ids))
+        )).all())
+        assigned = set((await self.db.execute(
+            select(Assignment.member_id, Assignment.customer_id).filter(
+                tuple_(Assignment.member_id, Assignment.customer_id).in_(
+                    list({(item.member_id, item.customer_id) for item in items})
+                )
+            )
+        )).all())
+        
+        results: Dict[int, AssignmentBulkResult] = {}
+        rows = []  # (요청 위치, INSERT 값)
+        for index, item in enumerate(items):
+            if item.customer_id not in existing_ids:
+                results[index] = AssignmentBulkResult(
+                    index=index, success=False, error=f"고객사 ID {item.customer_id}를 찾을 수 없습니다."
+                )
+                continue
+            if (item.member_id, item.customer_id) in assigned:
+                results[index] = AssignmentBulkResult(
+                    index=index, success=False,
+                    error=f"팀원 ID {item.member_id}는 이미 고객사 ID {item.customer_id}에 배정되어 있습니다."
+                )
+                continue
+            assigned.add((item.member_id, item.customer_id))
+            
+            values = item.model_dump()
+            if values.get('role') and hasattr(values['role'], 'value'):
+                values['role'] = values['role'].value
+            rows.append((index, values))
+        
+        # 고객사별 마지막 주 담당자 항목 (앞선 주 담당자 항목은 뒤 항목 생성 시 부 담당자로 바뀜)
+        last_primary = {values["customer_id"]: index for index, values in rows if values["is_primary"]}
+        for index, values in rows:
+            if values["is_primary"] and values["end_date"] is None and last_primary[values["customer_id"]] != index:
+                values["is_primary"] = False
+                values["role"] = "Secondary"
+        
+        if last_primary:
+            await self.db.execute(
+                update(Assignment).filter(
+                    Assignment.customer_id.in_(list(last_primary)),
+                    Assignment.is_primary == True,
+                    Assignment.end_date.is_(None)
+                ).values(is_primary=False, role="Secondary")
+            )
         
-        return self._to_assignment_response(assignment)
+        if rows:
+            assignments = (await self.db.scalars(
+                insert(Assignment).returning(Assignment, sort_by_parameter_order=True),
+                [values for _, values in rows]
+            )).all()
+            await self.db.commit()
+            
+            responses = await self._with_members([self._to_assignment_response(assignment) for assignment in assignments])
+            for (index, _), response in zip(rows, responses):
+                results[index] = AssignmentBulkResult(index=index, success=True, assignment=response)
+        
+        return AssignmentBulkResponse(
+            created=len(rows),
+            failed=len(items) - len(rows),
+            results=[results[index] for index in range(len(items))]
+        )
     
-    def get_assignment(self, assignment_id: int) -> Optional[AssignmentResponse]:
+    async def get_assignment(self, assignment_id: int) -> Optional[AssignmentResponse]:
         """담당자 배정 단일 조회"""
-        assignment = self.db.query(Assignment).filter(Assignment.id == assignment_id).first()
-        return self._to_assignment_response(assignment) if assignment else None
+        assignment = await self.db.get(Assignment, assignment_id)
+        if not assignment:
+            return None
+        return (await self._with_members([self._to_assignment_response(assignment)]))[0]
     
-    def get_assignments(self, params: PaginationParams, search_params: Optional[AssignmentSearchParams] = None) -> AssignmentListResponse:
+    async def get_assignments(self, params: PaginationParams, search_params: Optional[AssignmentSearchParams] = None) -> AssignmentListResponse:
         """담당자 배정 목록 조회"""
-        query = self.db.query(Assignment)
+        query = self._apply_filters(select(Assignment), search_params)
         
+        page = await paginate(
+            self.db, query, ASSIGNMENT_ORDER, params.limit,
+            skip=params.skip, cursor=params.cursor, count=params.count
+        )
+        
+        return AssignmentListResponse(
+            total=page.total,
+            next_cursor=page.next_cursor,
+            assignments=await self._with_members([self._to_assignment_response(assignment) for assignment in page.items])
+        )
+    
+    def _apply_filters(self, query, search_params: Optional[AssignmentSearchParams]):
+        """목록/내보내기 공통 검색 조건"""
         if search_params:
             if search_params.member_id:
                 query = query.filter(Assignment.member_id == search_params.member_id)
@@ -273,18 +451,15 @@ class AssignmentService:
                     )
                 )
         
-        query = query.order_by(desc(Assignment.assigned_date))
-        total = query.count()
-        assignments = query.offset(params.skip).limit(params.limit).all()
-        
-        return AssignmentListResponse(
-            total=total,
-            assignments=[self._to_assignment_response(assignment) for assignment in assignments]
-        )
+        return query
     
-    def get_assignments_by_member(self, member_id: int, active_only: bool = False) -> List[AssignmentResponse]:
+    def export_query(self, search_params: Optional[AssignmentSearchParams] = None):
+        """내보내기 쿼리 (테이블 컬럼 그대로, ID 순)"""
+        return self._apply_filters(select(*Assignment.__table__.columns), search_params).order_by(Assignment.id)
+    
+    async def get_assignments_by_member(self, member_id: int, active_only: bool = False) -> List[AssignmentResponse]:
         """특정 팀원의 담당 배정 조회"""
-        query = self.db.query(Assignment).filter(Assignment.member_id == member_id)
+        query = select(Assignment).filter(Assignment.member_id == member_id)
         
         if active_only:
             today = date.today()
@@ -298,12 +473,12 @@ class AssignmentService:
                 )
             )
         
-        assignments = query.order_by(desc(Assignment.assigned_date)).all()
-        return [self._to_assignment_response(assignment) for assignment in assignments]
+        assignments = (await self.db.scalars(query.order_by(desc(Assignment.assigned_date)))).all()
+        return await self._with_members([self._to_assignment_response(assignment) for assignment in assignments])
     
-    def get_assignments_by_customer(self, customer_id: int, active_only: bool = False) -> List[AssignmentResponse]:
+    async def get_assignments_by_customer(self, customer_id: int, active_only: bool = False) -> List[AssignmentResponse]:
         """특정 고객사의 담당자 배정 조회"""
-        query = self.db.query(Assignment).filter(Assignment.customer_id == customer_id)
+        query = select(Assignment).filter(Assignment.customer_id == customer_id)
         
         if active_only:
             today = date.today()
@@ -317,24 +492,28 @@ class AssignmentService:
                 )
             )
         
-        assignments = query.order_by(Assignment.is_primary.desc(), Assignment.assigned_date.desc()).all()
-        return [self._to_assignment_response(assignment) for assignment in assignments]
+        assignments = (await self.db.scalars(
+            query.order_by(Assignment.is_primary.desc(), Assignment.assigned_date.desc(), Assignment.id.desc())
+        )).all()
+        return await self._with_members([self._to_assignment_response(assignment) for assignment in assignments])
     
-    def update_assignment(self, assignment_id: int, assignment_data: AssignmentUpdate) -> Optional[AssignmentResponse]:
+    async def update_assignment(self, assignment_id: int, assignment_data: AssignmentUpdate) -> Optional[AssignmentResponse]:
         """담당자 배정 수정"""
-        assignment = self.db.query(Assignment).filter(Assignment.id == assignment_id).first()
+        assignment = await self.db.get(Assignment, assignment_id)
         if not assignment:
             return None
         
         if assignment_data.is_primary and assignment_data.is_primary != assignment.is_primary:
-            existing_primary = self.db.query(Assignment).filter(
-                and_(
-                    Assignment.customer_id == assignment.customer_id,
-                    Assignment.is_primary == True,
-                    Assignment.id != assignment_id,
-                    Assignment.end_date.is_(None)
+            existing_primary = await self.db.scalar(
+                select(Assignment).filter(
+                    and_(
+                        Assignment.customer_id == assignment.customer_id,
+                        Assignment.is_primary == True,
+                        Assignment.id != assignment_id,
+                        Assignment.end_date.is_(None)
+                    )
                 )
-            ).first()
+            )
             
             if existing_primary:
                 existing_primary.is_primary = False
@@ -347,50 +526,79 @@ class AssignmentService:
             else:
                 setattr(assignment, field, value)
         
-        self.db.commit()
-        self.db.refresh(assignment)
-        return self._to_assignment_response(assignment)
+        await self.db.commit()
+        await self.db.refresh(assignment)
+        return (await self._with_members([self._to_assignment_response(assignment)]))[0]
     
-    def delete_assignment(self, assignment_id: int) -> bool:
+    async def delete_assignment(self, assignment_id: int) -> bool:
         """담당자 배정 삭제"""
-        assignment = self.db.query(Assignment).filter(Assignment.id == assignment_id).first()
+        assignment = await self.db.get(Assignment, assignment_id)
         if not assignment:
             return False
         
-        self.db.delete(assignment)
-        self.db.commit()
+        await self.db.delete(assignment)
+        await self.db.commit()
         return True
     
-    def get_assignment_stats(self) -> AssignmentStats:
-        """담당자 배정 통계"""
-        total_assignments = self.db.query(Assignment).count()
-        
-        # 활성 배정 (종료일이 없거나 미래인 것)
+    async def get_assignment_stats(self) -> AssignmentStats:
+        """담당자 배정 통계 (조건부 집계로 한 번에 계산)"""
         today = date.today()
-        active_assignments = self.db.query(Assignment).filter(
-            and_(
+        
+        if USE_MATERIALIZED_STATS:
+            # 활성 배정 = 전체 - 시작 전 - 종료됨 (날짜 의존이라 카운터로 유지 불가)
+            counters = await get_stat_counters(
+                self.db,
+                "assignments:",
+                select(literal("assignments:upcoming"), func.count()).select_from(Assignment)
+                .filter(Assignment.assigned_date > today),
+                select(literal("assignments:ended"), func.count()).select_from(Assignment)
+                .filter(Assignment.end_date < today)
+            )
+            total_assignments = counters.get("assignments:total", 0)
+            active_assignments = (
+                total_assignments
+                - counters.get("assignments:upcoming", 0)
+                - counters.get("assignments:ended", 0)
+            )
+            primary_assignments = counters.get("assignments:role:Primary", 0)
+            secondary_assignments = counters.get("assignments:role:Secondary", 0)
+            backup_assignments = counters.get("assignments:role:Backup", 0)
+            member_prefix = "assignments:member:"
+            assignments_by_member = {
+                f"member_{key[len(member_prefix):]}": count
+                for key, count in counters.items()
+                if key.startswith(member_prefix) and count > 0
+            }
+        else:
+            # 활성 배정 (종료일이 없거나 미래인 것)
+            active_filter = and_(
                 Assignment.assigned_date <= today,
                 or_(
                     Assignment.end_date.is_(None),
                     Assignment.end_date >= today
                 )
             )
-        ).count()
-        
-        # 역할별 통계
-        primary_assignments = self.db.query(Assignment).filter(Assignment.role == "Primary").count()
-        secondary_assignments = self.db.query(Assignment).filter(Assignment.role == "Secondary").count()
-        backup_assignments = self.db.query(Assignment).filter(Assignment.role == "Backup").count()
-        
-        # 팀원별 통계 (ID만 - 이름은 다른 서비스에서 조회)
-        member_stats = self.db.query(
-            Assignment.member_id,
-            func.count(Assignment.id).label('count')
-        ).group_by(Assignment.member_id).all()
-        
-        assignments_by_member = {
-            f"member_{member_id}": count for member_id, count in member_stats
-        }
+            
+            # 팀원별로 묶어 한 번의 스캔으로 집계 (ID만 - 이름은 다른 서비스에서 조회)
+            member_stats = (await self.db.execute(
+                select(
+                    Assignment.member_id,
+                    func.count().label("total"),
+                    func.count().filter(active_filter).label("active"),
+                    func.count().filter(Assignment.role == "Primary").label("primary"),
+                    func.count().filter(Assignment.role == "Secondary").label("secondary"),
+                    func.count().filter(Assignment.role == "Backup").label("backup")
+                ).group_by(Assignment.member_id)
+            )).all()
+            
+            total_assignments = sum(row.total for row in member_stats)
+            active_assignments = sum(row.active for row in member_stats)
+            primary_assignments = sum(row.primary for row in member_stats)
+            secondary_assignments = sum(row.secondary for row in member_stats)
+            backup_assignments = sum(row.backup for row in member_stats)
+            assignments_by_member = {
+                f"member_{row.member_id}": row.total for row in member_stats
+            }
         
         return AssignmentStats(
             total_assignments=total_assignments,
@@ -401,7 +609,12 @@ class AssignmentService:
             assignments_by_member=assignments_by_member
         )
     
-    def _to_assignment_response(self, assignment: Assignment) -> AssignmentResponse:
+    async def _with_members(self, assignments: List[AssignmentResponse]) -> List[AssignmentResponse]:
+        """팀원 정보 채우기 (페이지의 팀원을 member-service에서 한 번에 조회)"""
+        return await attach_members(assignments, "member_id", "member", MemberInfo)
+    
+    @staticmethod
+    def _to_assignment_response(assignment: Assignment) -> AssignmentResponse:
         """Assignment 모델을 AssignmentResponse로 변환"""
         return AssignmentResponse(
             id=assignment.id,
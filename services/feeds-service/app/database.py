@@ -0,0 +1,38 @@
+"""
+Feeds Service 데이터베이스 설정
+
+shared/database.py를 사용한 간소화된 설정
+PostgreSQL feeds_schema에 연결 (수집된 피드 항목 저장)
+"""
+
+import sys
+import os
+from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# shared 모듈 import를 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.database import create_database_config, Base
+
+# Feeds Service용 데이터베이스 설정 생성
+db_config = create_database_config("feeds-service")
+
+AsyncSessionLocal = db_config.AsyncSessionLocal
+Base = Base
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션을 생성하고 반환하는 의존성 함수"""
+    async for db in db_config.get_async_db():
+        yield db
+
+def init_db():
+    """데이터베이스 초기화 (feeds_schema 및 테이블 생성)"""
+    # 모든 모델 임포트 (테이블 생성을 위해)
+    from . import models
+    
+    db_config.init_database()
+
+async def close_db():
+    """커넥션 풀 정리"""
+    await db_config.dispose()
@@ -0,0 +1,205 @@
+"""
+TS Portal Feeds Service - 피드 다운로드
+=======================================
+
+업스트림 RSS 피드를 받아 파싱합니다. (수집 워커에서 사용, app/ingest.py)
+
+- 피드 URL별 ETag/Last-Modified를 기억해 조건부 요청을 보내고,
+  변경되지 않은 피드(304)는 다시 받거나 파싱하지 않음
+  (받은 응답의 ETag/Last-Modified는 항목 저장 후 commit_validators를 호출해야 사용 -
+  저장에 실패하면 다음 요청에서 다시 전체를 받음)
+- 업스트림 요청은 앱 lifespan 동안 유지되는 공유 httpx.AsyncClient(연결 수 제한, keep-alive)로 보내고,
+  파싱(CPU 작업)은 이벤트 루프를 막지 않도록 스레드 풀에서 실행
+- 피드별 서킷 브레이커: 연속 FEEDS_BREAKER_THRESHOLD회 실패하면 FEEDS_BREAKER_COOLDOWN 동안
+  업스트림을 호출하지 않고 CircuitOpenError를 발생 (조회 API는 마지막으로 저장된 항목을 계속 제공)
+  대기 시간이 지나면 한 번 시도해 성공하면 정상화, 실패하면 다시 차단
+- 피드별 요청/실패 횟수와 응답 시간을 기록 (/health 노출)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 업스트림 요청 타임아웃 (초) - 연결은 FEEDS_CONNECT_TIMEOUT 안에 맺어지지 않으면 실패
+FEEDS_FETCH_TIMEOUT = float(os.getenv("FEEDS_FETCH_TIMEOUT", "10"))
+FEEDS_CONNECT_TIMEOUT = float(os.getenv("FEEDS_CONNECT_TIMEOUT", "3"))
+
+# 공유 HTTP 클라이언트 연결 수 제한 / keep-alive
+FEEDS_MAX_CONNECTIONS = int(os.getenv("FEEDS_MAX_CONNECTIONS", "10"))
+FEEDS_MAX_KEEPALIVE = int(os.getenv("FEEDS_MAX_KEEPALIVE", "5"))
+FEEDS_KEEPALIVE_EXPIRY = float(os.getenv("FEEDS_KEEPALIVE_EXPIRY", "60"))
+
+# 서킷 브레이커: 연속 실패 횟수 / 차단 시간 (초)
+FEEDS_BREAKER_THRESHOLD = int(os.getenv("FEEDS_BREAKER_THRESHOLD", "3"))
+FEEDS_BREAKER_COOLDOWN = float(os.getenv("FEEDS_BREAKER_COOLDOWN", "300"))
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 업스트림을 호출하지 않음"""
+
+
+@dataclass
+class UpstreamState:
+    """피드 URL 하나의 요청 통계와 서킷 브레이커 상태"""
+    requests: int = 0
+    downloads: int = 0
+    not_modified: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    # 차단 중이라 호출하지 않은 횟수
+    short_circuited: int = 0
+    latency_ms_last: Optional[float] = None
+    latency_ms_total: float = 0.0
+    last_error: Optional[str] = None
+    # 차단 해제 시각 (time.monotonic 기준, 0이면 차단된 적 없음/정상화)
+    open_until: float = 0.0
+    
+    def circuit(self) -> str:
+        """closed(정상) / open(차단 중) / half_open(대기 시간 경과, 다음 요청으로 시험)"""
+        if not self.open_until:
+            return "closed"
+        return "open" if time.monotonic() < self.open_until else "half_open"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "circuit": self.circuit(),
+            "retry_in_seconds": max(0, round(self.open_until - time.monotonic())) if self.open_until else None,
+            "requests": self.requests,
+            "downloads": self.downloads,
+            "not_modified": self.not_modified,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "short_circuited": self.short_circuited,
+            "latency_ms_last": self.latency_ms_last,
+            "latency_ms_avg": round(self.latency_ms_total / self.requests, 1) if self.requests else None,
+            "last_error": self.last_error,
+        }
+
+
+class FeedFetcher:
+    """조건부 요청으로 피드를 받아 파싱하는 다운로더"""
+    
+    def __init__(
+        self,
+        parse: Callable[[bytes], List[Dict[str, Any]]],
+        timeout: float = FEEDS_FETCH_TIMEOUT,
+        breaker_threshold: int = FEEDS_BREAKER_THRESHOLD,
+        breaker_cooldown: float = FEEDS_BREAKER_COOLDOWN
+    ):
+        """
+        Args:
+            parse: 응답 본문을 항목 목록으로 변환하는 함수
+            timeout: 업스트림 요청 타임아웃 (초)
+            breaker_threshold: 차단할 연속 실패 횟수
+            breaker_cooldown: 차단 시간 (초)
+        """
+        self.parse = parse
+        self.timeout = timeout
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        # 피드 URL별 (ETag, Last-Modified)
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # 파싱까지 끝났지만 아직 저장되지 않은 응답의 (ETag, Last-Modified) - commit_validators에서 반영
+        self._pending_validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # 피드 URL별 요청 통계/브레이커 상태
+        self.upstreams: Dict[str, UpstreamState] = {}
+        self.client: Optional[httpx.AsyncClient] = None
+    
+    def open(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 생성 (이미 있으면 그대로 반환)"""
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=min(self.timeout, FEEDS_CONNECT_TIMEOUT)),
+                limits=httpx.Limits(
+                    max_connections=FEEDS_MAX_CONNECTIONS,
+                    max_keepalive_connections=FEEDS_MAX_KEEPALIVE,
+                    keepalive_expiry=FEEDS_KEEPALIVE_EXPIRY
+                )
+            )
+        return self.client
+    
+    async def close(self):
+        """공유 HTTP 클라이언트 종료"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    async def fetch(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        피드를 받아 파싱한 항목 목록 반환
+        
+        응답의 ETag/Last-Modified는 항목을 저장한 뒤 commit_validators(url)를 호출해야
+        다음 조건부 요청에 사용됩니다.
+        
+        Returns:
+            파싱된 항목 목록 (변경 없음(304)이면 None)
+        
+        Raises:
+            CircuitOpenError: 연속 실패로 차단 중 (업스트림 호출 안 함)
+            httpx.HTTPError: 업스트림 요청 실패
+        """
+        state = self.upstreams.setdefault(url, UpstreamState())
+        if state.circuit() == "open":
+            state.short_circuited += 1
+            raise CircuitOpenError(f"연속 {state.consecutive_failures}회 실패로 차단 중: {url}")
+        
+        etag, last_modified = self._validators.get(url, (None, None))
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        state.requests += 1
+        started = time.perf_counter()
+        try:
+            response = await self.open().get(url, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            self._record_failure(state, url, e)
+            raise
+        finally:
+            state.latency_ms_last = round((time.perf_counter() - started) * 1000, 1)
+            state.latency_ms_total += state.latency_ms_last
+        
+        if state.open_until:
+            logger.info(f"✅ 피드 업스트림 정상화: {url}")
+        state.consecutive_failures = 0
+        state.open_until = 0.0
+        
+        if response.status_code == 304:
+            state.not_modified += 1
+            logger.info(f"♻️ 피드 변경 없음 (304): {url}")
+            return None
+        
+        state.downloads += 1
+        items = await asyncio.to_thread(self.parse, response.content)
+        # 파싱에 성공한 경우에만 보관 (항목 저장 후 commit_validators에서 반영)
+        self._pending_validators[url] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return items
+    
+    def commit_validators(self, url: str):
+        """마지막으로 받은 응답의 ETag/Last-Modified를 다음 조건부 요청에 사용 (항목 저장 후 호출)"""
+        validators = self._pending_validators.pop(url, None)
+        if validators is not None:
+            self._validators[url] = validators
+    
+    def _record_failure(self, state: UpstreamState, url: str, error: Exception):
+        """실패 기록 (연속 실패가 기준 이상이면 차단)"""
+        state.failures += 1
+        state.consecutive_failures += 1
+        state.last_error = f"{type(error).__name__}: {str(error).splitlines()[0] if str(error) else ''}"
+        if state.consecutive_failures >= self.breaker_threshold:
+            state.open_until = time.monotonic() + self.breaker_cooldown
+            logger.warning(
+                f"🚫 피드 업스트림 차단 ({self.breaker_cooldown:.0f}초): {url} "
+                f"(연속 {state.consecutive_failures}회 실패)"
+            )
@@ -0,0 +1,145 @@
+"""
+TS Portal Feeds Service - 피드 수집 워커
+========================================
+
+FEEDS_POLL_INTERVAL마다 모든 피드를 동시에 받아 feeds_schema.feed_items에 저장합니다.
+조회 API는 저장된 항목만 읽으므로 업스트림(AWS) 응답을 기다리지 않습니다.
+
+- 같은 피드의 같은 항목(guid, 없으면 link)은 한 번만 저장 (INSERT ... ON CONFLICT DO NOTHING)
+- 변경되지 않은 피드(304)는 저장 단계를 건너뜀
+- 응답의 ETag/Last-Modified는 항목을 커밋한 뒤에만 조건부 요청에 사용
+  (저장에 실패하면 다음 주기에 304 없이 다시 받아 저장)
+- 한 피드의 실패는 다른 피드 수집에 영향을 주지 않으며, 다음 주기에 다시 시도
+  (연속 실패로 차단된 피드는 차단 시간 동안 건너뜀, app/fetcher.py)
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .fetcher import CircuitOpenError, FeedFetcher
+from .models import FeedItem
+
+logger = logging.getLogger(__name__)
+
+# 수집 주기 (초)
+FEEDS_POLL_INTERVAL = float(os.getenv("FEEDS_POLL_INTERVAL", "300"))
+
+
+class FeedIngestor:
+    """피드 수집 스케줄러"""
+    
+    def __init__(
+        self,
+        feeds: Dict[str, Dict[str, Any]],
+        fetcher: FeedFetcher,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval: float = FEEDS_POLL_INTERVAL
+    ):
+        """
+        Args:
+            feeds: 피드 ID별 설정 (url 포함)
+            fetcher: 피드 다운로더
+            session_factory: 저장에 사용할 비동기 세션 팩토리
+            interval: 수집 주기 (초)
+        """
+        self.feeds = feeds
+        self.fetcher = fetcher
+        self.session_factory = session_factory
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        # 피드별 마지막 수집 결과 (/health 노출)
+        self.status: Dict[str, Dict[str, Any]] = {
+            feed_id: {"last_success": None, "last_error": None, "new_items": 0}
+            for feed_id in feeds
+        }
+    
+    async def ingest_feed(self, feed_id: str) -> int:
+        """피드 하나를 받아 새 항목 저장 (저장된 항목 수 반환)"""
+        url = self.feeds[feed_id]["url"]
+        items = await self.fetcher.fetch(url)
+        if items is None:
+            return 0
+        
+        rows = [
+            {
+                "feed_id": feed_id,
+                "guid": item["guid"],
+                "title": item["title"],
+                "link": item["link"],
+                "summary": item["summary"],
+                "published": item["published"],
+                "published_at": item["published_at"],
+                "author": item["author"],
+            }
+            # 피드는 최신순이므로 오래된 항목부터 저장해 id가 최신 항목일수록 커지도록 함
+            for item in reversed(items)
+            if item["guid"]
+        ]
+        if not rows:
+            self.fetcher.commit_validators(url)
+            return 0
+        
+        async with self.session_factory() as db:
+            result = await db.execute(
+                insert(FeedItem)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=[FeedItem.feed_id, FeedItem.guid])
+                .returning(FeedItem.id)
+            )
+            inserted = len(result.all())
+            await db.commit()
+        self.fetcher.commit_validators(url)
+        return inserted
+    
+    async def ingest_all(self) -> Dict[str, int]:
+        """모든 피드를 동시에 수집 (피드별 새 항목 수 반환, 실패하거나 차단 중인 피드는 -1)"""
+        results = await asyncio.gather(
+            *(self.ingest_feed(feed_id) for feed_id in self.feeds),
+            return_exceptions=True
+        )
+        
+        summary = {}
+        for feed_id, result in zip(self.feeds, results):
+            status = self.status[feed_id]
+            if isinstance(result, CircuitOpenError):
+                logger.info(f"⏸️ 피드 수집 건너뜀 {feed_id}: {result}")
+                summary[feed_id] = -1
+            elif isinstance(result, Exception):
+                status["last_error"] = f"{datetime.now().isoformat()} {type(result).__name__}: {result}"
+                logger.error(f"❌ 피드 수집 실패 {feed_id}: {result}")
+                summary[feed_id] = -1
+            else:
+                status["last_success"] = datetime.now().isoformat()
+                status["new_items"] = result
+                if result:
+                    logger.info(f"📥 피드 수집 {feed_id}: 새 항목 {result}개")
+                summary[feed_id] = result
+        return summary
+    
+    async def run(self):
+        """수집 루프 (시작 즉시 1회 수집 후 interval마다 반복)"""
+        while True:
+            await self.ingest_all()
+            await asyncio.sleep(self.interval)
+    
+    def start(self):
+        """백그라운드 수집 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+            logger.info(f"🔄 피드 수집 워커 시작 (주기 {self.interval:.0f}초)")
+    
+    async def stop(self):
+        """백그라운드 수집 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
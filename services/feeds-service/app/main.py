@@ -3,15 +3,30 @@ TS Portal Feeds Service
 ======================
 
 AWS 소식 수집 마이크로서비스 (경량화 버전)
+
+백그라운드 수집 워커(app/ingest.py)가 주기적으로 피드를 받아 feeds_schema에 저장하고,
+조회 API는 저장된 항목만 읽습니다.
 """
 
+import heapq
+import html
 import logging
-from datetime import datetime
-from typing import List, Dict, Any
+import os
+import re
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Literal, Optional
 import feedparser
-import httpx
-from fastapi import FastAPI, HTTPException, APIRouter
+from fastapi import FastAPI, HTTPException, APIRouter, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import AsyncSessionLocal, close_db, get_db, init_db
+from .fetcher import FeedFetcher
+from .ingest import FeedIngestor
+from .models import FeedItem
+from shared.pagination import paginate
 
 # 로깅 설정
 logging.basicConfig(
@@ -20,13 +35,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 피드 항목 목록 정렬 기준 (최근 게시 순)
+FEED_ITEM_ORDER = ((FeedItem.published_at, True), (FeedItem.id, True))
+
+# 요약 최대 길이 (HTML 제거 후 글자 수)
+FEEDS_SUMMARY_LENGTH = int(os.getenv("FEEDS_SUMMARY_LENGTH", "200"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 생명주기 관리"""
+    # 시작 시: feeds_schema 테이블 확인, 공유 HTTP 클라이언트(연결 풀) 생성, 수집 워커 시작
+    init_db()
+    feed_fetcher.open()
+    feed_ingestor.start()
+    logger.info("🚀 Feeds Service 시작 완료!")
+    
+    yield
+    
+    # 종료 시
+    logger.info("👋 Feeds Service 종료 중...")
+    await feed_ingestor.stop()
+    await feed_fetcher.close()
+    await close_db()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="TS Portal Feeds Service",
     version="0.1.0",
     description="AWS 소식 수집 마이크로서비스",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -38,21 +79,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 📰 AWS 피드 목록 (경량화)
+# 📰 AWS 피드 목록 (경량화, URL은 FEED_URL_* 환경변수로 변경 가능 - 로컬 테스트용 스텁 서버 등)
 AWS_FEEDS = {
     "aws-blog": {
         "name": "AWS Blog",
-        "url": "https://aws.amazon.com/blogs/feed/",
+        "url": os.getenv("FEED_URL_AWS_BLOG", "https://aws.amazon.com/blogs/feed/"),
         "description": "AWS 공식 블로그"
     },
     "aws-news": {
         "name": "AWS What's New",
-        "url": "https://aws.amazon.com/about-aws/whats-new/recent/feed/",
+        "url": os.getenv("FEED_URL_AWS_NEWS", "https://aws.amazon.com/about-aws/whats-new/recent/feed/"),
         "description": "AWS 최신 소식"
     },
     "aws-security": {
         "name": "AWS Security Blog", 
-        "url": "https://aws.amazon.com/blogs/security/feed/",
+        "url": os.getenv("FEED_URL_AWS_SECURITY", "https://aws.amazon.com/blogs/security/feed/"),
         "description": "AWS 보안 블로그"
     }
 }
@@ -61,31 +102,70 @@ AWS_FEEDS = {
 feeds_router = APIRouter()
 
 
-async def fetch_feed(feed_url: str, limit: int = 10) -> List[Dict[str, Any]]:
-    """RSS 피드를 가져와서 파싱합니다."""
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(feed_url)
-            response.raise_for_status()
-            
-        # feedparser로 RSS 파싱
-        feed = feedparser.parse(response.content)
-        
-        items = []
-        for entry in feed.entries[:limit]:
-            items.append({
-                "title": entry.get("title", "제목 없음"),
-                "link": entry.get("link", ""),
-                "summary": entry.get("summary", "요약 없음")[:200] + "...",
-                "published": entry.get("published", ""),
-                "author": entry.get("author", "AWS")
-            })
-        
-        return items
-        
-    except Exception as e:
-        logger.error(f"피드 가져오기 실패 {feed_url}: {e}")
-        return []
+def summarize(text: str, max_length: int = FEEDS_SUMMARY_LENGTH) -> str:
+    """HTML 요약을 일반 텍스트로 바꾸고 max_length를 넘으면 단어 경계에서 자릅니다."""
+    text = " ".join(html.unescape(re.sub(r"<[^>]+>", " ", text)).split())
+    if len(text) <= max_length:
+        return text
+    cut = text[:max_length]
+    if " " in cut:
+        cut = cut[:cut.rindex(" ")]
+    return cut.rstrip(" ,.;:") + "…"
+
+
+def published_at(entry, default: datetime) -> datetime:
+    """게시일(없으면 수정일)을 UTC 시각으로 변환 (둘 다 없으면 default)"""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return default
+    return datetime(*parsed[:6], tzinfo=timezone.utc)
+
+
+def parse_feed(content: bytes) -> List[Dict[str, Any]]:
+    """RSS 피드 본문을 파싱합니다. (수집 시 한 번만 실행)"""
+    feed = feedparser.parse(content)
+    fetched_at = datetime.now(timezone.utc)
+    
+    items = []
+    for entry in feed.entries:
+        items.append({
+            "guid": entry.get("id") or entry.get("link", ""),
+            "title": entry.get("title", "제목 없음"),
+            "link": entry.get("link", ""),
+            "summary": summarize(entry.get("summary", "")) or "요약 없음",
+            "published": entry.get("published", ""),
+            "published_at": published_at(entry, fetched_at),
+            "author": entry.get("author", "AWS")
+        })
+    
+    return items
+
+
+# 📥 피드 다운로드 (조건부 요청) 및 백그라운드 수집 워커
+feed_fetcher = FeedFetcher(parse_feed)
+feed_ingestor = FeedIngestor(AWS_FEEDS, feed_fetcher, AsyncSessionLocal)
+
+
+def item_to_dict(item: FeedItem) -> Dict[str, Any]:
+    """저장된 피드 항목을 응답 dict로 변환"""
+    data = item.to_dict()
+    data["feed_name"] = AWS_FEEDS.get(item.feed_id, {}).get("name", item.feed_id)
+    return data
+
+
+def window_filter(query, since: Optional[datetime], until: Optional[datetime]):
+    """since 이후 ~ until 이전에 게시된 항목만 조회 (since <= 게시일 < until, 시간대가 없으면 UTC로 간주)"""
+    since, until = (
+        value.replace(tzinfo=timezone.utc) if value is not None and value.tzinfo is None else value
+        for value in (since, until)
+    )
+    if since is not None and until is not None and since >= until:
+        raise HTTPException(status_code=400, detail="since는 until보다 이전 시각이어야 합니다.")
+    if since is not None:
+        query = query.filter(FeedItem.published_at >= since)
+    if until is not None:
+        query = query.filter(FeedItem.published_at < until)
+    return query
 
 
 @app.get("/")
@@ -101,7 +181,7 @@ async def root():
             "/api/feeds": "사용 가능한 피드 목록",
             "/api/feeds/all": "모든 피드 최신 소식",
             "/api/feeds/{feed_id}": "특정 피드 조회",
-            "/api/feeds/latest": "최신 AWS 소식",
+            "/api/feeds/latest": "전체 피드 최신 소식",
             "/health": "헬스체크"
         }
     }
@@ -109,12 +189,22 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """헬스체크 엔드포인트"""
+    """헬스체크 엔드포인트 (피드별 수집 상태, 업스트림 요청 통계/차단 상태 포함)"""
+    upstreams = {
+        feed_id: feed_fetcher.upstreams[feed_info["url"]].to_dict()
+        for feed_id, feed_info in AWS_FEEDS.items()
+        if feed_info["url"] in feed_fetcher.upstreams
+    }
+    # 업스트림이 차단되어도 조회 API는 저장된 항목으로 응답하므로 degraded로만 표시
+    degraded = any(upstream["circuit"] != "closed" for upstream in upstreams.values())
+    
     return {
-        "status": "healthy",
+        "status": "degraded" if degraded else "healthy",
         "service": "feeds-service",
         "timestamp": datetime.now().isoformat(),
-        "feeds_available": len(AWS_FEEDS)
+        "feeds_available": len(AWS_FEEDS),
+        "ingestion": feed_ingestor.status,
+        "upstreams": upstreams
     }
 
 
@@ -128,57 +218,83 @@ async def get_feeds():
 
 
 @feeds_router.get("/all")
-async def get_all_feeds(limit: int = 5):
+async def get_all_feeds(
+    limit: int = Query(5, ge=1, le=100, description="피드별 최대 항목 수"),
+    since: Optional[datetime] = Query(None, description="이 시각 이후 게시된 항목만"),
+    until: Optional[datetime] = Query(None, description="이 시각 이전에 게시된 항목만"),
+    db: AsyncSession = Depends(get_db)
+):
     """모든 피드에서 최신 소식을 가져옵니다."""
-    all_items = []
-    
-    for feed_id, feed_info in AWS_FEEDS.items():
-        logger.info(f"피드 수집 중: {feed_info['name']}")
-        items = await fetch_feed(feed_info["url"], limit)
-        
-        for item in items:
-            item["feed_id"] = feed_id
-            item["feed_name"] = feed_info["name"]
-            
-        all_items.extend(items)
+    # 피드별 최신 limit개 (feed_id, published_at, id 인덱스 범위 조회 - 이미 최신순으로 정렬됨)
+    feed_items = []
+    for feed_id in AWS_FEEDS:
+        query = window_filter(select(FeedItem).filter(FeedItem.feed_id == feed_id), since, until)
+        query = query.order_by(FeedItem.published_at.desc(), FeedItem.id.desc()).limit(limit)
+        feed_items.append((await db.scalars(query)).all())
     
-    # 최신순 정렬 (간단히 제목 기준)
-    all_items.sort(key=lambda x: x.get("published", ""), reverse=True)
+    # 정렬된 피드별 목록을 다시 정렬하지 않고 k-way 병합
+    all_items = list(heapq.merge(*feed_items, key=lambda item: (item.published_at, item.id), reverse=True))
     
     return {
-        "items": all_items[:limit * len(AWS_FEEDS)],
+        "items": [item_to_dict(item) for item in all_items],
         "total": len(all_items),
         "timestamp": datetime.now().isoformat()
     }
 
 
 @feeds_router.get("/latest")
-async def get_latest_news(limit: int = 3):
-    """오늘의 AWS 소식 (가장 간단한 버전)"""
-    items = await fetch_feed(AWS_FEEDS["aws-news"]["url"], limit)
+async def get_latest_news(
+    limit: int = Query(3, ge=1, le=100, description="가져올 개수"),
+    feed_id: Optional[str] = Query(None, description="피드 ID (없으면 전체 피드)"),
+    since: Optional[datetime] = Query(None, description="이 시각 이후 게시된 항목만"),
+    until: Optional[datetime] = Query(None, description="이 시각 이전에 게시된 항목만"),
+    db: AsyncSession = Depends(get_db)
+):
+    """최신 AWS 소식 (전체 피드 또는 특정 피드)"""
+    if feed_id is not None and feed_id not in AWS_FEEDS:
+        raise HTTPException(status_code=404, detail=f"피드를 찾을 수 없습니다: {feed_id}")
+    
+    query = window_filter(select(FeedItem), since, until)
+    if feed_id is not None:
+        query = query.filter(FeedItem.feed_id == feed_id)
+    page = await paginate(db, query, FEED_ITEM_ORDER, limit, count="none")
     
     return {
-        "latest_news": items,
-        "total": len(items),
+        "latest_news": [item_to_dict(item) for item in page.items],
+        "total": len(page.items),
         "timestamp": datetime.now().isoformat()
     }
 
 
 @feeds_router.get("/{feed_id}")
-async def get_feed(feed_id: str, limit: int = 10):
+async def get_feed(
+    feed_id: str,
+    limit: int = Query(10, ge=1, le=100, description="가져올 개수"),
+    skip: int = Query(0, ge=0, description="건너뛸 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    count: Literal["exact", "estimate", "none"] = Query("exact", description="전체 개수 계산 방식"),
+    since: Optional[datetime] = Query(None, description="이 시각 이후 게시된 항목만"),
+    until: Optional[datetime] = Query(None, description="이 시각 이전에 게시된 항목만"),
+    db: AsyncSession = Depends(get_db)
+):
     """특정 피드의 최신 소식을 가져옵니다."""
     if feed_id not in AWS_FEEDS:
         raise HTTPException(status_code=404, detail=f"피드를 찾을 수 없습니다: {feed_id}")
     
     feed_info = AWS_FEEDS[feed_id]
-    items = await fetch_feed(feed_info["url"], limit)
+    query = window_filter(select(FeedItem).filter(FeedItem.feed_id == feed_id), since, until)
+    try:
+        page = await paginate(db, query, FEED_ITEM_ORDER, limit, skip=skip, cursor=cursor, count=count)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return {
         "feed_id": feed_id,
         "feed_name": feed_info["name"],
         "description": feed_info["description"],
-        "items": items,
-        "total": len(items),
+        "items": [item_to_dict(item) for item in page.items],
+        "total": page.total,
+        "next_cursor": page.next_cursor,
         "timestamp": datetime.now().isoformat()
     }
 
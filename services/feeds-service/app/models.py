@@ -0,0 +1,49 @@
+"""
+Feeds Service 모델 정의
+"""
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.sql import func
+from .database import Base
+
+
+class FeedItem(Base):
+    """수집된 피드 항목 (feeds_schema.feed_items)"""
+    __tablename__ = "feed_items"
+    __table_args__ = (
+        # 같은 피드의 같은 항목(guid, 없으면 link)은 한 번만 저장
+        UniqueConstraint("feed_id", "guid", name="uq_feed_items_feed_guid"),
+        # 피드별/전체 목록 cursor 페이지네이션 및 게시일 구간 조회 (published_at DESC, id DESC)
+        Index("idx_feed_items_feed_published", "feed_id", "published_at", "id"),
+        Index("idx_feed_items_published", "published_at", "id"),
+        {"schema": "feeds_schema"},
+    )
+    
+    id = Column(Integer, primary_key=True)
+    feed_id = Column(String(50), nullable=False, comment="피드 ID (AWS_FEEDS 키)")
+    guid = Column(Text, nullable=False, comment="항목 식별자 (RSS guid, 없으면 link)")
+    title = Column(Text, nullable=False, comment="제목")
+    link = Column(Text, nullable=False, default="", comment="원문 링크")
+    summary = Column(Text, comment="요약")
+    published = Column(String(100), comment="게시일 (피드 원문)")
+    published_at = Column(DateTime(timezone=True), nullable=False, comment="게시일시 (UTC, 없으면 수집일시)")
+    author = Column(String(200), comment="작성자")
+    
+    # 최초 수집 일시
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), comment="수집일시")
+    
+    def __repr__(self):
+        return f"<FeedItem(id={self.id}, feed_id='{self.feed_id}', title='{self.title}')>"
+    
+    def to_dict(self) -> dict:
+        """API 응답용 dict (기존 실시간 조회 응답과 같은 필드)"""
+        return {
+            "title": self.title,
+            "link": self.link,
+            "summary": self.summary,
+            "published": self.published,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "author": self.author,
+            "feed_id": self.feed_id,
+            "collected_at": self.created_at.isoformat() if self.created_at else None
+        }
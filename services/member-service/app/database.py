@@ -10,7 +10,7 @@ import os
 # shared 모듈 import를 위한 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from shared.database import create_database_config, Base
+from shared.database import create_database_config, Base, add_statement_count_middleware, MEMBER_CHANGES_CHANNEL
 
 # Member Service용 데이터베이스 설정 생성
 db_config = create_database_config("member-service")
@@ -18,8 +18,10 @@ db_config = create_database_config("member-service")
 # 기존 인터페이스 호환성을 위한 export
 engine = db_config.engine
 SessionLocal = db_config.SessionLocal
-get_db = db_config.get_db
+AsyncSessionLocal = db_config.AsyncSessionLocal
+get_db = db_config.get_async_db  # 비동기 세션 의존성 (이벤트 루프 블로킹 방지)
 check_database_connection = db_config.check_connection
+close_database = db_config.dispose
 init_database = db_config.init_database
 
 # 추가 편의 함수들
@@ -12,9 +12,11 @@ import logging
 import os
 from typing import Optional
 
-from .database import engine, Base, get_db, check_database_connection
+from .database import engine, Base, get_db, check_database_connection, close_database, add_statement_count_middleware
 from .routers import member_router
 
+from shared.passwords import shutdown_password_pool
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -48,6 +50,8 @@ async def lifespan(app: FastAPI):
     
     # 종료 시
     logger.info("👋 Member Service 종료 중...")
+    shutdown_password_pool()
+    await close_database()
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -66,6 +70,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 SQL 실행 횟수 계측 (X-DB-Statements 헤더)
+add_statement_count_middleware(app)
+
 # 라우터 등록
 app.include_router(member_router, prefix="/api/members", tags=["members"])
 
@@ -6,9 +6,9 @@ Member Service - API 라우터
 
 import logging
 import math
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Header, Query
-from sqlalchemy.orm import Session
+from typing import Optional, List, Literal
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .database import get_db
 from .service import MemberService
@@ -16,30 +16,36 @@ from .models import UserRole
 from .schemas import (
     MemberCreate, MemberUpdate, MemberResponse, MemberListResponse,
     MemberListPaginated, PasswordChange, RoleChange, MemberFilter,
-    SkillsResponse, MemberStats
+    SkillsResponse, MemberStats, MemberSummary
 )
 
+# shared 모듈 import를 위한 경로 추가
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.auth import AuthenticatedUser, get_current_user, get_optional_user
+from shared.cache import cached
+
 logger = logging.getLogger(__name__)
 
+# 일괄 조회 최대 ID 수 (shared/members.py의 클라이언트는 이 크기로 나눠 요청)
+MEMBER_BATCH_MAX_IDS = int(os.getenv("MEMBER_BATCH_MAX_IDS", "100"))
+
 # 라우터 생성
 member_router = APIRouter()
 
 
-def get_current_user_id(x_user_id: Optional[str] = Header(None)) -> Optional[int]:
-    """현재 사용자 ID 추출 (API Gateway에서 전달)"""
-    if x_user_id:
-        try:
-            return int(x_user_id)
-        except ValueError:
-            return None
-    return None
+def get_current_user_id(user: Optional[AuthenticatedUser] = Depends(get_optional_user)) -> Optional[int]:
+    """현재 사용자 ID 추출 (JWT 로컬 검증 또는 API Gateway 헤더)"""
+    return user.user_id if user else None
 
 
-def get_current_user_role(x_user_role: Optional[str] = Header(None)) -> Optional[UserRole]:
-    """현재 사용자 권한 추출 (API Gateway에서 전달)"""
-    if x_user_role:
+def get_current_user_role(user: Optional[AuthenticatedUser] = Depends(get_optional_user)) -> Optional[UserRole]:
+    """현재 사용자 권한 추출 (JWT 로컬 검증 또는 API Gateway 헤더)"""
+    if user:
         try:
-            return UserRole(x_user_role)
+            return UserRole(user.role)
         except ValueError:
             return UserRole.USER
     return UserRole.USER
@@ -66,7 +72,7 @@ def require_power_user_or_above(user_role: UserRole = Depends(get_current_user_r
 @member_router.post("/", response_model=MemberResponse, status_code=status.HTTP_201_CREATED)
 async def create_member(
     member_data: MemberCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: None = Depends(require_admin)  # 관리자만 멤버 생성 가능
 ):
     """
@@ -76,7 +82,7 @@ async def create_member(
     - 이메일 중복 확인 후 생성
     """
     service = MemberService(db)
-    return service.create_member(member_data)
+    return await service.create_member(member_data)
 
 
 @member_router.get("/", response_model=MemberListPaginated)
@@ -90,7 +96,9 @@ async def get_members(
     role: Optional[UserRole] = Query(None, description="권한별 필터"),
     is_active: Optional[bool] = Query(None, description="재직 여부 필터"),
     skills: Optional[str] = Query(None, description="기술별 검색"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (page 대신 사용)"),
+    count: Literal["exact", "estimate", "none"] = Query("exact", description="전체 개수 계산 방식"),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     멤버 목록 조회 (페이지네이션 및 필터링)
@@ -114,25 +122,67 @@ async def get_members(
     # 페이지네이션 계산
     skip = (page - 1) * size
     
-    members, total = service.get_members(skip=skip, limit=size, filters=filters)
+    try:
+        members, total, next_cursor = await service.get_members(
+            skip=skip, limit=size, filters=filters, cursor=cursor, count=count
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     # 응답 데이터 변환
     items = [MemberListResponse.from_orm(member) for member in members]
-    pages = math.ceil(total / size) if total > 0 else 1
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / size) if total > 0 else 1
     
     return MemberListPaginated(
         items=items,
         total=total,
         page=page,
         size=size,
-        pages=pages
+        pages=pages,
+        next_cursor=next_cursor
     )
 
 
+@member_router.get("/batch", response_model=List[MemberSummary])
+@cached("members")
+async def get_members_batch(
+    ids: List[str] = Query(..., description="멤버 ID 목록 (ids=1,2,3 또는 ids=1&ids=2)"),
+    db: AsyncSession = Depends(get_db),
+    _: AuthenticatedUser = Depends(get_current_user)
+):
+    """
+    멤버 요약 일괄 조회
+    
+    - **로그인 필요** (다른 서비스는 shared/members.py의 서비스 토큰으로 호출)
+    - 공지사항 작성자, 일정 생성자, 담당 배정 팀원 정보를 한 번에 채우는 용도
+    - 없는 ID는 결과에서 제외
+    """
+    try:
+        member_ids = sorted({int(value) for item in ids for value in item.split(",") if value.strip()})
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids는 숫자 목록이어야 합니다."
+        )
+    if len(member_ids) > MEMBER_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {MEMBER_BATCH_MAX_IDS}명까지 조회할 수 있습니다."
+        )
+    
+    service = MemberService(db)
+    return [MemberSummary.from_orm(member) for member in await service.get_members_by_ids(member_ids)]
+
+
 @member_router.get("/{member_id}", response_model=MemberResponse)
 async def get_member(
     member_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: Optional[int] = Depends(get_current_user_id),
     current_user_role: UserRole = Depends(get_current_user_role)
 ):
@@ -143,7 +193,7 @@ async def get_member(
     - 다른 사람 정보는 파워유저 이상만 조회 가능
     """
     service = MemberService(db)
-    member = service.get_member_by_id(member_id)
+    member = await service.get_member_by_id(member_id)
     
     if not member:
         raise HTTPException(
@@ -165,7 +215,7 @@ async def get_member(
 async def update_member(
     member_id: int,
     member_data: MemberUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: Optional[int] = Depends(get_current_user_id),
     current_user_role: UserRole = Depends(get_current_user_role)
 ):
@@ -184,7 +234,7 @@ async def update_member(
             detail="본인 정보만 수정할 수 있습니다."
         )
     
-    updated_member = service.update_member(member_id, member_data)
+    updated_member = await service.update_member(member_id, member_data)
     
     if not updated_member:
         raise HTTPException(
@@ -199,7 +249,7 @@ async def update_member(
 async def change_password(
     member_id: int,
     password_data: PasswordChange,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: Optional[int] = Depends(get_current_user_id)
 ):
     """
@@ -215,7 +265,7 @@ async def change_password(
         )
     
     service = MemberService(db)
-    success = service.change_password(member_id, password_data)
+    success = await service.change_password(member_id, password_data)
     
     if not success:
         raise HTTPException(
@@ -230,7 +280,7 @@ async def change_password(
 async def change_member_role(
     member_id: int,
     role_data: RoleChange,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: None = Depends(require_admin)  # 관리자만 권한 변경 가능
 ):
     """
@@ -239,7 +289,7 @@ async def change_member_role(
     - **관리자 권한 필요**
     """
     service = MemberService(db)
-    updated_member = service.change_role(member_id, role_data)
+    updated_member = await service.change_role(member_id, role_data)
     
     if not updated_member:
         raise HTTPException(
@@ -253,7 +303,7 @@ async def change_member_role(
 @member_router.delete("/{member_id}", status_code=status.HTTP_200_OK)
 async def delete_member(
     member_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: None = Depends(require_admin)  # 관리자만 삭제 가능
 ):
     """
@@ -263,7 +313,7 @@ async def delete_member(
     - 실제 삭제가 아닌 비활성화 처리
     """
     service = MemberService(db)
-    success = service.delete_member(member_id)
+    success = await service.delete_member(member_id)
     
     if not success:
         raise HTTPException(
@@ -277,7 +327,7 @@ async def delete_member(
 @member_router.post("/{member_id}/login", status_code=status.HTTP_200_OK)
 async def update_last_login(
     member_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     마지막 로그인 시간 업데이트
@@ -285,7 +335,7 @@ async def update_last_login(
     - 인증 서비스에서 호출하는 내부 API
     """
     service = MemberService(db)
-    success = service.update_last_login(member_id)
+    success = await service.update_last_login(member_id)
     
     if not success:
         raise HTTPException(
@@ -297,8 +347,9 @@ async def update_last_login(
 
 
 @member_router.get("/skills/all", response_model=SkillsResponse)
+@cached("members")
 async def get_all_skills(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: None = Depends(require_power_user_or_above)  # 파워유저 이상만 조회
 ):
     """
@@ -308,14 +359,14 @@ async def get_all_skills(
     - 팀원들이 등록한 모든 기술의 유니크 리스트
     """
     service = MemberService(db)
-    skills = service.get_all_skills()
+    skills = await service.get_all_skills()
     
     return SkillsResponse(skills=skills)
 
 
 @member_router.get("/stats/overview", response_model=MemberStats)
 async def get_member_statistics(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: None = Depends(require_power_user_or_above)  # 파워유저 이상만 조회
 ):
     """
@@ -325,4 +376,4 @@ async def get_member_statistics(
     - 팀별, 권한별, 직급별 통계 제공
     """
     service = MemberService(db)
-    return service.get_member_stats() 
\ No newline at end of file
+    return await service.get_member_stats() 
\ No newline at end of file
@@ -96,6 +96,20 @@ class MemberListResponse(BaseModel):
         from_attributes = True
 
 
+# 멤버 요약 (다른 서비스의 작성자/담당자 정보용)
+class MemberSummary(BaseModel):
+    """멤버 요약 응답 스키마 (GET /batch)"""
+    id: int = Field(..., description="멤버 ID")
+    name: str = Field(..., description="이름")
+    email: str = Field(..., description="이메일")
+    position: Optional[str] = Field(None, description="직급/직책")
+    team: Optional[str] = Field(None, description="소속팀")
+    is_active: bool = Field(..., description="재직 여부")
+    
+    class Config:
+        from_attributes = True
+
+
 # 기술 목록 응답
 class SkillsResponse(BaseModel):
     """기술 목록 응답 스키마"""
@@ -118,10 +132,11 @@ class MemberFilter(BaseModel):
 class MemberListPaginated(BaseModel):
     """페이지네이션된 멤버 목록 응답"""
     items: List[MemberListResponse] = Field(..., description="멤버 목록")
-    total: int = Field(..., description="전체 개수")
+    total: Optional[int] = Field(None, description="전체 개수 (count=none이면 생략)")
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지 크기")
-    pages: int = Field(..., description="전체 페이지 수")
+    pages: Optional[int] = Field(None, description="전체 페이지 수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 없음)")
 
 
 # 멤버 통계
@@ -5,37 +5,57 @@ Member Service - 비즈니스 로직
 """
 
 import logging
-import hashlib
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_, or_, func, text
 from fastapi import HTTPException, status
 
+from .database import MEMBER_CHANGES_CHANNEL
 from .models import Member, UserRole
 from .schemas import (
     MemberCreate, MemberUpdate, PasswordChange, RoleChange,
     MemberFilter, MemberStats
 )
 
+# shared 모듈 import를 위한 경로 추가
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.cache import response_cache
+from shared.pagination import paginate
+from shared.passwords import hash_password_async, verify_password_async
+
 logger = logging.getLogger(__name__)
 
+# 목록 정렬 키: 최근 등록 순 (마지막은 고유 키, cursor 페이지네이션 기준)
+MEMBER_ORDER = ((Member.created_at, True), (Member.id, True))
+
+# 멤버 정보(이름, 이메일 등)를 채워 넣어 캐시하는 다른 서비스의 응답 캐시 리소스
+# (calendar-service 일정 생성자, notice-service 공지 작성자) - 멤버 수정/비활성화 시 함께 무효화
+MEMBER_EMBEDDED_RESOURCES = ("events", "notices")
+
 
 class MemberService:
     """멤버 관리 서비스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def hash_password(self, password: str) -> str:
-        """비밀번호 해싱"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    async def hash_password(self, password: str) -> str:
+        """비밀번호 해싱 (scrypt, shared/passwords.py 해싱 풀에서 실행)"""
+        return await hash_password_async(password)
+    
+    async def verify_password(self, password: str, password_hash: str) -> bool:
+        """비밀번호 검증 (기존 SHA-256 해시 포함, 해싱 풀에서 실행)"""
+        return await verify_password_async(password, password_hash)
     
-    def verify_password(self, password: str, password_hash: str) -> bool:
-        """비밀번호 검증"""
-        return hashlib.sha256(password.encode()).hexdigest() == password_hash
+    async def notify_member_changed(self, member_id: int):
+        """멤버 변경 알림 (auth-service 토큰 캐시 무효화, 트랜잭션 커밋 시 전달됨)"""
+        await self.db.execute(select(func.pg_notify(MEMBER_CHANGES_CHANNEL, str(member_id))))
     
-    def create_member(self, member_data: MemberCreate) -> Member:
+    async def create_member(self, member_data: MemberCreate) -> Member:
         """
         새 멤버 생성
         
@@ -50,9 +70,9 @@ class MemberService:
         """
         try:
             # 이메일 중복 확인
-            existing_member = self.db.query(Member).filter(
-                Member.email == member_data.email
-            ).first()
+            existing_member = await self.db.scalar(
+                select(Member).filter(Member.email == member_data.email)
+            )
             
             if existing_member:
                 raise HTTPException(
@@ -61,7 +81,7 @@ class MemberService:
                 )
             
             # 비밀번호 해싱
-            password_hash = self.hash_password(member_data.password)
+            password_hash = await self.hash_password(member_data.password)
             
             # 멤버 객체 생성
             db_member = Member(
@@ -79,8 +99,9 @@ class MemberService:
             )
             
             self.db.add(db_member)
-            self.db.commit()
-            self.db.refresh(db_member)
+            await self.db.commit()
+            await response_cache.invalidate("members")
+            await self.db.refresh(db_member)
             
             logger.info(f"새 멤버 생성 완료: {db_member.email}")
             return db_member
@@ -88,27 +109,37 @@ class MemberService:
         except HTTPException:
             raise
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"멤버 생성 실패: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="멤버 생성 중 오류가 발생했습니다."
             )
     
-    def get_member_by_id(self, member_id: int) -> Optional[Member]:
+    async def get_member_by_id(self, member_id: int) -> Optional[Member]:
         """ID로 멤버 조회"""
-        return self.db.query(Member).filter(Member.id == member_id).first()
+        return await self.db.get(Member, member_id)
     
-    def get_member_by_email(self, email: str) -> Optional[Member]:
+    async def get_member_by_email(self, email: str) -> Optional[Member]:
         """이메일로 멤버 조회"""
-        return self.db.query(Member).filter(Member.email == email).first()
+        return await self.db.scalar(select(Member).filter(Member.email == email))
     
-    def get_members(
+    async def get_members_by_ids(self, member_ids: List[int]) -> List[Member]:
+        """ID 목록으로 멤버 일괄 조회 (없는 ID는 제외, ID 순)"""
+        if not member_ids:
+            return []
+        return (await self.db.scalars(
+            select(Member).filter(Member.id.in_(member_ids)).order_by(Member.id)
+        )).all()
+    
+    async def get_members(
         self,
         skip: int = 0,
         limit: int = 100,
-        filters: Optional[MemberFilter] = None
-    ) -> tuple[List[Member], int]:
+        filters: Optional[MemberFilter] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact"
+    ) -> tuple[List[Member], Optional[int], Optional[str]]:
         """
         멤버 목록 조회 (필터링 및 페이지네이션)
         
@@ -116,11 +147,13 @@ class MemberService:
             skip: 건너뛸 개수
             limit: 조회할 개수
             filters: 검색 필터
+            cursor: 이전 응답의 next_cursor (지정 시 skip 대신 사용)
+            count: 전체 개수 계산 방식 (exact, estimate, none)
             
         Returns:
-            tuple: (멤버 리스트, 전체 개수)
+            tuple: (멤버 리스트, 전체 개수, 다음 페이지 cursor)
         """
-        query = self.db.query(Member)
+        query = select(Member)
         
         # 필터 적용
         if filters:
@@ -139,15 +172,12 @@ class MemberService:
             if filters.skills:
                 query = query.filter(Member.skills.ilike(f"%{filters.skills}%"))
         
-        # 전체 개수 조회
-        total = query.count()
-        
-        # 페이지네이션 적용하여 결과 조회
-        members = query.order_by(Member.created_at.desc()).offset(skip).limit(limit).all()
+        # 전체 개수 조회 + 페이지네이션 적용하여 결과 조회
+        page = await paginate(self.db, query, MEMBER_ORDER, limit, skip=skip, cursor=cursor, count=count)
         
-        return members, total
+        return page.items, page.total, page.next_cursor
     
-    def update_member(self, member_id: int, member_data: MemberUpdate) -> Optional[Member]:
+    async def update_member(self, member_id: int, member_data: MemberUpdate) -> Optional[Member]:
         """
         멤버 정보 업데이트
         
@@ -159,7 +189,7 @@ class MemberService:
             Member: 업데이트된 멤버 객체
         """
         try:
-            db_member = self.get_member_by_id(member_id)
+            db_member = await self.get_member_by_id(member_id)
             if not db_member:
                 return None
             
@@ -170,21 +200,23 @@ class MemberService:
             
             db_member.updated_at = datetime.utcnow()
             
-            self.db.commit()
-            self.db.refresh(db_member)
+            await self.notify_member_changed(member_id)
+            await self.db.commit()
+            await response_cache.invalidate("members", *MEMBER_EMBEDDED_RESOURCES)
+            await self.db.refresh(db_member)
             
             logger.info(f"멤버 정보 업데이트 완료: {db_member.email}")
             return db_member
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"멤버 업데이트 실패: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="멤버 정보 업데이트 중 오류가 발생했습니다."
             )
     
-    def change_password(self, member_id: int, password_data: PasswordChange) -> bool:
+    async def change_password(self, member_id: int, password_data: PasswordChange) -> bool:
         """
         비밀번호 변경
         
@@ -196,22 +228,22 @@ class MemberService:
             bool: 성공 여부
         """
         try:
-            db_member = self.get_member_by_id(member_id)
+            db_member = await self.get_member_by_id(member_id)
             if not db_member:
                 return False
             
             # 현재 비밀번호 확인
-            if not self.verify_password(password_data.current_password, db_member.password_hash):
+            if not await self.verify_password(password_data.current_password, db_member.password_hash):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="현재 비밀번호가 일치하지 않습니다."
                 )
             
             # 새 비밀번호 해싱 및 저장
-            db_member.password_hash = self.hash_password(password_data.new_password)
+            db_member.password_hash = await self.hash_password(password_data.new_password)
             db_member.updated_at = datetime.utcnow()
             
-            self.db.commit()
+            await self.db.commit()
             
             logger.info(f"비밀번호 변경 완료: {db_member.email}")
             return True
@@ -219,14 +251,14 @@ class MemberService:
         except HTTPException:
             raise
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"비밀번호 변경 실패: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="비밀번호 변경 중 오류가 발생했습니다."
             )
     
-    def change_role(self, member_id: int, role_data: RoleChange) -> Optional[Member]:
+    async def change_role(self, member_id: int, role_data: RoleChange) -> Optional[Member]:
         """
         멤버 권한 변경 (관리자만)
         
@@ -238,28 +270,29 @@ class MemberService:
             Member: 업데이트된 멤버 객체
         """
         try:
-            db_member = self.get_member_by_id(member_id)
+            db_member = await self.get_member_by_id(member_id)
             if not db_member:
                 return None
             
             db_member.role = role_data.role
             db_member.updated_at = datetime.utcnow()
             
-            self.db.commit()
-            self.db.refresh(db_member)
+            await self.notify_member_changed(member_id)
+            await self.db.commit()
+            await self.db.refresh(db_member)
             
             logger.info(f"멤버 권한 변경 완료: {db_member.email} -> {role_data.role}")
             return db_member
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"권한 변경 실패: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="권한 변경 중 오류가 발생했습니다."
             )
     
-    def delete_member(self, member_id: int) -> bool:
+    async def delete_member(self, member_id: int) -> bool:
         """
         멤버 삭제 (비활성화)
         
@@ -270,7 +303,7 @@ class MemberService:
             bool: 성공 여부
         """
         try:
-            db_member = self.get_member_by_id(member_id)
+            db_member = await self.get_member_by_id(member_id)
             if not db_member:
                 return False
             
@@ -278,20 +311,22 @@ class MemberService:
             db_member.is_active = False
             db_member.updated_at = datetime.utcnow()
             
-            self.db.commit()
+            await self.notify_member_changed(member_id)
+            await self.db.commit()
+            await response_cache.invalidate("members", *MEMBER_EMBEDDED_RESOURCES)
             
             logger.info(f"멤버 비활성화 완료: {db_member.email}")
             return True
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"멤버 삭제 실패: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="멤버 삭제 중 오류가 발생했습니다."
             )
     
-    def update_last_login(self, member_id: int) -> bool:
+    async def update_last_login(self, member_id: int) -> bool:
         """
         마지막 로그인 시간 업데이트
         
@@ -302,27 +337,29 @@ class MemberService:
             bool: 성공 여부
         """
         try:
-            db_member = self.get_member_by_id(member_id)
+            db_member = await self.get_member_by_id(member_id)
             if not db_member:
                 return False
             
             db_member.last_login = datetime.utcnow()
-            self.db.commit()
+            await self.db.commit()
             
             return True
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"로그인 시간 업데이트 실패: {e}")
             return False
     
-    def get_all_skills(self) -> List[str]:
+    async def get_all_skills(self) -> List[str]:
         """모든 기술 목록 조회"""
         try:
-            skills_data = self.db.query(Member.skills).filter(
-                Member.skills.isnot(None),
-                Member.is_active == True
-            ).all()
+            skills_data = (await self.db.execute(
+                select(Member.skills).filter(
+                    Member.skills.isnot(None),
+                    Member.is_active == True
+                )
+            )).all()
             
             all_skills = set()
             for (skills_str,) in skills_data:
@@ -336,43 +373,50 @@ class MemberService:
             logger.error(f"기술 목록 조회 실패: {e}")
             return []
     
-    def get_member_stats(self) -> MemberStats:
+    async def get_member_stats(self) -> MemberStats:
         """멤버 통계 조회"""
         try:
             # 기본 통계
-            total_members = self.db.query(Member).count()
-            active_members = self.db.query(Member).filter(Member.is_active == True).count()
+            count_all = select(func.count()).select_from(Member)
+            total_members = await self.db.scalar(count_all)
+            active_members = await self.db.scalar(count_all.filter(Member.is_active == True))
             inactive_members = total_members - active_members
             
             # 팀별 통계
-            team_stats = self.db.query(
-                Member.team,
-                func.count(Member.id)
-            ).filter(Member.is_active == True).group_by(Member.team).all()
+            team_stats = (await self.db.execute(
+                select(
+                    Member.team,
+                    func.count(Member.id)
+                ).filter(Member.is_active == True).group_by(Member.team)
+            )).all()
             by_team = {team: count for team, count in team_stats}
             
             # 권한별 통계
-            role_stats = self.db.query(
-                Member.role,
-                func.count(Member.id)
-            ).filter(Member.is_active == True).group_by(Member.role).all()
+            role_stats = (await self.db.execute(
+                select(
+                    Member.role,
+                    func.count(Member.id)
+                ).filter(Member.is_active == True).group_by(Member.role)
+            )).all()
             by_role = {role.value: count for role, count in role_stats}
             
             # 직급별 통계
-            position_stats = self.db.query(
-                Member.position,
-                func.count(Member.id)
-            ).filter(
-                Member.is_active == True,
-                Member.position.isnot(None)
-            ).group_by(Member.position).all()
+            position_stats = (await self.db.execute(
+                select(
+                    Member.position,
+                    func.count(Member.id)
+                ).filter(
+                    Member.is_active == True,
+                    Member.position.isnot(None)
+                ).group_by(Member.position)
+            )).all()
             by_position = {position: count for position, count in position_stats}
             
             # 최근 7일 로그인 수
             week_ago = datetime.utcnow() - timedelta(days=7)
-            recent_logins = self.db.query(Member).filter(
-                Member.last_login >= week_ago
-            ).count()
+            recent_logins = await self.db.scalar(
+                count_all.filter(Member.last_login >= week_ago)
+            )
             
             return MemberStats(
                 total_members=total_members,
@@ -7,13 +7,13 @@ PostgreSQL notice_schema에 연결
 
 import sys
 import os
-from typing import Generator
-from sqlalchemy.orm import Session
+from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # shared 모듈 import를 위한 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from shared.database import create_database_config, Base
+from shared.database import create_database_config, Base, add_statement_count_middleware
 
 # Notice Service용 데이터베이스 설정 생성
 db_config = create_database_config("notice-service")
@@ -21,11 +21,13 @@ db_config = create_database_config("notice-service")
 # 기존 인터페이스 호환성을 위한 export
 engine = db_config.engine
 SessionLocal = db_config.SessionLocal
+AsyncSessionLocal = db_config.AsyncSessionLocal
 Base = Base
 
-def get_db() -> Generator[Session, None, None]:
-    """데이터베이스 세션을 생성하고 반환하는 의존성 함수"""
-    return db_config.get_db()
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션을 생성하고 반환하는 의존성 함수"""
+    async for db in db_config.get_async_db():
+        yield db
 
 def init_db():
     """데이터베이스 초기화"""
@@ -37,4 +39,8 @@ def init_db():
 
 def get_db_info():
     """데이터베이스 정보 반환"""
-    return db_config.get_db_info() 
\ No newline at end of file
+    return db_config.get_db_info()
+
+async def close_db():
+    """커넥션 풀 정리"""
+    await db_config.dispose() 
\ No newline at end of file
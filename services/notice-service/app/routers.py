@@ -2,11 +2,11 @@
 Notice Service API 라우터
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query, Header, status
-from sqlalchemy.orm import Session
+from typing import List, Optional, Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from .database import get_db
+from .database import AsyncSessionLocal, get_db
 from .service import NoticeService
 from .schemas import (
     NoticeCreate,
@@ -20,19 +20,28 @@ from .schemas import (
     NoticePriorityEnum
 )
 
+# shared 모듈 import를 위한 경로 추가
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.auth import AuthenticatedUser, get_current_user
+from shared.cache import cached
+from shared.export import ExportFormat, export_response
+
 router = APIRouter(prefix="/notices", tags=["notices"])
 
-def get_notice_service(db: Session = Depends(get_db)) -> NoticeService:
+def get_notice_service(db: AsyncSession = Depends(get_db)) -> NoticeService:
     """공지사항 서비스 의존성"""
     return NoticeService(db)
 
-def get_current_user_id(x_user_id: int = Header(..., alias="X-User-ID")) -> int:
-    """API Gateway에서 전달된 사용자 ID 추출"""
-    return x_user_id
+def get_current_user_id(user: AuthenticatedUser = Depends(get_current_user)) -> int:
+    """요청 사용자 ID 추출 (JWT 로컬 검증 또는 API Gateway 헤더)"""
+    return user.user_id
 
-def get_current_user_role(x_user_role: str = Header(..., alias="X-User-Role")) -> str:
-    """API Gateway에서 전달된 사용자 역할 추출"""
-    return x_user_role
+def get_current_user_role(user: AuthenticatedUser = Depends(get_current_user)) -> str:
+    """요청 사용자 역할 추출 (JWT 로컬 검증 또는 API Gateway 헤더)"""
+    return user.role
 
 def can_create_priority_notice(priority: str, user_role: str) -> bool:
     """중요도별 생성 권한 체크"""
@@ -82,7 +91,7 @@ async def create_notice(
     )
     
     try:
-        return service.create_notice(create_data)
+        return await service.create_notice(create_data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -92,11 +101,16 @@ async def create_notice(
 async def get_notices(
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(20, ge=1, le=100, description="가져올 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    count: Literal["exact", "estimate", "none"] = Query("exact", description="전체 개수 계산 방식"),
     service: NoticeService = Depends(get_notice_service)
 ):
     """공지사항 목록을 조회합니다. 고정 공지사항이 먼저 표시됩니다."""
-    pagination = PaginationParams(skip=skip, limit=limit)
-    return service.get_notices(pagination)
+    pagination = PaginationParams(skip=skip, limit=limit, cursor=cursor, count=count)
+    try:
+        return await service.get_notices(pagination)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/search", response_model=NoticeListResponse, summary="공지사항 검색")
 async def search_notices(
@@ -107,6 +121,8 @@ async def search_notices(
     active_only: bool = Query(True, description="활성 공지사항만"),
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(20, ge=1, le=100, description="가져올 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    count: Literal["exact", "estimate", "none"] = Query("exact", description="전체 개수 계산 방식"),
     service: NoticeService = Depends(get_notice_service)
 ):
     """공지사항을 검색합니다."""
@@ -117,42 +133,73 @@ async def search_notices(
         is_pinned=is_pinned,
         active_only=active_only
     )
-    pagination = PaginationParams(skip=skip, limit=limit)
-    return service.search_notices(search_params, pagination)
+    pagination = PaginationParams(skip=skip, limit=limit, cursor=cursor, count=count)
+    try:
+        return await service.search_notices(search_params, pagination)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/export", summary="공지사항 내보내기 (NDJSON/CSV 스트리밍)")
+async def export_notices(
+    format: ExportFormat = Query("ndjson", description="ndjson / csv"),
+    q: str = Query(None, description="검색 키워드"),
+    priority: NoticePriorityEnum = Query(None, description="중요도 필터"),
+    author_id: int = Query(None, description="작성자 ID 필터"),
+    is_pinned: bool = Query(None, description="고정 공지사항만"),
+    active_only: bool = Query(True, description="활성 공지사항만"),
+    service: NoticeService = Depends(get_notice_service),
+    current_user_id: int = Depends(get_current_user_id)
+):
+    """공지사항을 NDJSON/CSV로 내보냅니다. (검색과 같은 필터)"""
+    search_params = SearchParams(
+        q=q,
+        priority=priority,
+        author_id=author_id,
+        is_pinned=is_pinned,
+        active_only=active_only
+    )
+    return export_response(AsyncSessionLocal, service.export_query(search_params), "notices", format)
 
 @router.get("/pinned", response_model=List[NoticeResponse], summary="고정 공지사항 조회")
+@cached("notices")
 async def get_pinned_notices(
     service: NoticeService = Depends(get_notice_service)
 ):
     """고정된 공지사항들을 조회합니다."""
-    return service.get_pinned_notices()
+    return await service.get_pinned_notices()
 
 @router.get("/recent", response_model=List[NoticeResponse], summary="최근 공지사항 조회")
+@cached("notices")
 async def get_recent_notices(
     days: int = Query(7, ge=1, le=30, description="최근 며칠간의 공지사항"),
     limit: int = Query(5, ge=1, le=20, description="최대 개수"),
     service: NoticeService = Depends(get_notice_service)
 ):
     """최근 공지사항들을 조회합니다."""
-    return service.get_recent_notices(days=days, limit=limit)
+    return await service.get_recent_notices(days=days, limit=limit)
 
 @router.get("/stats", response_model=NoticeStats, summary="공지사항 통계")
 async def get_notice_stats(
     service: NoticeService = Depends(get_notice_service)
 ):
     """공지사항 통계 정보를 조회합니다."""
-    return service.get_notice_stats()
+    return await service.get_notice_stats()
 
 @router.get("/author/{author_id}", response_model=NoticeListResponse, summary="작성자별 공지사항 조회")
 async def get_notices_by_author(
     author_id: int,
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(20, ge=1, le=100, description="가져올 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    count: Literal["exact", "estimate", "none"] = Query("exact", description="전체 개수 계산 방식"),
     service: NoticeService = Depends(get_notice_service)
 ):
     """특정 작성자의 공지사항들을 조회합니다."""
-    pagination = PaginationParams(skip=skip, limit=limit)
-    return service.get_notices_by_author(author_id, pagination)
+    pagination = PaginationParams(skip=skip, limit=limit, cursor=cursor, count=count)
+    try:
+        return await service.get_notices_by_author(author_id, pagination)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{notice_id}", response_model=NoticeResponse, summary="공지사항 단일 조회")
 async def get_notice(
@@ -160,7 +207,7 @@ async def get_notice(
     service: NoticeService = Depends(get_notice_service)
 ):
     """특정 공지사항을 조회합니다."""
-    notice = service.get_notice(notice_id)
+    notice = await service.get_notice(notice_id)
     if not notice:
         raise HTTPException(status_code=404, detail="공지사항을 찾을 수 없습니다.")
     return notice
@@ -175,7 +222,7 @@ async def update_notice(
 ):
     """공지사항을 수정합니다."""
     # 기존 공지사항 확인
-    existing_notice = service.get_notice(notice_id)
+    existing_notice = await service.get_notice(notice_id)
     if not existing_notice:
         raise HTTPException(status_code=404, detail="공지사항을 찾을 수 없습니다.")
     
@@ -194,7 +241,7 @@ async def update_notice(
         )
     
     try:
-        notice = service.update_notice(notice_id, notice_data)
+        notice = await service.update_notice(notice_id, notice_data)
         if not notice:
             raise HTTPException(status_code=404, detail="공지사항을 찾을 수 없습니다.")
         return notice
@@ -210,7 +257,7 @@ async def delete_notice(
 ):
     """공지사항을 삭제합니다 (소프트 삭제)."""
     # 기존 공지사항 확인
-    existing_notice = service.get_notice(notice_id)
+    existing_notice = await service.get_notice(notice_id)
     if not existing_notice:
         raise HTTPException(status_code=404, detail="공지사항을 찾을 수 없습니다.")
     
@@ -223,7 +270,7 @@ async def delete_notice(
         )
     
     try:
-        success = service.delete_notice(notice_id)
+        success = await service.delete_notice(notice_id)
         if not success:
             raise HTTPException(status_code=404, detail="공지사항을 찾을 수 없습니다.")
         return {"message": "공지사항이 성공적으로 삭제되었습니다."}
@@ -3,7 +3,7 @@ Notice Service Pydantic 스키마 정의
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Literal
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -58,7 +58,8 @@ class NoticeResponse(NoticeBase):
 
 class NoticeListResponse(BaseModel):
     """공지사항 목록 응답 스키마"""
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (count=none이면 생략)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 없음)")
     notices: List[NoticeResponse]
 
 class NoticeStats(BaseModel):
@@ -81,6 +82,8 @@ class PaginationParams(BaseModel):
     """페이지네이션 파라미터"""
     skip: int = Field(default=0, ge=0, description="건너뛸 개수")
     limit: int = Field(default=20, ge=1, le=100, description="가져올 개수")
+    cursor: Optional[str] = Field(default=None, description="이전 응답의 next_cursor (지정 시 skip 대신 사용)")
+    count: Literal["exact", "estimate", "none"] = Field(default="exact", description="전체 개수 계산 방식")
 
 # 서비스 간 통신을 위한 스키마
 class NoticeCreateInternal(BaseModel):
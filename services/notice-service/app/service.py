@@ -4,8 +4,8 @@ Notice Service 비즈니스 로직
 
 from typing import List, Optional
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, desc, and_, func
 
 from .models import Notice
 from .schemas import (
@@ -19,13 +19,27 @@ from .schemas import (
     AuthorInfo
 )
 
+# shared 모듈 import를 위한 경로 추가
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from shared.cache import response_cache
+from shared.members import attach_members
+from shared.pagination import paginate
+from shared.search import ilike_any
+
+# 목록 정렬 키: 고정 공지사항 먼저, 그 다음 최신순 (마지막은 고유 키, cursor 페이지네이션 기준)
+NOTICE_ORDER = ((Notice.is_pinned, True), (Notice.created_at, True), (Notice.id, True))
+AUTHOR_NOTICE_ORDER = ((Notice.created_at, True), (Notice.id, True))
+
 class NoticeService:
     """공지사항 서비스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def create_notice(self, notice_data: NoticeCreate) -> NoticeResponse:
+    async def create_notice(self, notice_data: NoticeCreate) -> NoticeResponse:
         """공지사항 생성"""
         # 공지사항 생성
         notice = Notice(
@@ -37,58 +51,67 @@ class NoticeService:
         )
         
         self.db.add(notice)
-        self.db.commit()
-        self.db.refresh(notice)
+        await self.db.commit()
+        await response_cache.invalidate("notices")
+        await self.db.refresh(notice)
         
-        return self._to_response(notice)
+        return (await self._with_authors([self._to_response(notice)]))[0]
     
-    def get_notice(self, notice_id: int) -> Optional[NoticeResponse]:
+    async def get_notice(self, notice_id: int) -> Optional[NoticeResponse]:
         """공지사항 단일 조회"""
-        notice = self.db.query(Notice).filter(
-            Notice.id == notice_id,
-            Notice.is_active == True
-        ).first()
+        notice = await self.db.scalar(
+            select(Notice).filter(
+                Notice.id == notice_id,
+                Notice.is_active == True
+            )
+        )
         
         if not notice:
             return None
             
-        return self._to_response(notice)
+        return (await self._with_authors([self._to_response(notice)]))[0]
     
-    def get_notices(self, params: PaginationParams) -> NoticeListResponse:
+    async def get_notices(self, params: PaginationParams) -> NoticeListResponse:
         """공지사항 목록 조회"""
-        query = self.db.query(Notice).filter(Notice.is_active == True)
-        
-        # 고정 공지사항을 먼저, 그 다음 최신순
-        query = query.order_by(desc(Notice.is_pinned), desc(Notice.created_at))
+        query = select(Notice).filter(Notice.is_active == True)
         
-        # 전체 개수
-        total = query.count()
-        
-        # 페이지네이션 적용
-        notices = query.offset(params.skip).limit(params.limit).all()
+        # 고정 공지사항을 먼저, 그 다음 최신순 + 페이지네이션 적용
+        page = await paginate(
+            self.db, query, NOTICE_ORDER, params.limit,
+            skip=params.skip, cursor=params.cursor, count=params.count
+        )
         
         return NoticeListResponse(
-            total=total,
-            notices=[self._to_response(notice) for notice in notices]
+            total=page.total,
+            next_cursor=page.next_cursor,
+            notices=await self._with_authors([self._to_response(notice) for notice in page.items])
         )
     
-    def search_notices(self, search_params: SearchParams, pagination: PaginationParams) -> NoticeListResponse:
+    async def search_notices(self, search_params: SearchParams, pagination: PaginationParams) -> NoticeListResponse:
         """공지사항 검색"""
-        query = self.db.query(Notice)
+        query = self._apply_filters(select(Notice), search_params)
         
+        # 정렬(고정 공지사항 먼저, 그 다음 최신순) + 페이지네이션 적용
+        page = await paginate(
+            self.db, query, NOTICE_ORDER, pagination.limit,
+            skip=pagination.skip, cursor=pagination.cursor, count=pagination.count
+        )
+        
+        return NoticeListResponse(
+            total=page.total,
+            next_cursor=page.next_cursor,
+            notices=await self._with_authors([self._to_response(notice) for notice in page.items])
+        )
+    
+    def _apply_filters(self, query, search_params: SearchParams):
+        """검색/내보내기 공통 조건"""
         # 활성 공지사항만
         if search_params.active_only:
             query = query.filter(Notice.is_active == True)
         
-        # 키워드 검색
+        # 키워드 검색 (db/init/05_search_indexes.sql의 트라이그램 인덱스 사용)
         if search_params.q:
-            search_term = f"%{search_params.q}%"
-            query = query.filter(
-                or_(
-                    Notice.title.ilike(search_term),
-                    Notice.content.ilike(search_term)
-                )
-            )
+            query = query.filter(ilike_any(search_params.q, [Notice.title, Notice.content]))
         
         # 중요도 필터
         if search_params.priority:
@@ -102,26 +125,20 @@ class NoticeService:
         if search_params.is_pinned is not None:
             query = query.filter(Notice.is_pinned == search_params.is_pinned)
         
-        # 정렬: 고정 공지사항 먼저, 그 다음 최신순
-        query = query.order_by(desc(Notice.is_pinned), desc(Notice.created_at))
-        
-        # 전체 개수
-        total = query.count()
-        
-        # 페이지네이션 적용
-        notices = query.offset(pagination.skip).limit(pagination.limit).all()
-        
-        return NoticeListResponse(
-            total=total,
-            notices=[self._to_response(notice) for notice in notices]
-        )
+        return query
+    
+    def export_query(self, search_params: SearchParams):
+        """내보내기 쿼리 (테이블 컬럼 그대로, ID 순)"""
+        return self._apply_filters(select(*Notice.__table__.columns), search_params).order_by(Notice.id)
     
-    def update_notice(self, notice_id: int, notice_data: NoticeUpdate) -> Optional[NoticeResponse]:
+    async def update_notice(self, notice_id: int, notice_data: NoticeUpdate) -> Optional[NoticeResponse]:
         """공지사항 수정"""
-        notice = self.db.query(Notice).filter(
-            Notice.id == notice_id,
-            Notice.is_active == True
-        ).first()
+        notice = await self.db.scalar(
+            select(Notice).filter(
+                Notice.id == notice_id,
+                Notice.is_active == True
+            )
+        )
         
         if not notice:
             return None
@@ -135,77 +152,93 @@ class NoticeService:
                 setattr(notice, field, value)
         
         notice.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(notice)
+        await self.db.commit()
+        await response_cache.invalidate("notices")
+        await self.db.refresh(notice)
         
-        return self._to_response(notice)
+        return (await self._with_authors([self._to_response(notice)]))[0]
     
-    def delete_notice(self, notice_id: int) -> bool:
+    async def delete_notice(self, notice_id: int) -> bool:
         """공지사항 삭제 (소프트 삭제)"""
-        notice = self.db.query(Notice).filter(
-            Notice.id == notice_id,
-            Notice.is_active == True
-        ).first()
+        notice = await self.db.scalar(
+            select(Notice).filter(
+                Notice.id == notice_id,
+                Notice.is_active == True
+            )
+        )
         
         if not notice:
             return False
         
         notice.is_active = False
         notice.updated_at = datetime.utcnow()
-        self.db.commit()
+        await self.db.commit()
+        await response_cache.invalidate("notices")
         
         return True
     
-    def get_pinned_notices(self) -> List[NoticeResponse]:
+    async def get_pinned_notices(self) -> List[NoticeResponse]:
         """고정 공지사항 조회"""
-        notices = self.db.query(Notice).filter(
-            Notice.is_active == True,
-            Notice.is_pinned == True
-        ).order_by(desc(Notice.created_at)).all()
-        
-        return [self._to_response(notice) for notice in notices]
+        notices = (await self.db.scalars(
+            select(Notice).filter(
+                Notice.is_active == True,
+                Notice.is_pinned == True
+            ).order_by(desc(Notice.created_at))
+        )).all()
+        
+        return await self._with_authors([self._to_response(notice) for notice in notices])
     
-    def get_recent_notices(self, days: int = 7, limit: int = 5) -> List[NoticeResponse]:
+    async def get_recent_notices(self, days: int = 7, limit: int = 5) -> List[NoticeResponse]:
         """최근 공지사항 조회"""
         since_date = datetime.utcnow() - timedelta(days=days)
         
-        notices = self.db.query(Notice).filter(
-            Notice.is_active == True,
-            Notice.created_at >= since_date
-        ).order_by(desc(Notice.created_at)).limit(limit).all()
+        notices = (await self.db.scalars(
+            select(Notice).filter(
+                Notice.is_active == True,
+                Notice.created_at >= since_date
+            ).order_by(desc(Notice.created_at)).limit(limit)
+        )).all()
         
-        return [self._to_response(notice) for notice in notices]
+        return await self._with_authors([self._to_response(notice) for notice in notices])
     
-    def get_notices_by_author(self, author_id: int, pagination: PaginationParams) -> NoticeListResponse:
+    async def get_notices_by_author(self, author_id: int, pagination: PaginationParams) -> NoticeListResponse:
         """특정 작성자의 공지사항 조회"""
-        query = self.db.query(Notice).filter(
+        query = select(Notice).filter(
             Notice.author_id == author_id,
             Notice.is_active == True
-        ).order_by(desc(Notice.created_at))
+        )
         
-        total = query.count()
-        notices = query.offset(pagination.skip).limit(pagination.limit).all()
+        page = await paginate(
+            self.db, query, AUTHOR_NOTICE_ORDER, pagination.limit,
+            skip=pagination.skip, cursor=pagination.cursor, count=pagination.count
+        )
         
         return NoticeListResponse(
-            total=total,
-            notices=[self._to_response(notice) for notice in notices]
+            total=page.total,
+            next_cursor=page.next_cursor,
+            notices=await self._with_authors([self._to_response(notice) for notice in page.items])
         )
     
-    def get_notice_stats(self) -> NoticeStats:
+    async def get_notice_stats(self) -> NoticeStats:
         """공지사항 통계"""
         # 기본 통계
-        total_notices = self.db.query(Notice).count()
-        active_notices = self.db.query(Notice).filter(Notice.is_active == True).count()
-        pinned_notices = self.db.query(Notice).filter(
-            Notice.is_active == True,
-            Notice.is_pinned == True
-        ).count()
+        count_all = select(func.count()).select_from(Notice)
+        total_notices = await self.db.scalar(count_all)
+        active_notices = await self.db.scalar(count_all.filter(Notice.is_active == True))
+        pinned_notices = await self.db.scalar(
+            count_all.filter(
+                Notice.is_active == True,
+                Notice.is_pinned == True
+            )
+        )
         
         # 중요도별 통계
-        priority_stats = self.db.query(
-            Notice.priority,
-            func.count(Notice.id).label('count')
-        ).filter(Notice.is_active == True).group_by(Notice.priority).all()
+        priority_stats = (await self.db.execute(
+            select(
+                Notice.priority,
+                func.count(Notice.id).label('count')
+            ).filter(Notice.is_active == True).group_by(Notice.priority)
+        )).all()
         
         notices_by_priority = {
             priority: count for priority, count in priority_stats
@@ -213,10 +246,12 @@ class NoticeService:
         
         # 최근 7일 공지사항
         recent_date = datetime.utcnow() - timedelta(days=7)
-        recent_notices = self.db.query(Notice).filter(
-            Notice.is_active == True,
-            Notice.created_at >= recent_date
-        ).count()
+        recent_notices = await self.db.scalar(
+            count_all.filter(
+                Notice.is_active == True,
+                Notice.created_at >= recent_date
+            )
+        )
         
         return NoticeStats(
             total_notices=total_notices,
@@ -226,16 +261,19 @@ class NoticeService:
             recent_notices=recent_notices
         )
     
+    async def _with_authors(self, notices: List[NoticeResponse]) -> List[NoticeResponse]:
+        """작성자 정보 채우기 (페이지의 작성자를 member-service에서 한 번에 조회)"""
+        return await attach_members(notices, "author_id", "author", AuthorInfo)
+    
     def _to_response(self, notice: Notice) -> NoticeResponse:
         """Notice 모델을 NoticeResponse로 변환"""
-        # 작성자 정보는 일단 None으로 설정 (나중에 다른 서비스에서 조회)
         return NoticeResponse(
             id=notice.id,
             title=notice.title,
             content=notice.content,
             priority=notice.priority,
             author_id=notice.author_id,
-            author=None,  # 추후 Member Service에서 조회
+            author=None,  # _with_authors에서 member-service 일괄 조회로 채움
             is_active=notice.is_active,
             is_pinned=notice.is_pinned,
             created_at=notice.created_at,
@@ -0,0 +1,121 @@
+"""
+Shared JWT Authentication for TS Portal Services
+
+auth-service가 발급한 HS256 액세스 토큰을 각 서비스에서 로컬로 검증하는 의존성
+(요청마다 auth-service /api/auth/verify를 호출하지 않음)
+"""
+
+import os
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import jwt
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
+from fastapi import Depends, Header, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# JWT 설정 (auth-service와 동일한 값을 사용해야 함)
+JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-super-secret-jwt-key-change-in-production")
+JWT_ALGORITHM = "HS256"
+
+# 기본은 Bearer 토큰만 인증으로 인정 (X-User-ID, X-User-Role 헤더는 누구나 보낼 수 있으므로 무시)
+# true: 토큰이 없으면 X-User-* 헤더 사용 - 클라이언트가 보낸 헤더를 제거하고 검증한 값만 넣어 주는
+#       신뢰할 수 있는 게이트웨이 뒤에서만 설정
+AUTH_TRUST_GATEWAY_HEADERS = os.getenv("AUTH_TRUST_GATEWAY_HEADERS", "false").lower() == "true"
+
+# Bearer 토큰 스키마 (토큰이 없으면 익명/헤더 폴백을 위해 자동 오류 비활성화)
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+class AuthenticatedUser(BaseModel):
+    """요청 사용자 정보"""
+    user_id: int
+    role: str
+    email: Optional[str] = None
+    username: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    token_verified: bool = True  # False: 게이트웨이 헤더 기반 (토큰 미검증)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def create_service_token(service_name: str, expire_seconds: int = 300) -> str:
+    """
+    서비스 간 호출용 단기 액세스 토큰 (예: shared/members.py의 member-service 일괄 조회)
+    
+    사용자 토큰과 같은 비밀 키로 서명하므로 받는 서비스는 get_current_user로 그대로 검증합니다.
+    (user_id 0, 일반 사용자 권한)
+    """
+    now = datetime.now(timezone.utc)
+    payload = {
+        "user_id": 0,
+        "username": service_name,
+        "role": "USER",
+        "exp": now + timedelta(seconds=expire_seconds),
+        "iat": now
+    }
+    return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+
+
+def decode_access_token(token: str) -> AuthenticatedUser:
+    """액세스 토큰 서명/만료 검증 후 사용자 정보 반환"""
+    try:
+        payload = jwt.decode(
+            token,
+            JWT_SECRET_KEY,
+            algorithms=[JWT_ALGORITHM],
+            options={"require": ["exp", "user_id"]}
+        )
+    except ExpiredSignatureError:
+        raise _unauthorized("토큰이 만료되었습니다.")
+    except InvalidTokenError as e:
+        logger.warning(f"유효하지 않은 토큰: {e}")
+        raise _unauthorized("유효하지 않은 토큰입니다.")
+    
+    return AuthenticatedUser(
+        user_id=payload["user_id"],
+        role=payload.get("role", "USER"),
+        email=payload.get("email"),
+        username=payload.get("username"),
+        expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+    )
+
+
+def get_optional_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    x_user_id: Optional[str] = Header(None, alias="X-User-ID"),
+    x_user_role: Optional[str] = Header(None, alias="X-User-Role")
+) -> Optional[AuthenticatedUser]:
+    """
+    요청 사용자 추출 (인증 정보가 없으면 None)
+    
+    Bearer 토큰이 있으면 토큰의 사용자 정보가 X-User-* 헤더보다 우선하며,
+    X-User-* 헤더는 AUTH_TRUST_GATEWAY_HEADERS가 켜져 있을 때만 사용합니다.
+    """
+    if credentials is not None:
+        return decode_access_token(credentials.credentials)
+    
+    if not AUTH_TRUST_GATEWAY_HEADERS or not x_user_id:
+        return None
+    
+    try:
+        user_id = int(x_user_id)
+    except ValueError:
+        return None
+    return AuthenticatedUser(user_id=user_id, role=x_user_role or "USER", token_verified=False)
+
+
+def get_current_user(user: Optional[AuthenticatedUser] = Depends(get_optional_user)) -> AuthenticatedUser:
+    """요청 사용자 추출 (인증 정보가 없으면 401)"""
+    if user is None:
+        raise _unauthorized("인증이 필요합니다.")
+    return user
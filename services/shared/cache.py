@@ -0,0 +1,288 @@
+"""
+Shared Response Cache for TS Portal Services
+
+자주 조회되고 변경이 드문 GET 엔드포인트의 응답(JSON)을 캐시합니다.
+
+- 백엔드: REDIS_URL이 설정되어 있고 redis 패키지가 설치되어 있으면 Redis, 아니면 프로세스 메모리
+  (메모리 백엔드는 프로세스마다 따로 캐시하므로 다중 프로세스 환경에서는 TTL까지 이전 응답이 보일 수 있음)
+- 캐시 키: 리소스 버전 + 경로 + 쿼리 파라미터 + 요청 사용자 권한 (+ 의존성이 설정한 ETag)
+  (토큰이 만료되었거나 유효하지 않으면 익명 사용자로 취급 - 공개 엔드포인트는 401 없이 응답)
+- 캐시 값: 엔드포인트의 response_model로 검증/필터링한 JSON (캐시 적중 시에도 응답 모델에 없는 필드는 나가지 않음)
+- 무효화: 서비스의 생성/수정/삭제 메서드에서 invalidate(리소스)로 버전을 올리면
+  이전 버전 키는 더 이상 조회되지 않고 TTL 후 만료됨 (키를 찾아 지우지 않음)
+  다른 서비스 데이터를 채워 넣은 응답(예: 일정 생성자, 공지 작성자 멤버 정보)은
+  그 데이터를 바꾸는 서비스도 해당 리소스를 무효화 (member-service -> "events", "notices")
+  (서비스 간 무효화는 버전 키를 공유하는 Redis 백엔드에서만 전달, 메모리 백엔드는 TTL 후 반영)
+- 캐시 백엔드 오류 시 캐시 없이 정상 처리 (요청은 실패하지 않음)
+
+사용 예:
+    @router.get("/pinned", response_model=List[NoticeResponse])
+    @cached("notices", ttl=60)
+    async def get_pinned_notices(service: NoticeService = Depends(get_notice_service)):
+        ...
+    
+    # NoticeService.create_notice()
+    await response_cache.invalidate("notices")
+"""
+
+import os
+import time
+import hashlib
+import inspect
+import logging
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Depends, Header, HTTPException, Request, Response, status
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from .auth import AuthenticatedUser, bearer_scheme, get_optional_user
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # redis 미설치 시 메모리 백엔드 사용
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+# Redis 연결 URL (없으면 메모리 백엔드)
+REDIS_URL = os.getenv("REDIS_URL")
+
+# 캐시 기본 TTL (초) / 0이면 캐시 사용 안 함
+CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", "60"))
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+
+# 메모리 백엔드 최대 항목 수 (초과 시 오래 사용되지 않은 항목부터 제거)
+CACHE_MEMORY_MAX_SIZE = int(os.getenv("CACHE_MEMORY_MAX_SIZE", "1000"))
+
+# Redis 명령 타임아웃 (초) - 캐시가 느려도 요청이 오래 기다리지 않도록 짧게
+CACHE_REDIS_TIMEOUT = float(os.getenv("CACHE_REDIS_TIMEOUT", "0.2"))
+
+CACHE_KEY_PREFIX = "ts-portal:cache"
+
+
+class MemoryCacheBackend:
+    """프로세스 메모리 캐시 백엔드 (TTL + LRU)"""
+    
+    name = "memory"
+    
+    def __init__(self, max_size: int = CACHE_MEMORY_MAX_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: bytes, ttl: int):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    async def get_version(self, key: str) -> int:
+        return self._versions.get(key, 0)
+    
+    async def incr_version(self, key: str) -> int:
+        self._versions[key] = self._versions.get(key, 0) + 1
+        return self._versions[key]
+    
+    async def close(self):
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Redis 캐시 백엔드 (서비스 인스턴스 간 캐시/무효화 공유)"""
+    
+    name = "redis"
+    
+    def __init__(self, url: str, timeout: float = CACHE_REDIS_TIMEOUT):
+        self.client = redis_asyncio.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)
+    
+    async def set(self, key: str, value: bytes, ttl: int):
+        await self.client.set(key, value, ex=ttl)
+    
+    async def get_version(self, key: str) -> int:
+        return int(await self.client.get(key) or 0)
+    
+    async def incr_version(self, key: str) -> int:
+        return await self.client.incr(key)
+    
+    async def close(self):
+        await self.client.aclose()
+
+
+def create_cache_backend():
+    """환경에 맞는 캐시 백엔드 생성"""
+    if REDIS_URL:
+        if redis_asyncio is not None:
+            logger.info("✅ 응답 캐시: Redis 백엔드 사용")
+            return RedisCacheBackend(REDIS_URL)
+        logger.warning("⚠️ REDIS_URL이 설정되었지만 redis 패키지가 없어 메모리 캐시를 사용합니다.")
+    return MemoryCacheBackend()
+
+
+class ResponseCache:
+    """리소스별 버전 키를 사용하는 응답 캐시"""
+    
+    def __init__(self, backend=None):
+        self.backend = backend or create_cache_backend()
+        self.stats = {"hits": 0, "misses": 0, "errors": 0, "invalidations": 0}
+    
+    def _version_key(self, resource: str) -> str:
+        return f"{CACHE_KEY_PREFIX}:{resource}:version"
+    
+    async def build_key(self, resource: str, request: Request, role: Optional[str], etag: Optional[str] = None) -> Optional[str]:
+        """
+        리소스 버전 + 경로 + 정렬된 쿼리 파라미터 + 권한 (+ ETag)으로 캐시 키 생성 (백엔드 오류 시 None)
+        
+        의존성이 ETag를 설정한 응답은 ETag도 키에 넣어 새 ETag에 이전 본문이 붙지 않도록 합니다.
+        """
+        try:
+            version = await self.backend.get_version(self._version_key(resource))
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"⚠️ 응답 캐시 버전 조회 실패 (캐시 없이 처리): {e}")
+            return None
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        digest = hashlib.sha1(f"{request.url.path}?{query}|{role or ''}|{etag or ''}".encode()).hexdigest()
+        return f"{CACHE_KEY_PREFIX}:{resource}:v{version}:{digest}"
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"⚠️ 응답 캐시 조회 실패 (캐시 없이 처리): {e}")
+            return None
+        self.stats["hits" if value is not None else "misses"] += 1
+        return value
+    
+    async def set(self, key: str, value: bytes, ttl: int):
+        try:
+            await self.backend.set(key, value, ttl)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"⚠️ 응답 캐시 저장 실패: {e}")
+    
+    async def invalidate(self, *resources: str):
+        """리소스 버전 증가 (해당 리소스의 기존 캐시 응답 전체 무효화)"""
+        for resource in resources:
+            try:
+                await self.backend.incr_version(self._version_key(resource))
+                self.stats["invalidations"] += 1
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"⚠️ 응답 캐시 무효화 실패 ({resource}, TTL 후 만료): {e}")
+    
+    async def close(self):
+        await self.backend.close()
+
+
+# 서비스 전역 응답 캐시
+response_cache = ResponseCache()
+
+
+def _cache_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    x_user_id: Optional[str] = Header(None, alias="X-User-ID"),
+    x_user_role: Optional[str] = Header(None, alias="X-User-Role")
+) -> Optional[AuthenticatedUser]:
+    """
+    캐시 키에 사용할 요청 사용자 (인증 정보가 없거나 토큰이 만료/무효이면 None)
+    
+    공개 엔드포인트가 캐시 때문에 401을 반환하지 않도록 토큰 오류는 익명 사용자로 취급합니다.
+    (로그인이 필요한 엔드포인트는 자체 의존성(get_current_user 등)에서 401)
+    """
+    try:
+        return get_optional_user(credentials, x_user_id, x_user_role)
+    except HTTPException as e:
+        if e.status_code != status.HTTP_401_UNAUTHORIZED:
+            raise
+        return None
+
+
+# response_model별 검증/직렬화용 TypeAdapter
+_response_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def _render(request: Request, result) -> bytes:
+    """엔드포인트 반환값을 라우트의 response_model로 검증/필터링한 JSON (response_model이 없으면 그대로)"""
+    response_model = getattr(request.scope.get("route"), "response_model", None)
+    if response_model is None:
+        return to_json(result, by_alias=True)
+    adapter = _response_adapters.get(response_model)
+    if adapter is None:
+        adapter = _response_adapters[response_model] = TypeAdapter(response_model)
+    return adapter.dump_json(adapter.validate_python(result, from_attributes=True), by_alias=True)
+
+
+def _json_response(body: bytes, response: Response, cache_status: str) -> Response:
+    """저장된 JSON 응답 (의존성이 설정한 헤더(ETag 등)는 유지)"""
+    headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    headers["X-Cache"] = cache_status
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def cached(resource: str, ttl: int = CACHE_DEFAULT_TTL):
+    """
+    GET 엔드포인트 응답 캐시 데코레이터
+    
+    엔드포인트 반환값을 라우트의 response_model로 검증/필터링한 JSON으로 저장하고,
+    캐시 적중 시 엔드포인트와 서비스 호출 없이 저장된 JSON을 그대로 반환합니다.
+    (권한 검사 등 엔드포인트의 의존성은 캐시 적중 시에도 먼저 실행됨)
+    
+    Args:
+        resource: 무효화 단위 리소스 이름 (예: "notices")
+        ttl: 캐시 유지 시간 (초)
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        extra_params = [
+            inspect.Parameter("_cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter("_cache_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+            inspect.Parameter(
+                "_cache_user", inspect.Parameter.KEYWORD_ONLY,
+                annotation=Optional[AuthenticatedUser], default=Depends(_cache_user)
+            ),
+        ]
+        
+        @wraps(func)
+        async def wrapper(*args, _cache_request: Request, _cache_response: Response,
+                          _cache_user: Optional[AuthenticatedUser] = None, **kwargs):
+            if not CACHE_ENABLED or ttl <= 0:
+                return await func(*args, **kwargs)
+            
+            key = await response_cache.build_key(
+                resource, _cache_request, _cache_user.role if _cache_user else None, _cache_response.headers.get("ETag")
+            )
+            if key is None:
+                return await func(*args, **kwargs)
+            
+            body = await response_cache.get(key)
+            if body is not None:
+                return _json_response(body, _cache_response, "HIT")
+            
+            # 캐시 적중 시와 같은 본문을 반환 (response_model 검증은 _render에서 수행)
+            body = _render(_cache_request, await func(*args, **kwargs))
+            await response_cache.set(key, body, ttl)
+            return _json_response(body, _cache_response, "MISS")
+        
+        wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), *extra_params])
+        return wrapper
+    
+    return decorator
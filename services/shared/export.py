@@ -0,0 +1,104 @@
+"""
+Shared Streaming Export for TS Portal Services
+
+테이블 전체(또는 목록 API와 같은 필터 결과)를 NDJSON/CSV로 스트리밍 내보냅니다.
+
+- 서버 측 커서(yield_per)로 EXPORT_BATCH_SIZE 행씩 받아 바로 응답으로 흘려보내므로
+  테이블 크기와 관계없이 메모리 사용량이 일정
+- ORM 객체/응답 모델을 만들지 않고 컬럼 값을 그대로 직렬화 (목록 API의 계산 필드는 포함하지 않음)
+- 요청 세션과 별도의 세션을 열어 응답이 끝날 때까지 사용 (요청 의존성 종료와 무관)
+- CSV는 Excel에서 한글이 깨지지 않도록 UTF-8 BOM을 붙이고,
+  =, +, -, @로 시작하는 문자열은 수식으로 해석되지 않도록 앞에 '를 붙임
+
+사용 예:
+    @router.get("/export", summary="공지사항 내보내기")
+    async def export_notices(format: ExportFormat = Query("ndjson"), ...):
+        return export_response(AsyncSessionLocal, service.export_query(...), "notices", format)
+"""
+
+import csv
+import io
+import logging
+import os
+from datetime import date, datetime
+from typing import AsyncIterator, Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+logger = logging.getLogger(__name__)
+
+# 서버 측 커서에서 한 번에 가져와 응답으로 보내는 행 수
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "2000"))
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# 스프레드시트가 수식으로 해석하는 시작 문자
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def csv_value(value):
+    """CSV 셀 값 (None은 빈 값, 날짜는 ISO 형식, JSON 값은 JSON 문자열)"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return to_json(value).decode()
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def iter_export(session_factory, query, format: ExportFormat = "ndjson",
+                      batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+    """쿼리 결과를 batch_size 행 단위의 NDJSON/CSV 바이트 조각으로 생성"""
+    columns = [column.key for column in query.selected_columns]
+    rows_total = 0
+    
+    async with session_factory() as db:
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        
+        if format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield b"\xef\xbb\xbf" + buffer.getvalue().encode()
+            async for rows in result.partitions():
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows([csv_value(value) for value in row] for row in rows)
+                rows_total += len(rows)
+                yield buffer.getvalue().encode()
+        else:
+            async for rows in result.partitions():
+                rows_total += len(rows)
+                yield b"".join(to_json(dict(zip(columns, row))) + b"\n" for row in rows)
+    
+    logger.info(f"📤 내보내기 완료: {rows_total}행 ({format})")
+
+
+def export_response(session_factory, query, name: str, format: ExportFormat = "ndjson",
+                    batch_size: int = EXPORT_BATCH_SIZE) -> StreamingResponse:
+    """
+    쿼리 결과를 스트리밍하는 다운로드 응답
+    
+    Args:
+        session_factory: 서비스의 AsyncSessionLocal (내보내기 동안 별도 세션 사용)
+        query: 내보낼 컬럼을 선택한 select() (ORM 엔티티가 아닌 컬럼 목록)
+        name: 다운로드 파일 이름 (확장자 제외)
+        format: ndjson / csv
+    """
+    filename = f"{name}-{datetime.now():%Y%m%d-%H%M%S}.{format}"
+    return StreamingResponse(
+        iter_export(session_factory, query, format, batch_size),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -0,0 +1,200 @@
+"""
+Shared Member Client for TS Portal Services
+
+공지사항 작성자, 일정 생성자, 담당 배정 팀원처럼 다른 서비스 응답에 들어가는 멤버 정보를
+member-service 일괄 조회(GET /api/members/batch)로 채웁니다.
+
+- 한 페이지의 응답에서 중복 없는 멤버 ID를 모아 한 번에 조회 (멤버마다 요청하지 않음)
+- 앞단에 프로세스 메모리 LRU 캐시 (TTL, 없는 ID도 짧게 캐시)
+- member-service 호출은 서비스 토큰(shared/auth.py의 create_service_token)으로 인증
+- member-service 오류/타임아웃 시 캐시된 정보만 채우고 요청은 정상 처리 (해당 필드는 None)
+  실패 후 MEMBER_CLIENT_RETRY_AFTER 동안은 member-service를 호출하지 않음
+
+사용 예:
+    # NoticeService
+    notices = [self._to_response(notice) for notice in page.items]
+    await attach_members(notices, "author_id", "author", AuthorInfo)
+    
+    # main.py shutdown
+    await member_client.close()
+"""
+
+import os
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from .auth import create_service_token
+
+logger = logging.getLogger(__name__)
+
+# member-service 주소 (docker-compose 네트워크 기준)
+MEMBER_SERVICE_URL = os.getenv("MEMBER_SERVICE_URL", "http://member-service:8000")
+MEMBER_CLIENT_ENABLED = os.getenv("MEMBER_CLIENT_ENABLED", "true").lower() == "true"
+
+# 요청 타임아웃 (초) - member-service가 느려도 목록 응답이 오래 기다리지 않도록 짧게
+MEMBER_CLIENT_TIMEOUT = float(os.getenv("MEMBER_CLIENT_TIMEOUT", "2"))
+
+# 실패 후 member-service 호출을 쉬는 시간 (초)
+MEMBER_CLIENT_RETRY_AFTER = float(os.getenv("MEMBER_CLIENT_RETRY_AFTER", "10"))
+
+# 한 번에 조회할 최대 ID 수 (member-service의 MEMBER_BATCH_MAX_IDS 이하)
+MEMBER_BATCH_SIZE = int(os.getenv("MEMBER_BATCH_SIZE", "100"))
+
+# 캐시 유지 시간 (초) / 없는 ID 캐시 시간 / 최대 항목 수 (초과 시 오래 사용되지 않은 항목부터 제거)
+MEMBER_CACHE_TTL = int(os.getenv("MEMBER_CACHE_TTL", "300"))
+MEMBER_CACHE_MISSING_TTL = int(os.getenv("MEMBER_CACHE_MISSING_TTL", "30"))
+MEMBER_CACHE_MAX_SIZE = int(os.getenv("MEMBER_CACHE_MAX_SIZE", "2000"))
+
+
+class MemberClient:
+    """member-service 일괄 조회 클라이언트 (LRU 캐시)"""
+    
+    def __init__(
+        self,
+        base_url: str = MEMBER_SERVICE_URL,
+        timeout: float = MEMBER_CLIENT_TIMEOUT,
+        batch_size: int = MEMBER_BATCH_SIZE,
+        ttl: int = MEMBER_CACHE_TTL,
+        missing_ttl: int = MEMBER_CACHE_MISSING_TTL,
+        max_size: int = MEMBER_CACHE_MAX_SIZE,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            base_url: member-service 주소
+            timeout: 요청 타임아웃 (초)
+            batch_size: 요청당 최대 ID 수
+            ttl: 멤버 정보 캐시 시간 (초)
+            missing_ttl: 없는 ID 캐시 시간 (초)
+            max_size: 캐시 최대 항목 수
+            transport: httpx 전송 계층 (로컬 스텁 member-service 연결용)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.ttl = ttl
+        self.missing_ttl = missing_ttl
+        self.max_size = max_size
+        self.transport = transport
+        self.client: Optional[httpx.AsyncClient] = None
+        # 멤버 ID별 (만료 시각, 멤버 요약 또는 None(없는 ID))
+        self._entries: "OrderedDict[int, Tuple[float, Optional[dict]]]" = OrderedDict()
+        self._retry_at = 0.0
+        self.stats = {"hits": 0, "misses": 0, "requests": 0, "errors": 0}
+    
+    def open(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 생성 (이미 있으면 그대로 반환)"""
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                transport=self.transport
+            )
+        return self.client
+    
+    async def close(self):
+        """공유 HTTP 클라이언트 종료"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    def clear(self):
+        """캐시 비우기"""
+        self._entries.clear()
+        self._retry_at = 0.0
+    
+    def _lookup(self, member_id: int) -> Tuple[bool, Optional[dict]]:
+        """캐시 조회 (있음 여부, 멤버 요약)"""
+        entry = self._entries.get(member_id)
+        if entry is None:
+            return False, None
+        expires_at, member = entry
+        if expires_at <= time.monotonic():
+            del self._entries[member_id]
+            return False, None
+        self._entries.move_to_end(member_id)
+        return True, member
+    
+    def _store(self, member_id: int, member: Optional[dict]):
+        ttl = self.ttl if member is not None else self.missing_ttl
+        self._entries[member_id] = (time.monotonic() + ttl, member)
+        self._entries.move_to_end(member_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    async def _fetch(self, member_ids: List[int]) -> Dict[int, dict]:
+        """member-service 일괄 조회 (요청 한 번)"""
+        self.stats["requests"] += 1
+        response = await self.open().get(
+            "/api/members/batch",
+            params={"ids": ",".join(str(member_id) for member_id in member_ids)},
+            headers={"Authorization": f"Bearer {create_service_token('member-client')}"}
+        )
+        response.raise_for_status()
+        return {member["id"]: member for member in response.json()}
+    
+    async def get_members(self, member_ids: Iterable[Optional[int]]) -> Dict[int, dict]:
+        """
+        멤버 요약 조회 (캐시에 없는 ID만 member-service에서 일괄 조회)
+        
+        Returns:
+            {멤버 ID: 멤버 요약} (없는 ID, 조회 실패한 ID는 제외)
+        """
+        members: Dict[int, dict] = {}
+        missing = []
+        for member_id in sorted({member_id for member_id in member_ids if member_id is not None}):
+            found, member = self._lookup(member_id)
+            if found:
+                self.stats["hits"] += 1
+                if member is not None:
+                    members[member_id] = member
+            else:
+                self.stats["misses"] += 1
+                missing.append(member_id)
+        
+        if not missing or not MEMBER_CLIENT_ENABLED or time.monotonic() < self._retry_at:
+            return members
+        
+        for i in range(0, len(missing), self.batch_size):
+            chunk = missing[i:i + self.batch_size]
+            try:
+                fetched = await self._fetch(chunk)
+            except (httpx.HTTPError, ValueError, KeyError) as e:
+                self.stats["errors"] += 1
+                self._retry_at = time.monotonic() + MEMBER_CLIENT_RETRY_AFTER
+                logger.warning(f"⚠️ member-service 일괄 조회 실패 (멤버 정보 없이 처리): {e!r}")
+                break
+            for member_id in chunk:
+                self._store(member_id, fetched.get(member_id))
+                if member_id in fetched:
+                    members[member_id] = fetched[member_id]
+        
+        return members
+
+
+# 서비스 전역 멤버 클라이언트
+member_client = MemberClient()
+
+
+async def attach_members(items: list, id_field: str, target_field: str, model, client: MemberClient = None) -> list:
+    """
+    응답 목록의 멤버 ID 필드(id_field)로 멤버 정보를 한 번에 조회해 target_field에 채움
+    
+    Args:
+        items: 응답 모델 목록 (단건은 [response])
+        id_field: 멤버 ID 필드 이름 (예: "author_id")
+        target_field: 채울 필드 이름 (예: "author")
+        model: 멤버 정보 스키마 (예: AuthorInfo)
+    """
+    if not items:
+        return items
+    members = await (client or member_client).get_members(getattr(item, id_field) for item in items)
+    for item in items:
+        member = members.get(getattr(item, id_field))
+        if member is not None:
+            setattr(item, target_field, model.model_validate(member))
+    return items
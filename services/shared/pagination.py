@@ -0,0 +1,216 @@
+"""
+Shared Keyset (Cursor) Pagination for TS Portal Services
+
+OFFSET 방식은 깊은 페이지일수록 앞쪽 행을 모두 읽고 버리므로,
+마지막 행의 정렬 키를 불투명한 cursor로 내려주고 다음 페이지는
+"정렬 키 > cursor" 조건으로 인덱스에서 바로 이어 읽습니다.
+
+- 정렬 키 마지막에는 항상 고유 컬럼(id)을 두어 동일 값 사이의 순서를 고정
+- 전체 개수는 exact(COUNT) / estimate(실행 계획 추정치) / none(생략) 중 선택
+"""
+
+import base64
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, false, func, literal, or_, select, tuple_
+from sqlalchemy.exc import CompileError, DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+# (정렬 컬럼, 내림차순 여부)
+SortKey = Tuple[Any, bool]
+
+COUNT_MODES = ("exact", "estimate", "none")
+
+# 추정치가 이 값 이하이면 정확한 COUNT를 수행 (작은 결과는 COUNT 비용이 작고 추정 오차가 큼)
+ESTIMATE_EXACT_THRESHOLD = 1000
+
+
+class KeysetPage(NamedTuple):
+    """페이지 조회 결과"""
+    items: List[Any]
+    total: Optional[int]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값을 URL에 안전한 불투명 문자열로 변환"""
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values],
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order: Sequence[SortKey]) -> List[Any]:
+    """cursor를 정렬 컬럼 타입에 맞는 값 목록으로 복원 (형식 오류 시 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("유효하지 않은 cursor입니다.")
+    
+    if not isinstance(values, list) or len(values) != len(order):
+        raise ValueError("유효하지 않은 cursor입니다.")
+    
+    decoded = []
+    for value, (column, _) in zip(values, order):
+        if value is None:
+            decoded.append(None)
+            continue
+        python_type = column.type.python_type
+        try:
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is date:
+                value = date.fromisoformat(value)
+            elif not isinstance(value, python_type):
+                raise TypeError
+        except (TypeError, ValueError):
+            raise ValueError("유효하지 않은 cursor입니다.")
+        decoded.append(value)
+    return decoded
+
+
+def _is_nullable(column) -> bool:
+    return getattr(column.expression, "nullable", True)
+
+
+def keyset_filter(order: Sequence[SortKey], values: Sequence[Any]):
+    """
+    정렬 순서상 cursor 다음에 오는 행 조건
+    
+    정렬 방향이 모두 같으면 행 비교 (a, b, id) < (:a, :b, :id)로 만들어
+    같은 순서의 복합 인덱스를 그대로 이어서 스캔할 수 있게 합니다.
+    그 외(방향 혼합, NULL 값)에는 PostgreSQL의 NULL 정렬 규칙
+    (ASC: NULLS LAST, DESC: NULLS FIRST)에 맞춰 조건을 풀어서 생성합니다.
+    """
+    # bool 등 파이썬 값과 직접 대소 비교가 되지 않는 타입을 위해 컬럼 타입으로 바인딩
+    bound = [
+        None if value is None else literal(value, type_=column.type)
+        for (column, _), value in zip(order, values)
+    ]
+    
+    directions = {descending for _, descending in order}
+    if len(directions) == 1 and None not in values:
+        descending = directions.pop()
+        # DESC에서는 NULL이 앞쪽이라 행 비교의 NULL 제외 동작이 그대로 맞음
+        if descending or not any(_is_nullable(column) for column, _ in order):
+            columns = tuple_(*(column for column, _ in order))
+            row = tuple_(*bound)
+            return columns < row if descending else columns > row
+    
+    conditions = []
+    equal_prefix = []
+    for (column, descending), value in zip(order, bound):
+        if value is None:
+            # NULL 그룹 다음: DESC는 NULL이 아닌 값 전체, ASC는 (NULLS LAST이므로) 없음
+            after = column.isnot(None) if descending else false()
+            equal = column.is_(None)
+        else:
+            after = column < value if descending else column > value
+            if not descending and _is_nullable(column):
+                after = or_(after, column.is_(None))
+            equal = column == value
+        conditions.append(and_(*equal_prefix, after))
+        equal_prefix.append(equal)
+    return or_(*conditions)
+
+
+def order_clauses(order: Sequence[SortKey]) -> list:
+    return [column.desc() if descending else column.asc() for column, descending in order]
+
+
+async def count_rows(db: AsyncSession, query: Select, mode: str = "exact") -> Optional[int]:
+    """
+    조회 조건에 해당하는 전체 개수
+    
+    - exact: COUNT(*) 실행
+    - estimate: EXPLAIN의 예상 행 수 (통계 기반 근사치, 작은 결과는 exact로 보정)
+    - none: 개수 생략 (None)
+    """
+    if mode == "none":
+        return None
+    
+    if mode == "estimate":
+        estimated = await estimate_rows(db, query)
+        if estimated is not None and estimated > ESTIMATE_EXACT_THRESHOLD:
+            return estimated
+    return await db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+
+
+async def estimate_rows(db: AsyncSession, query: Select) -> Optional[int]:
+    """
+    PostgreSQL 실행 계획의 예상 행 수 (실패 시 None)
+    
+    EXPLAIN은 요청의 트랜잭션 안에서 SAVEPOINT로 실행하므로, 실패해도 SAVEPOINT까지만
+    롤백되고 이어지는 COUNT(*) 등 같은 세션의 쿼리는 정상 실행됩니다.
+    """
+    try:
+        compiled = query.order_by(None).compile(
+            dialect=db.get_bind().dialect,
+            compile_kwargs={"literal_binds": True}
+        )
+    except (CompileError, NotImplementedError) as e:
+        # 리터럴로 렌더링할 수 없는 파라미터 등 (실행 전 실패)
+        logger.warning(f"⚠️ 예상 행 수 쿼리 생성 실패 (정확한 COUNT 사용): {e}")
+        return None
+    
+    try:
+        async with db.begin_nested():
+            connection = await db.connection()
+            result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+            plan = result.scalar()
+    except DBAPIError as e:
+        logger.warning(f"⚠️ 예상 행 수 조회 실패 (정확한 COUNT 사용): {str(e).splitlines()[0]}")
+        return None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    order: Sequence[SortKey],
+    limit: int,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+    count: str = "exact"
+) -> KeysetPage:
+    """
+    정렬 키 기준 페이지 조회
+    
+    cursor가 있으면 cursor 다음 행부터(keyset), 없으면 skip 만큼 건너뛰고(offset) 조회합니다.
+    두 방식 모두 다음 페이지가 있으면 next_cursor를 반환하므로
+    첫 페이지 이후에는 cursor로 이어서 조회할 수 있습니다.
+    전체 개수는 cursor 조건 적용 전 기준입니다.
+    """
+    if count not in COUNT_MODES:
+        raise ValueError(f"count는 {', '.join(COUNT_MODES)} 중 하나여야 합니다.")
+    if cursor and skip:
+        raise ValueError("cursor와 skip은 함께 사용할 수 없습니다.")
+    
+    total = await count_rows(db, query, count)
+    
+    page_query = query.order_by(*order_clauses(order))
+    if cursor:
+        page_query = page_query.filter(keyset_filter(order, decode_cursor(cursor, order)))
+    elif skip:
+        page_query = page_query.offset(skip)
+    
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    items = list((await db.scalars(page_query.limit(limit + 1))).all())
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column, _ in order])
+    
+    return KeysetPage(items=items, total=total, next_cursor=next_cursor)
@@ -0,0 +1,152 @@
+"""
+Shared Password Hashing for TS Portal Services
+
+비밀번호를 scrypt(hashlib 표준 라이브러리, 솔트 + 메모리 비용)로 해싱합니다.
+
+- 저장 형식: scrypt$<n>$<r>$<p>$<솔트(base64)>$<해시(base64)> (비용 파라미터를 해시에 함께 저장)
+- 비용: PASSWORD_SCRYPT_N / _R / _P 환경 변수로 조정, 바꾸면 기존 해시는 다음 로그인 때 새 비용으로 재해싱
+- 기존 해시(솔트 없는 SHA-256 hex)도 검증하고, 로그인 성공 시 scrypt 해시로 재해싱 (verify_and_update)
+- 해싱/검증은 CPU를 오래 쓰므로 async 코드에서는 *_async 함수로 제한된 크기의 스레드/프로세스 풀에서 실행
+  (이벤트 루프를 막지 않음, 동시 해싱 수는 PASSWORD_HASH_WORKERS로 제한)
+
+사용 예:
+    # AuthService.authenticate_user()
+    verified, new_hash = await verify_and_update(password, row.password_hash)
+    if verified and new_hash:
+        ...  # password_hash = new_hash 저장
+    
+    # main.py shutdown
+    shutdown_password_pool()
+"""
+
+import os
+import hmac
+import base64
+import asyncio
+import hashlib
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# scrypt 비용 (N: CPU/메모리 비용, 2의 거듭제곱 / r: 블록 크기 / p: 병렬화)
+# 기본값 N=2^14, r=8: 해시 1회 약 16MB 메모리
+PASSWORD_SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", str(2 ** 14)))
+PASSWORD_SCRYPT_R = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+PASSWORD_SCRYPT_P = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+
+# 해싱 풀 종류 (thread: hashlib.scrypt는 계산 중 GIL을 놓으므로 기본 / process: 별도 프로세스)
+PASSWORD_HASH_POOL = os.getenv("PASSWORD_HASH_POOL", "thread").lower()
+
+# 동시에 실행할 최대 해싱 수 (기본: CPU 코어 수) - 초과한 요청은 풀 대기열에서 기다림
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+
+SCHEME = "scrypt"
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+_executor: Optional[Executor] = None
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    # 메모리 한도는 128 * r * N 바이트 + 여유 (OpenSSL 기본 한도 32MB를 넘는 비용도 허용)
+    return hashlib.scrypt(
+        password.encode(), salt=salt, n=n, r=r, p=p,
+        maxmem=128 * r * n * 2 + 1024 * 1024, dklen=HASH_BYTES
+    )
+
+
+def _is_legacy(password_hash: str) -> bool:
+    """기존 형식 (솔트 없는 SHA-256 hex)"""
+    return len(password_hash) == 64 and all(c in "0123456789abcdef" for c in password_hash.lower())
+
+
+def hash_password(password: str) -> str:
+    """비밀번호 해싱 (현재 비용, 새 솔트)"""
+    salt = os.urandom(SALT_BYTES)
+    digest = _scrypt(password, salt, PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P)
+    return f"{SCHEME}${PASSWORD_SCRYPT_N}${PASSWORD_SCRYPT_R}${PASSWORD_SCRYPT_P}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def verify_password(password: str, password_hash: Optional[str]) -> bool:
+    """비밀번호 검증 (scrypt 해시와 기존 SHA-256 해시 모두, 상수 시간 비교)"""
+    if not password_hash:
+        return False
+    if _is_legacy(password_hash):
+        return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), password_hash.lower())
+    
+    try:
+        scheme, n, r, p, salt, digest = password_hash.split("$")
+        if scheme != SCHEME:
+            return False
+        expected = _b64decode(digest)
+        return hmac.compare_digest(_scrypt(password, _b64decode(salt), int(n), int(r), int(p)), expected)
+    except ValueError:
+        logger.warning("⚠️ 알 수 없는 비밀번호 해시 형식")
+        return False
+
+
+def needs_rehash(password_hash: Optional[str]) -> bool:
+    """현재 형식/비용과 다른 해시인지 (기존 SHA-256 해시, 비용이 바뀐 scrypt 해시)"""
+    if not password_hash or _is_legacy(password_hash):
+        return True
+    parts = password_hash.split("$")
+    return len(parts) != 6 or parts[:4] != [SCHEME, str(PASSWORD_SCRYPT_N), str(PASSWORD_SCRYPT_R), str(PASSWORD_SCRYPT_P)]
+
+
+def _verify_and_update(password: str, password_hash: Optional[str]) -> Tuple[bool, Optional[str]]:
+    if not verify_password(password, password_hash):
+        return False, None
+    return True, hash_password(password) if needs_rehash(password_hash) else None
+
+
+def get_password_pool() -> Executor:
+    """해싱 풀 (처음 사용할 때 생성)"""
+    global _executor
+    if _executor is None:
+        if PASSWORD_HASH_POOL == "process":
+            _executor = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS)
+        else:
+            _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+        logger.info(
+            f"🔑 비밀번호 해싱 풀: {PASSWORD_HASH_POOL} x {PASSWORD_HASH_WORKERS} "
+            f"(scrypt N={PASSWORD_SCRYPT_N}, r={PASSWORD_SCRYPT_R}, p={PASSWORD_SCRYPT_P})"
+        )
+    return _executor
+
+
+def shutdown_password_pool():
+    """해싱 풀 종료"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (해싱 풀에서 실행)"""
+    return await asyncio.get_running_loop().run_in_executor(get_password_pool(), hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: Optional[str]) -> bool:
+    """비밀번호 검증 (해싱 풀에서 실행)"""
+    return await asyncio.get_running_loop().run_in_executor(get_password_pool(), verify_password, password, password_hash)
+
+
+async def verify_and_update(password: str, password_hash: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 후 재해싱이 필요하면 새 해시도 함께 계산 (해싱 풀 작업 한 번)
+    
+    Returns:
+        (검증 성공 여부, 저장할 새 해시 또는 None)
+    """
+    return await asyncio.get_running_loop().run_in_executor(get_password_pool(), _verify_and_update, password, password_hash)
@@ -0,0 +1,127 @@
+"""
+Shared Text Search for TS Portal Services
+
+여러 컬럼에 대한 부분 일치 검색(ILIKE '%검색어%')을 pg_trgm GIN 인덱스로 처리하고
+(db/init/05_search_indexes.sql), 검색어와의 유사도(word_similarity)로 순위를 매깁니다.
+
+- 형태소 분석 없이 부분 문자열로 일치하므로 한국어 조사가 붙은 단어도 검색됨 ("공지사항을" ⊃ "공지")
+- 3글자 이상 검색어: 부분 일치 또는 단어 유사도 연산자(컬럼 %> 검색어, pg_trgm.word_similarity_threshold 이상)로
+  GIN 인덱스에서 후보를 찾고, 일치한 행 전체를 유사도 순으로 정렬해 LIMIT (최신순으로 먼저 자르지 않음)
+- 3글자 미만 검색어(한국어 2음절 단어 등): LIKE 패턴에서 트라이그램을 만들 수 없어 인덱스 없이
+  부분 일치로 찾되, 순위는 같은 방식으로 계산 (단어 앞 공백을 포함한 트라이그램이라 단어 시작 일치가 앞에 옴)
+- pg_trgm이 없으면 순위 없이 기본 정렬 순서로 조회
+- 결과 개수는 SEARCH_MAX_RESULTS를 넘지 않음
+"""
+
+import os
+import logging
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, String, func, literal, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from .pagination import SortKey, order_clauses
+
+logger = logging.getLogger(__name__)
+
+# 검색 결과 최대 개수
+SEARCH_DEFAULT_LIMIT = int(os.getenv("SEARCH_DEFAULT_LIMIT", "20"))
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "100"))
+
+# pg_trgm이 LIKE 패턴에서 인덱스 검색용 트라이그램을 추출할 수 있는 최소 길이
+TRGM_MIN_LENGTH = 3
+
+# (검색 컬럼, 순위 가중치)
+WeightedColumn = Tuple[Any, float]
+
+# pg_trgm 설치 여부 (프로세스당 최초 검색 시 한 번 확인)
+_trgm_available: Optional[bool] = None
+
+
+def escape_like(term: str) -> str:
+    """LIKE 패턴 특수문자(%, _, \\)를 일반 문자로 처리"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def ilike_any(term: str, columns: Sequence[Any]):
+    """
+    컬럼 중 하나라도 검색어를 포함하는 조건 (대소문자 무시)
+    
+    패턴은 바인드 파라미터 대신 SQL에 값으로 렌더링합니다. 재사용되는 prepared statement가
+    일반 계획(generic plan)으로 바뀌면 플래너가 패턴의 트라이그램을 보지 못해
+    드문 검색어에도 인덱스를 쓰지 않는 계획이 선택될 수 있기 때문입니다.
+    """
+    pattern = literal(f"%{escape_like(term)}%", String, literal_execute=True)
+    return or_(*(column.ilike(pattern, escape="\\") for column in columns))
+
+
+def word_similar_any(term: str, columns: Sequence[Any]):
+    """
+    컬럼 중 하나라도 검색어와 비슷한 단어를 포함하는 조건 (pg_trgm %> 연산자, GIN 인덱스 사용)
+    
+    검색어는 ilike_any와 같은 이유로 SQL에 값으로 렌더링합니다.
+    """
+    value = literal(term, String, literal_execute=True)
+    return or_(*(column.op("%>")(value) for column in columns))
+
+
+def relevance(term: str, weighted_columns: Sequence[WeightedColumn]):
+    """컬럼별 word_similarity × 가중치 중 최댓값 (NULL 컬럼은 제외)"""
+    scores = [
+        func.word_similarity(term, column, type_=Float) * weight
+        for column, weight in weighted_columns
+    ]
+    return scores[0] if len(scores) == 1 else func.greatest(*scores)
+
+
+async def is_trgm_available(db: AsyncSession) -> bool:
+    """pg_trgm 확장 설치 여부 (미설치 시 순위 없이 ILIKE 검색만 수행)"""
+    global _trgm_available
+    if _trgm_available is None:
+        _trgm_available = bool(await db.scalar(
+            text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+        ))
+        if not _trgm_available:
+            logger.warning("⚠️ pg_trgm 확장이 없어 검색 결과 순위를 사용하지 않습니다. (db/init/05_search_indexes.sql 적용 필요)")
+    return _trgm_available
+
+
+async def search(
+    db: AsyncSession,
+    query: Select,
+    term: str,
+    weighted_columns: Sequence[WeightedColumn],
+    order: Sequence[SortKey],
+    limit: int = SEARCH_DEFAULT_LIMIT
+) -> List[Any]:
+    """
+    부분 일치 검색 후 관련도 순 조회
+    
+    Args:
+        query: 단일 엔티티 조회 쿼리 (검색 외 필터 포함)
+        term: 검색어
+        weighted_columns: 검색 컬럼과 순위 가중치
+        order: 동일 관련도(또는 pg_trgm이 없을 때)의 정렬 기준
+        limit: 최대 결과 수 (SEARCH_MAX_RESULTS 이하로 제한)
+    """
+    term = term.strip()
+    if not term:
+        raise ValueError("검색어를 입력해 주세요.")
+    
+    limit = min(limit, SEARCH_MAX_RESULTS)
+    columns = [column for column, _ in weighted_columns]
+    
+    if not await is_trgm_available(db):
+        query = query.filter(ilike_any(term, columns))
+        return list((await db.scalars(query.order_by(*order_clauses(order)).limit(limit))).all())
+    
+    if len(term) < TRGM_MIN_LENGTH:
+        # 짧은 검색어: 부분 일치만 (인덱스 미사용) - 단어 유사도는 트라이그램이 적어 엉뚱한 행이 섞임
+        query = query.filter(ilike_any(term, columns))
+    else:
+        # 부분 일치 + 비슷한 단어 (둘 다 GIN 인덱스로 찾음)
+        query = query.filter(or_(ilike_any(term, columns), word_similar_any(term, columns)))
+    
+    ranked = query.order_by(relevance(term, weighted_columns).desc(), *order_clauses(order))
+    return list((await db.scalars(ranked.limit(limit))).all())